@@ -6,12 +6,14 @@ Testing the Telegram Bot AI token creation flow and button handlers
 
 import asyncio
 import json
-import subprocess
 import time
 import os
 import sys
 from pathlib import Path
 
+from verification.corpus import read_source
+from verification.syntax import check_syntax
+
 class AIButtonIntegrationTester:
     def __init__(self):
         self.test_results = []
@@ -40,18 +42,16 @@ class AIButtonIntegrationTester:
     def search_in_file(self, filepath, pattern):
         """Search for pattern in file"""
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                content = f.read()
-                return pattern in content
+            content = read_source(filepath)
+            return pattern in content
         except Exception as e:
             return False
     
     def count_occurrences(self, filepath, pattern):
         """Count occurrences of pattern in file"""
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                content = f.read()
-                return content.count(pattern)
+            content = read_source(filepath)
+            return content.count(pattern)
         except Exception as e:
             return 0
     
@@ -251,17 +251,12 @@ class AIButtonIntegrationTester:
         
         try:
             # Use Node.js to check syntax
-            result = subprocess.run(
-                ["node", "-c", self.bot_file],
-                capture_output=True,
-                text=True,
-                cwd=self.telegram_bot_path
-            )
+            result = check_syntax(self.bot_file)
             
-            if result.returncode == 0:
+            if result.ok:
                 self.log_test("Bot.js syntax validation", "PASS", "No syntax errors")
             else:
-                self.log_test("Bot.js syntax validation", "FAIL", f"Syntax errors: {result.stderr}")
+                self.log_test("Bot.js syntax validation", "FAIL", f"Syntax errors: {result.error}")
         except Exception as e:
             self.log_test("Bot.js syntax validation", "FAIL", f"Could not validate: {str(e)}")
     
@@ -11,6 +11,8 @@ import time
 import subprocess
 from pathlib import Path
 
+from verification.corpus import read_source
+
 # Add the project root to Python path
 project_root = Path(__file__).parent
 sys.path.append(str(project_root))
@@ -43,8 +45,7 @@ class AirdropTester:
         
         try:
             bot_js_path = self.telegram_bot_dir / "bot.js"
-            with open(bot_js_path, 'r') as f:
-                bot_content = f.read()
+            bot_content = read_source(bot_js_path)
             
             # Check for airdrop functionality
             airdrop_checks = {
@@ -83,8 +84,7 @@ class AirdropTester:
         
         try:
             wallet_manager_path = self.telegram_bot_dir / "wallet-manager-enhanced.js"
-            with open(wallet_manager_path, 'r') as f:
-                wallet_content = f.read()
+            wallet_content = read_source(wallet_manager_path)
             
             # Check for real airdrop implementation
             airdrop_method_checks = {
@@ -175,8 +175,7 @@ class AirdropTester:
         
         try:
             bot_js_path = self.telegram_bot_dir / "bot.js"
-            with open(bot_js_path, 'r') as f:
-                bot_content = f.read()
+            bot_content = read_source(bot_js_path)
             
             # Check for complete UI flow
             ui_flow_checks = {
@@ -220,8 +219,7 @@ class AirdropTester:
         
         try:
             wallet_manager_path = self.telegram_bot_dir / "wallet-manager-enhanced.js"
-            with open(wallet_manager_path, 'r') as f:
-                wallet_content = f.read()
+            wallet_content = read_source(wallet_manager_path)
             
             # Check for rate limiting handling
             rate_limit_checks = {
@@ -0,0 +1,101 @@
+"""Executor layer for CPU-bound work.
+
+``run_cpu(fn, *args)`` runs a function away from the event loop. CPU_EXECUTOR
+selects where:
+
+- ``process`` (default): a shared process pool. Nothing the function does can
+  hold the event loop's GIL.
+- ``thread``: a thread pool. Use it for code that releases the GIL, or where
+  child processes are unavailable.
+- ``inline``: directly on the event loop. Use it for debugging and profiling.
+
+In process mode the function and its arguments are pickled. Pass module-level
+functions and compact payloads, such as raw BSON batches, joined byte strings
+or NumPy arrays, rather than lists of dicts or models.
+"""
+import os
+import signal
+import asyncio
+import logging
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from enum import Enum
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class ExecutorMode(str, Enum):
+    process = "process"
+    thread = "thread"
+    inline = "inline"
+
+
+def _init_worker():
+    # Ctrl-C reaches the whole process group; let the parent decide how to shut down
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+
+class CPUExecutor:
+    def __init__(self, mode: ExecutorMode, workers: int):
+        self.mode = mode
+        self.workers = workers
+        self._pool: Optional[Executor] = None
+        self.stats = {"calls": 0, "restarts": 0}
+
+    def configure(self, mode: ExecutorMode, workers: Optional[int] = None):
+        """Switch mode (benchmarks, tests); the current pool is shut down"""
+        self.shutdown(wait=True)
+        self.mode = mode
+        self.workers = workers or self.workers
+
+    def _executor(self) -> Executor:
+        # Created on first use so importing the app does not start processes
+        if self._pool is None:
+            if self.mode is ExecutorMode.process:
+                # Never fork: the parent runs the event loop and driver threads
+                methods = multiprocessing.get_all_start_methods()
+                context = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+                self._pool = ProcessPoolExecutor(self.workers, mp_context=context, initializer=_init_worker)
+            else:
+                self._pool = ThreadPoolExecutor(self.workers, thread_name_prefix="cpu")
+        return self._pool
+
+    async def run(self, fn: Callable[..., Any], *args) -> Any:
+        self.stats["calls"] += 1
+        if self.mode is ExecutorMode.inline:
+            return fn(*args)
+        executor = self._executor()
+        try:
+            return await asyncio.get_running_loop().run_in_executor(executor, fn, *args)
+        except BrokenProcessPool:
+            # A worker died (OOM kill, segfault); start a fresh pool for the next call
+            logger.error("CPU process pool broke while running %s; restarting it", getattr(fn, "__name__", fn))
+            if self._pool is executor:
+                self._pool = None
+                self.stats["restarts"] += 1
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+
+    def shutdown(self, wait: bool = False):
+        """Drop queued calls and stop the pool; wait=True also joins its workers.
+
+        Wait when the process is about to exit: a process pool still tearing down
+        races the interpreter's own exit hook for its pipes (EBADF tracebacks).
+        """
+        if self._pool is not None:
+            self._pool.shutdown(wait=wait, cancel_futures=True)
+            self._pool = None
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {**self.stats, "mode": self.mode.value, "workers": self.workers, "started": self._pool is not None}
+
+
+cpu_executor = CPUExecutor(
+    ExecutorMode(os.environ.get('CPU_EXECUTOR', ExecutorMode.process.value)),
+    int(os.environ.get('CPU_WORKERS', str(min(4, os.cpu_count() or 1)))),
+)
+
+async def run_cpu(fn: Callable[..., Any], *args) -> Any:
+    return await cpu_executor.run(fn, *args)
@@ -0,0 +1,210 @@
+"""In-process background jobs for work too slow to do inside a request.
+
+A job is submitted with a kind and validated parameters, persisted to the
+``jobs`` collection and queued. A fixed number of asyncio workers pull from a
+bounded queue and run the kind's handler; handlers push CPU-bound steps onto the
+shared CPU executor (executors.py) so the event loop stays responsive. Status,
+result or error are written back to the job document, which a TTL index on
+``expires_at`` removes ``result_ttl`` seconds after the job finishes.
+
+Jobs belong to the process that accepted them: anything still queued or running
+when the process stops is marked failed so pollers are not left waiting.
+"""
+import time
+import asyncio
+import logging
+import uuid
+from datetime import datetime, timedelta
+from enum import Enum
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple, Type
+
+from pydantic import BaseModel
+from pymongo import ASCENDING, IndexModel
+
+logger = logging.getLogger(__name__)
+
+JOB_INDEXES = [
+    IndexModel([("expires_at", ASCENDING)], name="expires_at_ttl", expireAfterSeconds=0),
+]
+
+
+class JobStatus(str, Enum):
+    queued = "queued"
+    running = "running"
+    succeeded = "succeeded"
+    failed = "failed"
+
+class Job(BaseModel):
+    id: str
+    kind: str
+    status: JobStatus
+    params: Dict[str, Any] = {}
+    result: Optional[Any] = None
+    error: Optional[str] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    duration_ms: Optional[float] = None
+    expires_at: datetime
+
+
+class JobQueueFull(Exception):
+    """The queue is at capacity or the manager is shutting down"""
+
+
+JobHandler = Callable[[str, BaseModel], Awaitable[Any]]
+
+
+class JobManager:
+    def __init__(self, collection: Callable[[], Any], workers: int = 2, queue_size: int = 100,
+                 result_ttl: float = 3600, timeout: float = 300):
+        self._collection = collection
+        self.workers = workers
+        self.queue_size = queue_size
+        self.result_ttl = result_ttl
+        self.timeout = timeout
+        self._handlers: Dict[str, Tuple[Type[BaseModel], JobHandler]] = {}
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker_tasks: List[asyncio.Task] = []
+        self._running: Set[str] = set()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self.accepting = False
+        self.stats = {"submitted": 0, "rejected": 0, "succeeded": 0, "failed": 0}
+
+    def handler(self, kind: str, params: Type[BaseModel]):
+        """Register the coroutine that runs jobs of `kind`; it receives (job_id, params)"""
+        def register(fn: JobHandler) -> JobHandler:
+            self._handlers[kind] = (params, fn)
+            return fn
+        return register
+
+    def params_model(self, kind: str) -> Type[BaseModel]:
+        return self._handlers[kind][0]
+
+    async def ensure_indexes(self):
+        await self._collection().create_indexes(JOB_INDEXES)
+
+    async def start(self):
+        """Start the workers; indexes are created separately (ensure_indexes) so an unreachable database does not block startup"""
+        self._queue = asyncio.Queue(self.queue_size)
+        self._worker_tasks = [
+            asyncio.create_task(self._worker(), name=f"job-worker-{i}") for i in range(self.workers)
+        ]
+        self.accepting = True
+
+    async def submit(self, kind: str, params: BaseModel) -> Job:
+        if not self.accepting or self._queue.full():
+            self.stats["rejected"] += 1
+            raise JobQueueFull(f"{self._queue.qsize() if self._queue else 0} jobs queued")
+        now = datetime.utcnow()
+        job = Job(
+            id=str(uuid.uuid4()),
+            kind=kind,
+            status=JobStatus.queued,
+            params=params.model_dump(mode="json"),
+            created_at=now,
+            expires_at=now + timedelta(seconds=self.timeout + self.result_ttl),
+        )
+        await self._collection().insert_one({"_id": job.id, **job.model_dump()})
+        # Re-check: the queue may have filled while the insert was in flight
+        try:
+            self._queue.put_nowait((job.id, kind, params))
+        except asyncio.QueueFull:
+            await self._collection().delete_many({"_id": job.id})
+            self.stats["rejected"] += 1
+            raise JobQueueFull(f"{self._queue.qsize()} jobs queued") from None
+        self.stats["submitted"] += 1
+        return job
+
+    async def get(self, job_id: str) -> Optional[Job]:
+        doc = await self._collection().find_one({"_id": job_id})
+        return Job(**doc) if doc else None
+
+    async def _worker(self):
+        while True:
+            job_id, kind, params = await self._queue.get()
+            self._running.add(job_id)
+            self._idle.clear()
+            try:
+                await self._execute(job_id, kind, params)
+            except Exception as e:
+                # e.g. the database is unreachable: fail this job, keep the worker
+                logger.exception("Job %s (%s) could not be run", job_id, kind)
+                await self._fail(job_id, f"{type(e).__name__}: {e}")
+            finally:
+                self._running.discard(job_id)
+                if not self._running:
+                    self._idle.set()
+                self._queue.task_done()
+
+    async def _execute(self, job_id: str, kind: str, params: BaseModel):
+        started = time.perf_counter()
+        await self._collection().update_one(
+            {"_id": job_id}, {"$set": {"status": JobStatus.running.value, "started_at": datetime.utcnow()}},
+        )
+        try:
+            result = await asyncio.wait_for(self._handlers[kind][1](job_id, params), self.timeout)
+        except asyncio.TimeoutError:
+            await self._fail(job_id, f"timed out after {self.timeout:g} s", started)
+        except asyncio.CancelledError:
+            await asyncio.shield(self._fail(job_id, "interrupted by shutdown", started))
+            raise
+        except Exception as e:
+            logger.exception("Job %s (%s) failed", job_id, kind)
+            await self._fail(job_id, f"{type(e).__name__}: {e}", started)
+        else:
+            if isinstance(result, BaseModel):
+                result = result.model_dump(mode="json")
+            await self._finish(job_id, JobStatus.succeeded, started, result=result)
+
+    async def _finish(self, job_id: str, status: JobStatus, started: Optional[float] = None,
+                      result: Any = None, error: Optional[str] = None):
+        now = datetime.utcnow()
+        update = {
+            "status": status.value,
+            "result": result,
+            "error": error,
+            "finished_at": now,
+            "expires_at": now + timedelta(seconds=self.result_ttl),
+        }
+        if started is not None:
+            update["duration_ms"] = round((time.perf_counter() - started) * 1000, 1)
+        await self._collection().update_one({"_id": job_id}, {"$set": update})
+        self.stats["succeeded" if status is JobStatus.succeeded else "failed"] += 1
+
+    async def _fail(self, job_id: str, error: str, started: Optional[float] = None):
+        """Best-effort: mark the job failed, logging instead of raising if that cannot be written"""
+        try:
+            await self._finish(job_id, JobStatus.failed, started, error=error)
+        except Exception:
+            logger.exception("Could not mark job %s failed (%s)", job_id, error)
+
+    async def stop(self, timeout: float) -> bool:
+        """Stop taking jobs, give running ones up to `timeout` seconds, fail the rest"""
+        self.accepting = False
+        if self._queue is None:
+            return True
+        try:
+            await asyncio.wait_for(self._idle.wait(), timeout)
+            finished = True
+        except asyncio.TimeoutError:
+            finished = False
+        for task in self._worker_tasks:
+            task.cancel()
+        await asyncio.gather(*self._worker_tasks, return_exceptions=True)
+        while not self._queue.empty():
+            job_id, _, _ = self._queue.get_nowait()
+            await self._fail(job_id, "interrupted by shutdown")
+        self._worker_tasks = []
+        self._queue = None
+        return finished
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "queued": self._queue.qsize() if self._queue else 0,
+            "running": len(self._running),
+            "workers": self.workers,
+            "queue_size": self.queue_size,
+        }
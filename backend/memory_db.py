@@ -0,0 +1,293 @@
+"""In-memory storage engine exposing the subset of the Motor API the backend uses.
+
+Selected with ``STORAGE_ENGINE=memory``; meant for tests, local tooling and
+benchmarks that should not need a running MongoDB. Supports equality and
+``$gt/$gte/$lt/$lte/$ne/$in`` filters, inclusion/exclusion projections,
+single-key sorts, ``$set`` updates, ``_id`` uniqueness and TTL indexes (applied
+on read). Write concerns are accepted and ignored; stored values are normalised
+as a BSON round-trip would.
+"""
+import copy
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional
+
+import bson
+from bson import ObjectId
+from pymongo.errors import BulkWriteError, DuplicateKeyError
+from pymongo.results import DeleteResult, InsertManyResult, InsertOneResult, UpdateResult
+
+_MISSING = object()
+
+_OPERATORS = {
+    "$gt": lambda value, operand: value is not _MISSING and value > operand,
+    "$gte": lambda value, operand: value is not _MISSING and value >= operand,
+    "$lt": lambda value, operand: value is not _MISSING and value < operand,
+    "$lte": lambda value, operand: value is not _MISSING and value <= operand,
+    "$ne": lambda value, operand: value != operand,
+    "$in": lambda value, operand: value in operand,
+}
+
+
+_IMMUTABLE = (str, int, float, bool, bytes, type(None), ObjectId)
+
+
+def to_stored(value: Any) -> Any:
+    """Copy a value the way a BSON round-trip would: datetimes become naive UTC with ms precision"""
+    if isinstance(value, _IMMUTABLE):
+        return value
+    if isinstance(value, datetime):
+        if value.tzinfo is not None:
+            value = value.astimezone(timezone.utc).replace(tzinfo=None)
+        return value.replace(microsecond=value.microsecond // 1000 * 1000)
+    if isinstance(value, dict):
+        return {key: to_stored(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [to_stored(item) for item in value]
+    return copy.deepcopy(value)
+
+
+def matches(document: Dict[str, Any], query: Optional[Dict[str, Any]]) -> bool:
+    for field, condition in (query or {}).items():
+        value = document.get(field, _MISSING)
+        if isinstance(condition, dict) and condition and all(key.startswith("$") for key in condition):
+            for operator, operand in condition.items():
+                try:
+                    if not _OPERATORS[operator](value, operand):
+                        return False
+                except KeyError:
+                    raise NotImplementedError(f"memory engine does not support {operator}") from None
+                except TypeError:
+                    return False
+        elif value != condition:
+            return False
+    return True
+
+
+def project(document: Dict[str, Any], projection: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    if not projection:
+        return copy.deepcopy(document)
+    include_id = projection.get("_id", 1)
+    included = [field for field, flag in projection.items() if flag and field != "_id"]
+    if included:
+        fields = (["_id"] if include_id else []) + included
+        return {field: copy.deepcopy(document[field]) for field in fields if field in document}
+    excluded = {field for field, flag in projection.items() if not flag}
+    return {field: copy.deepcopy(value) for field, value in document.items() if field not in excluded}
+
+
+def _sort_key(value: Any):
+    # Missing/None sort first, as in MongoDB
+    return (value is not None and value is not _MISSING, value if value not in (None, _MISSING) else 0)
+
+
+class MemoryCursor:
+    def __init__(self, collection: "MemoryCollection", query, projection):
+        self._collection = collection
+        self._query = query
+        self._projection = projection
+        self._sort: List[tuple] = []
+        self._limit = 0
+        self._batch_size = 0
+
+    def sort(self, key, direction: int = 1):
+        self._sort = list(key) if isinstance(key, list) else [(key, direction)]
+        return self
+
+    def limit(self, count: int):
+        self._limit = count
+        return self
+
+    def batch_size(self, size: int):
+        self._batch_size = size
+        return self
+
+    def _results(self) -> List[Dict[str, Any]]:
+        self._collection._expire()
+        documents = [doc for doc in self._collection._documents.values() if matches(doc, self._query)]
+        for field, direction in reversed(self._sort):
+            documents.sort(key=lambda doc: _sort_key(doc.get(field, _MISSING)), reverse=direction < 0)
+        if self._limit:
+            documents = documents[:self._limit]
+        return [project(doc, self._projection) for doc in documents]
+
+    async def to_list(self, length: Optional[int]) -> List[Dict[str, Any]]:
+        results = self._results()
+        return results if length is None else results[:length]
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for document in self._results():
+            yield document
+
+
+class MemoryRawBatchCursor(MemoryCursor):
+    """find_raw_batches(): each batch arrives as concatenated BSON documents"""
+
+    async def _iterate(self):
+        documents = self._results()
+        size = self._batch_size or 1000
+        for start in range(0, len(documents), size):
+            yield b"".join(bson.encode(document) for document in documents[start:start + size])
+
+
+class MemoryCollection:
+    def __init__(self, database: "MemoryDatabase", name: str, options: Optional[Dict[str, Any]] = None):
+        self.database = database
+        self.name = name
+        self.options = options or {}
+        self._documents: Dict[Any, Dict[str, Any]] = {}
+        self._indexes: Dict[str, Dict[str, Any]] = {"_id_": {"key": [("_id", 1)]}}
+
+    def with_options(self, **kwargs) -> "MemoryCollection":
+        return self
+
+    def _expire(self):
+        """Apply TTL indexes; mongod's TTL monitor does this in the background"""
+        for spec in self._indexes.values():
+            seconds = spec.get("expireAfterSeconds")
+            if seconds is None:
+                continue
+            field = spec["key"][0][0]
+            cutoff = datetime.utcnow() - timedelta(seconds=seconds)
+            expired = [
+                key for key, doc in self._documents.items()
+                if isinstance(doc.get(field), datetime) and doc[field] <= cutoff
+            ]
+            for key in expired:
+                del self._documents[key]
+
+    def _insert(self, document: Dict[str, Any]) -> Any:
+        if "_id" not in document:
+            document["_id"] = ObjectId()
+        if document["_id"] in self._documents:
+            raise DuplicateKeyError(f"E11000 duplicate key error collection: {self.name} dup key: {{ _id: {document['_id']!r} }}")
+        self._documents[document["_id"]] = to_stored(document)
+        return document["_id"]
+
+    async def insert_one(self, document: Dict[str, Any]) -> InsertOneResult:
+        return InsertOneResult(self._insert(document), True)
+
+    async def insert_many(self, documents: Iterable[Dict[str, Any]], ordered: bool = True) -> InsertManyResult:
+        inserted, errors = [], []
+        for index, document in enumerate(documents):
+            try:
+                inserted.append(self._insert(document))
+            except DuplicateKeyError as e:
+                errors.append({"index": index, "code": 11000, "errmsg": str(e)})
+                if ordered:
+                    break
+        if errors:
+            raise BulkWriteError({"writeErrors": errors, "nInserted": len(inserted)})
+        return InsertManyResult(inserted, True)
+
+    def find(self, query: Optional[Dict[str, Any]] = None, projection: Optional[Dict[str, Any]] = None) -> MemoryCursor:
+        return MemoryCursor(self, query, projection)
+
+    def find_raw_batches(self, query: Optional[Dict[str, Any]] = None, projection: Optional[Dict[str, Any]] = None) -> MemoryRawBatchCursor:
+        return MemoryRawBatchCursor(self, query, projection)
+
+    async def find_one(self, query: Optional[Dict[str, Any]] = None, projection: Optional[Dict[str, Any]] = None):
+        results = await self.find(query, projection).limit(1).to_list(1)
+        return results[0] if results else None
+
+    async def update_one(self, query: Dict[str, Any], update: Dict[str, Any], upsert: bool = False) -> UpdateResult:
+        if set(update) - {"$set"}:
+            raise NotImplementedError("memory engine only supports $set updates")
+        for document in self._documents.values():
+            if matches(document, query):
+                document.update(to_stored(update.get("$set", {})))
+                return UpdateResult({"n": 1, "nModified": 1}, True)
+        if upsert:
+            document = {field: value for field, value in query.items() if not isinstance(value, dict)}
+            document.update(update.get("$set", {}))
+            upserted_id = self._insert(document)
+            return UpdateResult({"n": 1, "nModified": 0, "upserted": upserted_id}, True)
+        return UpdateResult({"n": 0, "nModified": 0}, True)
+
+    async def delete_many(self, query: Optional[Dict[str, Any]] = None) -> DeleteResult:
+        doomed = [key for key, doc in self._documents.items() if matches(doc, query)]
+        for key in doomed:
+            del self._documents[key]
+        return DeleteResult({"n": len(doomed)}, True)
+
+    async def count_documents(self, query: Optional[Dict[str, Any]] = None) -> int:
+        self._expire()
+        return sum(1 for doc in self._documents.values() if matches(doc, query))
+
+    async def estimated_document_count(self) -> int:
+        self._expire()
+        return len(self._documents)
+
+    async def create_indexes(self, indexes) -> List[str]:
+        names = []
+        for index in indexes:
+            spec = index.document
+            self._indexes[spec["name"]] = {
+                "key": list(spec["key"].items()),
+                **{k: v for k, v in spec.items() if k not in ("key", "name")},
+            }
+            names.append(spec["name"])
+        return names
+
+    async def create_index(self, keys, **kwargs) -> str:
+        keys = [(keys, 1)] if isinstance(keys, str) else list(keys)
+        name = kwargs.pop("name", "_".join(f"{field}_{direction}" for field, direction in keys))
+        self._indexes[name] = {"key": keys, **kwargs}
+        return name
+
+    async def index_information(self) -> Dict[str, Dict[str, Any]]:
+        return copy.deepcopy(self._indexes)
+
+    async def drop(self):
+        self.database._collections.pop(self.name, None)
+
+
+class MemoryDatabase:
+    def __init__(self, client: "MemoryClient", name: str):
+        self.client = client
+        self.name = name
+        self._collections: Dict[str, MemoryCollection] = {}
+
+    def __getitem__(self, name: str) -> MemoryCollection:
+        if name not in self._collections:
+            self._collections[name] = MemoryCollection(self, name)
+        return self._collections[name]
+
+    def __getattr__(self, name: str) -> MemoryCollection:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return self[name]
+
+    async def command(self, command, **kwargs) -> Dict[str, Any]:
+        name = command if isinstance(command, str) else next(iter(command))
+        if name == "ping":
+            return {"ok": 1.0}
+        if name == "serverStatus":
+            return {"ok": 1.0, "localTime": datetime.utcnow(), "storageEngine": {"name": "memory"}}
+        raise NotImplementedError(f"memory engine does not support command {name!r}")
+
+    async def list_collection_names(self) -> List[str]:
+        return list(self._collections)
+
+    async def create_collection(self, name: str, **options) -> MemoryCollection:
+        collection = self[name]
+        collection.options.update(options)
+        return collection
+
+    async def drop_collection(self, name: str):
+        self._collections.pop(name, None)
+
+
+class MemoryClient:
+    def __init__(self):
+        self._databases: Dict[str, MemoryDatabase] = {}
+
+    def __getitem__(self, name: str) -> MemoryDatabase:
+        if name not in self._databases:
+            self._databases[name] = MemoryDatabase(self, name)
+        return self._databases[name]
+
+    def close(self):
+        pass
@@ -0,0 +1,103 @@
+from pydantic import BaseModel, Field
+from typing import Any, Dict, List, Optional
+from enum import Enum
+import uuid
+from datetime import datetime, timezone
+
+
+# Define Models
+class StatusCheck(BaseModel):
+    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    client_name: str
+    timestamp: datetime = Field(default_factory=datetime.utcnow)
+
+class StatusCheckCreate(BaseModel):
+    client_name: str
+
+class ExportFormat(str, Enum):
+    parquet = "parquet"
+    arrow = "arrow"  # Arrow IPC stream format
+
+    @property
+    def media_type(self) -> str:
+        return {
+            ExportFormat.parquet: "application/vnd.apache.parquet",
+            ExportFormat.arrow: "application/vnd.apache.arrow.stream",
+        }[self]
+
+    @property
+    def extension(self) -> str:
+        return {ExportFormat.parquet: "parquet", ExportFormat.arrow: "arrows"}[self]
+
+class ClientHealth(BaseModel):
+    client_name: str
+    checkins: int
+    first_seen: datetime
+    last_seen: datetime
+    expected_interval_s: Optional[float]
+    mean_interval_s: Optional[float]
+    stddev_interval_s: Optional[float]
+    max_interval_s: Optional[float]
+    missed_intervals: int
+    silence_s: float
+    overdue_ratio: Optional[float]
+    cadence_drift: Optional[float]
+    drifting: bool
+    liveness_score: Optional[float]
+    status: str  # alive | late | quiet | insufficient_data
+
+class HealthReport(BaseModel):
+    generated_at: datetime
+    rows: int
+    tolerance: float
+    summary: Dict[str, int]
+    clients: List[ClientHealth]
+
+class RollupInterval(str, Enum):
+    minute = "minute"
+    hour = "hour"
+    day = "day"
+
+    @property
+    def milliseconds(self) -> int:
+        return {
+            RollupInterval.minute: 60_000,
+            RollupInterval.hour: 3_600_000,
+            RollupInterval.day: 86_400_000,
+        }[self]
+
+class RollupBucket(BaseModel):
+    client_name: str
+    bucket_start: datetime
+    checkins: int
+
+class StatusRollup(BaseModel):
+    interval: RollupInterval
+    rows: int
+    buckets: List[RollupBucket]
+
+
+# Query helpers
+def as_utc_naive(value: Optional[datetime]) -> Optional[datetime]:
+    """Timestamps are stored as naive UTC; normalise aware query parameters to match"""
+    if value is not None and value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+def status_range_query(
+    client_name: Optional[str] = None,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+) -> Dict[str, Any]:
+    """Mongo filter for status checks of one client within [since, until)"""
+    query: Dict[str, Any] = {}
+    if client_name is not None:
+        query["client_name"] = client_name
+    timestamp: Dict[str, datetime] = {}
+    if since is not None:
+        timestamp["$gte"] = as_utc_naive(since)
+    if until is not None:
+        timestamp["$lt"] = as_utc_naive(until)
+    if timestamp:
+        query["timestamp"] = timestamp
+    return query
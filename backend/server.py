@@ -1,39 +1,621 @@
-from fastapi import FastAPI, APIRouter
+from fastapi import FastAPI, APIRouter, HTTPException, Query, Request
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import FileResponse, JSONResponse, Response, StreamingResponse
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
-from motor.motor_asyncio import AsyncIOMotorClient
+from starlette.datastructures import Headers
+from pymongo.write_concern import WriteConcern
+from bson import ObjectId
 import os
+import io
+import base64
+import hmac
+import time
+import asyncio
+import heapq
+import signal
+import threading
+import cProfile
+import pstats
 import logging
+from contextlib import asynccontextmanager, contextmanager
 from pathlib import Path
-from pydantic import BaseModel, Field
-from typing import List
+from urllib.parse import parse_qs
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
+from typing import Any, Awaitable, Callable, Coroutine, Dict, Hashable, List, Optional, Set, Tuple
+from enum import Enum
 import uuid
 from datetime import datetime
+from models import ExportFormat, HealthReport, RollupInterval, StatusCheck, StatusCheckCreate, as_utc_naive, status_range_query
+from jobs import Job, JobManager, JobQueueFull, JobStatus
+from executors import cpu_executor, run_cpu
+from status_layout import make_status_layout
+from status_import import ImportFormat, ImportFormatError, ImportSummary, StatusImporter, multipart_file_chunks
 
 
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
 
-# MongoDB connection
-mongo_url = os.environ['MONGO_URL']
-client = AsyncIOMotorClient(mongo_url)
-db = client[os.environ['DB_NAME']]
+# Database connection
+#
+# Built lazily on first use (normally from the lifespan), so importing this module
+# needs neither MONGO_URL nor a reachable server. STORAGE_ENGINE=memory selects the
+# in-process engine from memory_db for tests and tooling.
+_client = None
+_db = None
+
+def get_db():
+    global _client, _db
+    if _db is None:
+        if os.environ.get('STORAGE_ENGINE', 'mongo') == 'memory':
+            from memory_db import MemoryClient
+            _client = MemoryClient()
+            _db = _client[os.environ.get('DB_NAME', 'memory')]
+        else:
+            from motor.motor_asyncio import AsyncIOMotorClient
+            _client = AsyncIOMotorClient(os.environ['MONGO_URL'])
+            _db = _client[os.environ['DB_NAME']]
+    return _db
+
+def close_db():
+    global _client, _db
+    if _client is not None:
+        _client.close()
+    _client = _db = None
+
+
+# Startup and background work
+startup_metrics: Dict[str, float] = {}
+background_tasks: Set[asyncio.Task] = set()
+
+def start_background_task(coro: Coroutine, name: str) -> asyncio.Task:
+    """Run `coro` for the lifetime of the app; cancelled on shutdown"""
+    task = asyncio.create_task(coro, name=name)
+    background_tasks.add(task)
+    task.add_done_callback(background_tasks.discard)
+    return task
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    started = time.perf_counter()
+    drain_state.reset()
+    # Best effort: with Mongo down the app still starts and /readyz reports it, the prober retries
+    await health_prober.ensure_indexes()
+    await health_prober.probe()
+    await job_manager.start()
+    start_background_task(health_prober.run_lag_monitor(), "event-loop-lag-monitor")
+    start_background_task(health_prober.run_dependency_probes(), "dependency-prober")
+    restore_signal_handlers = install_drain_signal_handlers()
+    startup_metrics["startup_ms"] = round((time.perf_counter() - started) * 1000, 1)
+    logger.info("Startup complete in %.1f ms", startup_metrics["startup_ms"])
+    try:
+        yield
+    finally:
+        await drain_and_close()
+        restore_signal_handlers()
 
 # Create the main app without a prefix
-app = FastAPI()
+app = FastAPI(lifespan=lifespan)
 
 # Create a router with the /api prefix
 api_router = APIRouter(prefix="/api")
 
 
-# Define Models
-class StatusCheck(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
-    client_name: str
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+status_checks_adapter = TypeAdapter(List[StatusCheck])
+
+
+# Write durability
+class Durability(str, Enum):
+    fire_and_forget = "fire_and_forget"  # w=0, no server acknowledgement
+    acknowledged = "acknowledged"        # w=1, primary acknowledged
+    journaled = "journaled"              # w=majority, j=true
+
+WRITE_CONCERNS = {
+    Durability.fire_and_forget: WriteConcern(w=0),
+    Durability.acknowledged: WriteConcern(w=1),
+    Durability.journaled: WriteConcern(w="majority", j=True),
+}
+
+# Default durability per ingestion endpoint; callers may override with ?durability=
+ENDPOINT_DURABILITY = {
+    "create_status_check": Durability(os.environ.get('STATUS_CHECK_DURABILITY', Durability.acknowledged.value)),
+    "import_status_checks": Durability(os.environ.get('STATUS_IMPORT_DURABILITY', Durability.acknowledged.value)),
+}
+
+# Storage layout: single collection, monthly buckets or a time-series collection (see status_layout.py)
+status_layout = make_status_layout(os.environ.get('STATUS_LAYOUT', 'single'), get_db)
+
+def status_collection(durability: Durability = Durability.acknowledged):
+    """Insert target for status checks, routed by the storage layout"""
+    return status_layout.writer(WRITE_CONCERNS[durability])
+
+class RetentionResult(BaseModel):
+    layout: str
+    before: datetime
+    deleted: Optional[int]  # None when whole collections were dropped
+    dropped_collections: List[str]
+
+
+# Incremental sync for pollers
+#
+# The watermark is the Mongo `_id` of the last document a poller has seen, so
+# "newer than the watermark" is a range scan on the default `_id` index. ObjectIds
+# are generated by the inserting driver, so writers racing across processes can
+# commit slightly out of order; pollers that need strict completeness should
+# re-read a small overlap.
+LONG_POLL_MAX_TIMEOUT = float(os.environ.get('LONG_POLL_MAX_TIMEOUT', '30'))
+# Inserts made by other workers are not signalled, so idle long-polls re-query at this interval
+LONG_POLL_RECHECK_INTERVAL = float(os.environ.get('LONG_POLL_RECHECK_INTERVAL', '5'))
+
+class StatusChanges(BaseModel):
+    changes: List[StatusCheck]
+    watermark: str
+    has_more: bool
+
+class InsertNotifier:
+    """Wakes long-polling readers when this process inserts status checks"""
+
+    def __init__(self):
+        self.generation = 0
+        self._event = asyncio.Event()
+
+    def notify(self):
+        self.generation += 1
+        self._event.set()
+        self._event = asyncio.Event()
+
+    async def wait(self, generation: int, timeout: float) -> bool:
+        """Wait for an insert newer than `generation` (read before querying, so none are missed)"""
+        if self.generation != generation:
+            return True
+        try:
+            await asyncio.wait_for(self._event.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+insert_notifier = InsertNotifier()
+
+class WriteGeneration:
+    """Counts status-check writes (inserts, imports, deletes) finished by this process
+
+    Coalesced and cached reads include the current value in their key, so a read
+    issued after a write never joins a flight, or reuses a result, from before it.
+    """
+
+    def __init__(self):
+        self.value = 0
+
+    def advance(self):
+        self.value += 1
+
+status_writes = WriteGeneration()
+
+def encode_watermark(object_id: ObjectId) -> str:
+    return base64.urlsafe_b64encode(object_id.binary).rstrip(b"=").decode()
+
+def decode_watermark(watermark: str) -> ObjectId:
+    try:
+        return ObjectId(base64.urlsafe_b64decode(watermark + "=" * (-len(watermark) % 4)))
+    except Exception as e:
+        raise ValueError(f"invalid watermark: {watermark!r}") from e
+
+
+# Single-flight read coalescing
+#
+# Concurrent identical reads share one in-flight database call and one serialized
+# payload. Keys are tuples whose first element names the endpoint for metrics.
+# Status reads also key on status_writes.value, so they never join a flight that
+# started before this process's latest write (read-your-writes).
+class SingleFlight:
+    def __init__(self):
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+    async def do(self, key: Tuple[Hashable, ...], fn: Callable[[], Awaitable[Any]]) -> Any:
+        stats = self._stats.setdefault(key[0], {"calls": 0, "executions": 0, "coalesced": 0})
+        stats["calls"] += 1
+        task = self._inflight.get(key)
+        if task is None or task.done():
+            stats["executions"] += 1
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._finished(key, t))
+        else:
+            stats["coalesced"] += 1
+        # Shield so a disconnecting caller does not cancel the call for everyone else
+        return await asyncio.shield(task)
+
+    def _finished(self, key, task: asyncio.Task):
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            task.exception()  # mark retrieved even if every waiter went away
+
+    def snapshot(self) -> Dict[str, Dict[str, int]]:
+        in_flight: Dict[str, int] = {}
+        for key in self._inflight:
+            in_flight[key[0]] = in_flight.get(key[0], 0) + 1
+        return {
+            name: {**stats, "in_flight": in_flight.get(name, 0)}
+            for name, stats in self._stats.items()
+        }
+
+read_coalescer = SingleFlight()
+
+class TTLCache:
+    """Small time-bounded cache; expired entries are dropped lazily and on overflow"""
+
+    def __init__(self, ttl: float, max_entries: int = 1024):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return False, None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return False, None
+        return True, value
+
+    def set(self, key: Hashable, value: Any):
+        now = time.monotonic()
+        if len(self._entries) >= self.max_entries:
+            self._entries = {k: e for k, e in self._entries.items() if e[0] > now}
+            if len(self._entries) >= self.max_entries:
+                self._entries.pop(next(iter(self._entries)))
+        self._entries[key] = (now + self.ttl, value)
+
+    def clear(self):
+        self._entries.clear()
+
+
+# Status counts
+COUNT_CACHE_TTL = float(os.environ.get('COUNT_CACHE_TTL', '5'))
+
+class CountMode(str, Enum):
+    estimated = "estimated"  # collection metadata, O(1), no filters
+    exact = "exact"          # count_documents over the indexes
+
+class StatusCount(BaseModel):
+    count: int
+    mode: CountMode
+    cached: bool = False
+
+count_cache = TTLCache(COUNT_CACHE_TTL)
+
+
+# Background jobs
+#
+# Reports, rollups and file exports can run as jobs (see jobs.py): POST /api/jobs
+# returns at once with an id, GET /api/jobs/{id} reports status and the result.
+JOB_WORKERS = int(os.environ.get('JOB_WORKERS', '2'))
+JOB_QUEUE_SIZE = int(os.environ.get('JOB_QUEUE_SIZE', '100'))
+JOB_RESULT_TTL = float(os.environ.get('JOB_RESULT_TTL', '3600'))
+JOB_TIMEOUT = float(os.environ.get('JOB_TIMEOUT', '300'))
+JOB_EXPORT_DIR = Path(os.environ.get('JOB_EXPORT_DIR', ROOT_DIR / 'exports'))
+
+class JobKind(str, Enum):
+    health_report = "health_report"
+    status_rollup = "status_rollup"
+    status_export = "status_export"
+
+class JobSubmission(BaseModel):
+    kind: JobKind
+    params: Dict[str, Any] = {}
+
+class StatusRangeParams(BaseModel):
+    client_name: Optional[str] = None
+    since: Optional[datetime] = None
+    until: Optional[datetime] = None
+
+    def query(self) -> Dict[str, Any]:
+        return status_range_query(self.client_name, self.since, self.until)
+
+class HealthReportParams(StatusRangeParams):
+    tolerance: float = Field(0.5, ge=0)
+    recent_window: int = Field(10, ge=1)
+
+class RollupParams(StatusRangeParams):
+    interval: RollupInterval = RollupInterval.hour
+
+class ExportParams(StatusRangeParams):
+    format: ExportFormat = ExportFormat.parquet
+
+job_manager = JobManager(
+    lambda: get_db().jobs,
+    workers=JOB_WORKERS,
+    queue_size=JOB_QUEUE_SIZE,
+    result_ttl=JOB_RESULT_TTL,
+    timeout=JOB_TIMEOUT,
+)
+
+@job_manager.handler(JobKind.health_report.value, HealthReportParams)
+async def run_health_report_job(job_id: str, params: HealthReportParams) -> HealthReport:
+    from status_analytics import build_health_report, load_checkins
+
+    checkins = await load_checkins(await status_layout.collections(params.since, params.until), params.query())
+    return await run_cpu(
+        build_health_report, checkins, as_utc_naive(params.until), params.tolerance, params.recent_window,
+    )
+
+@job_manager.handler(JobKind.status_rollup.value, RollupParams)
+async def run_rollup_job(job_id: str, params: RollupParams):
+    from status_analytics import build_rollup, load_checkins
+
+    checkins = await load_checkins(await status_layout.collections(params.since, params.until), params.query())
+    return await run_cpu(build_rollup, checkins, params.interval)
+
+def prune_job_exports():
+    """Export files outlive their job document by at most one export's run time"""
+    cutoff = time.time() - JOB_RESULT_TTL - JOB_TIMEOUT
+    for path in JOB_EXPORT_DIR.glob("*"):
+        if path.stat().st_mtime < cutoff:
+            path.unlink(missing_ok=True)
+
+@job_manager.handler(JobKind.status_export.value, ExportParams)
+async def run_export_job(job_id: str, params: ExportParams) -> Dict[str, Any]:
+    from status_export import export_to_file
+
+    JOB_EXPORT_DIR.mkdir(parents=True, exist_ok=True)
+    await asyncio.to_thread(prune_job_exports)
+    path = JOB_EXPORT_DIR / f"{job_id}.{params.format.extension}"
+    collections = await status_layout.collections(params.since, params.until)
+    rows = await export_to_file(collections, params.format, params.query(), path)
+    return {"rows": rows, "bytes": path.stat().st_size, "filename": path.name}
+
+# Health probes
+#
+# /healthz and /readyz only read state maintained by background tasks, so a probe
+# costs the same whether the orchestrator polls once a minute or ten times a second.
+HEALTH_PROBE_INTERVAL = float(os.environ.get('HEALTH_PROBE_INTERVAL', '5'))
+HEALTH_PROBE_TIMEOUT = float(os.environ.get('HEALTH_PROBE_TIMEOUT', '2'))
+EVENT_LOOP_LAG_THRESHOLD_MS = float(os.environ.get('EVENT_LOOP_LAG_THRESHOLD_MS', '250'))
+READY_MAX_INFLIGHT_WRITES = int(os.environ.get('READY_MAX_INFLIGHT_WRITES', '500'))
+
+class InflightCounter:
+    """Counts operations in progress; readiness and shutdown draining watch it"""
+
+    def __init__(self):
+        self.count = 0
+        self._idle = asyncio.Event()
+        self._idle.set()
+
+    @contextmanager
+    def track(self):
+        self.count += 1
+        self._idle.clear()
+        try:
+            yield
+        finally:
+            self.count -= 1
+            if self.count == 0:
+                self._idle.set()
+
+    async def wait_idle(self, timeout: float) -> bool:
+        try:
+            await asyncio.wait_for(self._idle.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+inflight_writes = InflightCounter()
+inflight_requests = InflightCounter()
 
-class StatusCheckCreate(BaseModel):
-    client_name: str
+
+# Graceful shutdown
+#
+# Draining starts on SIGTERM/SIGINT (or, failing that, at lifespan shutdown):
+# /readyz turns 503, new requests are refused with 503 + Connection: close and
+# long-polls return at once. Shutdown then waits, up to SHUTDOWN_DRAIN_TIMEOUT,
+# for in-flight requests, writes and running jobs before stopping background
+# tasks and closing the database client.
+SHUTDOWN_DRAIN_TIMEOUT = float(os.environ.get('SHUTDOWN_DRAIN_TIMEOUT', '25'))
+DRAIN_EXEMPT_PATHS = {"/healthz", "/readyz"}
+
+class DrainState:
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """Accept requests again; each lifespan starts undrained, even after an earlier one in this process"""
+        self.draining = False
+        self.started_at: Optional[float] = None
+        self.metrics: Dict[str, Any] = {}
+
+    def begin(self, reason: str = "shutdown"):
+        if self.draining:
+            return
+        self.draining = True
+        self.started_at = time.perf_counter()
+        self.metrics["reason"] = reason
+        logger.info("Draining (%s): %d requests and %d writes in flight", reason, inflight_requests.count, inflight_writes.count)
+        # Release parked long-polls so they answer now instead of at their timeout
+        insert_notifier.notify()
+
+drain_state = DrainState()
+
+class DrainMiddleware:
+    """Tracks in-flight HTTP requests and refuses new ones once draining has begun"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        if drain_state.draining and scope["path"] not in DRAIN_EXEMPT_PATHS:
+            body = b'{"detail":"Server is shutting down"}'
+            await send({
+                "type": "http.response.start",
+                "status": 503,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode()),
+                    (b"connection", b"close"),
+                    (b"retry-after", b"1"),
+                ],
+            })
+            await send({"type": "http.response.body", "body": body})
+            return
+        with inflight_requests.track():
+            await self.app(scope, receive, send)
+
+def install_drain_signal_handlers() -> Callable[[], None]:
+    """Begin draining as soon as a termination signal arrives; returns an undo function.
+
+    The previous handler keeps working: Python-level handlers are called explicitly,
+    and handlers registered with loop.add_signal_handler (uvicorn) are still
+    dispatched by asyncio through the signal wakeup fd.
+    """
+    if threading.current_thread() is not threading.main_thread():
+        return lambda: None
+    loop = asyncio.get_running_loop()
+    previous_handlers = {}
+
+    def handler(signum, frame):
+        loop.call_soon_threadsafe(drain_state.begin, signal.Signals(signum).name)
+        previous = previous_handlers[signum]
+        if callable(previous):
+            previous(signum, frame)
+        elif previous == signal.SIG_DFL:
+            signal.signal(signum, signal.SIG_DFL)
+            os.kill(os.getpid(), signum)
+
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        previous_handlers[sig] = signal.getsignal(sig)
+        signal.signal(sig, handler)
+
+    def restore():
+        for sig, previous in previous_handlers.items():
+            signal.signal(sig, previous)
+    return restore
+
+async def drain_and_close():
+    drain_state.begin()
+    deadline = time.perf_counter() + SHUTDOWN_DRAIN_TIMEOUT
+    metrics = drain_state.metrics
+
+    phase_started = time.perf_counter()
+    metrics["inflight_requests_at_start"] = inflight_requests.count
+    metrics["requests_drained"] = await inflight_requests.wait_idle(max(0.0, deadline - time.perf_counter()))
+    metrics["requests_wait_ms"] = round((time.perf_counter() - phase_started) * 1000, 1)
+
+    phase_started = time.perf_counter()
+    metrics["inflight_writes_at_start"] = inflight_writes.count
+    metrics["writes_flushed"] = await inflight_writes.wait_idle(max(0.0, deadline - time.perf_counter()))
+    metrics["writes_wait_ms"] = round((time.perf_counter() - phase_started) * 1000, 1)
+
+    phase_started = time.perf_counter()
+    metrics["jobs_running_at_start"] = job_manager.snapshot()["running"]
+    metrics["jobs_finished"] = await job_manager.stop(max(0.0, deadline - time.perf_counter()))
+    metrics["jobs_wait_ms"] = round((time.perf_counter() - phase_started) * 1000, 1)
+
+    phase_started = time.perf_counter()
+    for task in list(background_tasks):
+        task.cancel()
+    await asyncio.gather(*background_tasks, return_exceptions=True)
+    # Requests, writes and jobs are done, so joining the workers is quick; off the loop all the same
+    await asyncio.to_thread(cpu_executor.shutdown, True)
+    metrics["background_stop_ms"] = round((time.perf_counter() - phase_started) * 1000, 1)
+
+    count_cache.clear()
+    close_db()
+    metrics["total_ms"] = round((time.perf_counter() - drain_state.started_at) * 1000, 1)
+    log = logger.info if metrics["requests_drained"] and metrics["writes_flushed"] else logger.warning
+    log(
+        "Drained in %.1f ms (requests %s after %.1f ms, writes %s after %.1f ms)",
+        metrics["total_ms"],
+        "idle" if metrics["requests_drained"] else f"{inflight_requests.count} abandoned", metrics["requests_wait_ms"],
+        "flushed" if metrics["writes_flushed"] else f"{inflight_writes.count} abandoned", metrics["writes_wait_ms"],
+    )
+
+class HealthProber:
+    def __init__(self, interval: float, timeout: float, lag_threshold_ms: float, lag_sample_interval: float = 0.5):
+        self.interval = interval
+        self.timeout = timeout
+        self.lag_threshold_ms = lag_threshold_ms
+        self.lag_sample_interval = lag_sample_interval
+        self.loop_lag_ms = 0.0
+        self.checks: Dict[str, Dict[str, Any]] = {}
+        self.checked_at: Optional[float] = None
+        self.indexes_ensured = False
+
+    async def run_lag_monitor(self):
+        """Event-loop lag = how late a short sleep wakes up"""
+        loop = asyncio.get_running_loop()
+        while True:
+            started = loop.time()
+            await asyncio.sleep(self.lag_sample_interval)
+            self.loop_lag_ms = max(0.0, (loop.time() - started - self.lag_sample_interval) * 1000)
+
+    async def run_dependency_probes(self):
+        while True:
+            await asyncio.sleep(self.interval)
+            await self.probe()
+
+    async def ensure_indexes(self) -> bool:
+        """Create the status and job indexes; failures are logged and retried by the next probe"""
+        try:
+            await asyncio.wait_for(asyncio.gather(status_layout.ensure(), job_manager.ensure_indexes()), self.timeout)
+            self.indexes_ensured = True
+        except Exception as e:
+            self.indexes_ensured = False
+            logger.warning("Could not create indexes (%s: %s); retrying with the dependency probes", type(e).__name__, e)
+        return self.indexes_ensured
+
+    async def probe(self):
+        checks: Dict[str, Dict[str, Any]] = {}
+        started = time.perf_counter()
+        try:
+            await asyncio.wait_for(get_db().command("ping"), self.timeout)
+            checks["mongo"] = {"ok": True, "latency_ms": round((time.perf_counter() - started) * 1000, 2)}
+        except Exception as e:
+            checks["mongo"] = {"ok": False, "error": f"{type(e).__name__}: {e}"}
+
+        if checks["mongo"]["ok"]:
+            if not self.indexes_ensured:
+                await self.ensure_indexes()
+            try:
+                missing = await asyncio.wait_for(status_layout.missing_indexes(), self.timeout)
+                checks["indexes"] = {"ok": not missing, "missing": missing}
+            except Exception as e:
+                checks["indexes"] = {"ok": False, "error": f"{type(e).__name__}: {e}"}
+        else:
+            checks["indexes"] = {"ok": False, "error": "mongo unreachable"}
+
+        self.checks = checks
+        self.checked_at = time.monotonic()
+
+    def liveness(self) -> Tuple[bool, Dict[str, Any]]:
+        ok = self.loop_lag_ms < self.lag_threshold_ms
+        return ok, {"status": "ok" if ok else "unhealthy", "event_loop_lag_ms": round(self.loop_lag_ms, 2)}
+
+    def readiness(self) -> Tuple[bool, Dict[str, Any]]:
+        checks = dict(self.checks)
+        age = None if self.checked_at is None else time.monotonic() - self.checked_at
+        # A prober that stopped updating must not keep reporting a stale "ready"
+        checks["probe_fresh"] = {
+            "ok": age is not None and age <= 3 * self.interval,
+            "age_s": None if age is None else round(age, 2),
+        }
+        checks["accepting"] = {"ok": not drain_state.draining}
+        checks["write_backlog"] = {
+            "ok": inflight_writes.count < READY_MAX_INFLIGHT_WRITES,
+            "inflight": inflight_writes.count,
+            "limit": READY_MAX_INFLIGHT_WRITES,
+        }
+        ok = bool(checks.get("mongo")) and all(check["ok"] for check in checks.values())
+        return ok, {"status": "ready" if ok else "not_ready", "checks": checks}
+
+health_prober = HealthProber(HEALTH_PROBE_INTERVAL, HEALTH_PROBE_TIMEOUT, EVENT_LOOP_LAG_THRESHOLD_MS)
+
+def json_response(payload: bytes) -> Response:
+    return Response(content=payload, media_type="application/json")
 
 # Add your routes to the router instead of directly to app
 @api_router.get("/")
@@ -41,20 +623,251 @@ async def root():
     return {"message": "Hello World"}
 
 @api_router.post("/status", response_model=StatusCheck)
-async def create_status_check(input: StatusCheckCreate):
+async def create_status_check(input: StatusCheckCreate, durability: Optional[Durability] = None):
     status_dict = input.dict()
     status_obj = StatusCheck(**status_dict)
-    _ = await db.status_checks.insert_one(status_obj.dict())
+    collection = status_collection(durability or ENDPOINT_DURABILITY["create_status_check"])
+    with inflight_writes.track():
+        _ = await collection.insert_one(status_obj.dict())
+    status_writes.advance()
+    insert_notifier.notify()
     return status_obj
 
+# Bulk import: rows per validation/insert_many batch
+IMPORT_BATCH_SIZE = int(os.environ.get('IMPORT_BATCH_SIZE', '1000'))
+
+@api_router.post("/status/import", response_model=ImportSummary)
+async def import_status_checks(
+    request: Request,
+    format: Optional[ImportFormat] = None,
+    durability: Optional[Durability] = None,
+):
+    """Import NDJSON or CSV rows streamed as the raw body or as a multipart file part.
+
+    The format defaults to csv for text/csv bodies and ndjson otherwise; multipart
+    uploads should pass ?format= explicitly.
+    """
+    content_type = request.headers.get("content-type", "")
+    chunks = request.stream()
+    if content_type.startswith("multipart/form-data"):
+        chunks = multipart_file_chunks(chunks, content_type)
+    fmt = format or (ImportFormat.csv if "csv" in content_type else ImportFormat.ndjson)
+
+    importer = StatusImporter(
+        status_collection(durability or ENDPOINT_DURABILITY["import_status_checks"]),
+        fmt,
+        batch_size=IMPORT_BATCH_SIZE,
+    )
+    try:
+        with inflight_writes.track():
+            summary = await importer.run(chunks)
+    except ImportFormatError as e:
+        raise HTTPException(status_code=400, detail={"error": str(e), "summary": importer.summary.model_dump()})
+    finally:
+        if importer.summary.inserted:
+            status_writes.advance()
+            insert_notifier.notify()
+            count_cache.clear()
+    return summary
+
+async def load_status_checks_payload() -> bytes:
+    status_checks = []
+    for collection in await status_layout.collections():
+        status_checks += await collection.find().to_list(1000 - len(status_checks))
+        if len(status_checks) >= 1000:
+            break
+    return status_checks_adapter.dump_json([StatusCheck(**status_check) for status_check in status_checks])
+
 @api_router.get("/status", response_model=List[StatusCheck])
 async def get_status_checks():
-    status_checks = await db.status_checks.find().to_list(1000)
-    return [StatusCheck(**status_check) for status_check in status_checks]
+    return json_response(await read_coalescer.do(("status", status_writes.value), load_status_checks_payload))
+
+@api_router.delete("/status", response_model=RetentionResult)
+async def delete_status_checks_before(before: datetime):
+    """Retention: remove status checks older than `before`.
+
+    With the monthly layout whole months ending on or before `before` are dropped,
+    so a month that is only partly older than the cutoff is kept.
+    """
+    with inflight_writes.track():
+        result = await status_layout.drop_before(before)
+    status_writes.advance()
+    count_cache.clear()
+    return RetentionResult(layout=status_layout.name, before=as_utc_naive(before), **result)
+
+@api_router.get("/status/changes", response_model=StatusChanges)
+async def get_status_changes(
+    since: Optional[str] = None,
+    timeout: float = Query(0, ge=0, le=LONG_POLL_MAX_TIMEOUT),
+    limit: int = Query(1000, ge=1, le=1000),
+):
+    try:
+        after = decode_watermark(since) if since else None
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid watermark")
+
+    async def load_changes_payload() -> Optional[bytes]:
+        query = {"_id": {"$gt": after}} if after else {}
+        # Fetch one extra document to know whether another page is waiting. Imports
+        # can land in any bucket, so every collection is asked and the pages merged.
+        collections = await status_layout.collections()
+        pages = await asyncio.gather(*(
+            collection.find(query).sort("_id", 1).to_list(limit + 1) for collection in collections
+        ))
+        docs = list(heapq.merge(*pages, key=lambda doc: doc["_id"]))[:limit + 1]
+        if not docs:
+            return None
+        page = docs[:limit]
+        return StatusChanges(
+            changes=[StatusCheck(**doc) for doc in page],
+            watermark=encode_watermark(page[-1]["_id"]),
+            has_more=len(docs) > limit,
+        ).model_dump_json().encode()
+
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while True:
+        generation = insert_notifier.generation
+        # Pollers parked on the same watermark re-check with a single query
+        payload = await read_coalescer.do(("status_changes", since, limit, status_writes.value), load_changes_payload)
+        remaining = deadline - loop.time()
+        if payload is not None or remaining <= 0 or drain_state.draining:
+            break
+        await insert_notifier.wait(generation, min(remaining, LONG_POLL_RECHECK_INTERVAL))
+
+    if payload is None:
+        return StatusChanges(changes=[], watermark=since or "", has_more=False)
+    return json_response(payload)
+
+@api_router.get("/status/count", response_model=StatusCount)
+async def count_status_checks(
+    mode: CountMode = CountMode.estimated,
+    client_name: Optional[str] = None,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+):
+    if mode is CountMode.estimated:
+        if client_name is not None or since is not None or until is not None:
+            raise HTTPException(status_code=400, detail="Filters require mode=exact")
+        async def estimated_count() -> int:
+            collections = await status_layout.collections()
+            return sum(await asyncio.gather(*(collection.estimated_document_count() for collection in collections)))
+
+        count = await read_coalescer.do(("status_count_estimated", status_writes.value), estimated_count)
+        return StatusCount(count=count, mode=mode)
+
+    query = status_range_query(client_name, since, until)
+    # Keyed by the write generation: a count from before this process's latest write is never served
+    key = (status_writes.value, client_name, as_utc_naive(since), as_utc_naive(until))
+    hit, count = count_cache.get(key)
+    if hit:
+        return StatusCount(count=count, mode=mode, cached=True)
+    async def exact_count() -> int:
+        collections = await status_layout.collections(since, until)
+        return sum(await asyncio.gather(*(collection.count_documents(query) for collection in collections)))
+
+    count = await read_coalescer.do(("status_count", *key), exact_count)
+    count_cache.set(key, count)
+    return StatusCount(count=count, mode=mode)
+
+@api_router.get("/status/export")
+async def export_status_checks(
+    format: ExportFormat = ExportFormat.parquet,
+    client_name: Optional[str] = None,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+):
+    """Stream status checks as a Parquet file or an Arrow IPC stream"""
+    from status_export import stream_export  # pyarrow is heavy; keep it out of startup
+
+    query = status_range_query(client_name, since, until)
+    collections = await status_layout.collections(since, until)
+    filename = f"status_checks.{format.extension}"
+    return StreamingResponse(
+        stream_export(collections, format, query),
+        media_type=format.media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+@api_router.get("/status/health-report", response_model=HealthReport)
+async def get_status_health_report(
+    client_name: Optional[str] = None,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    tolerance: float = Query(0.5, ge=0),
+    recent_window: int = Query(10, ge=1),
+):
+    """Per-client inter-arrival statistics, missed check-ins and liveness scores"""
+    from status_analytics import build_health_report, load_checkins  # numpy is heavy; keep it out of startup
+
+    collections = await status_layout.collections(since, until)
+    checkins = await load_checkins(collections, status_range_query(client_name, since, until))
+    return await run_cpu(
+        build_health_report, checkins, as_utc_naive(until), tolerance, recent_window,
+    )
+
+@api_router.post("/jobs", response_model=Job, status_code=202)
+async def submit_job(submission: JobSubmission):
+    """Queue a report, rollup or export; poll GET /api/jobs/{id} for the result"""
+    try:
+        params = job_manager.params_model(submission.kind.value).model_validate(submission.params)
+    except ValidationError as e:
+        raise RequestValidationError([
+            {**error, "loc": ("body", "params", *error["loc"])} for error in e.errors(include_url=False)
+        ])
+    try:
+        return await job_manager.submit(submission.kind.value, params)
+    except JobQueueFull:
+        raise HTTPException(status_code=503, detail="Job queue is full", headers={"Retry-After": "5"})
+
+@api_router.get("/jobs/{job_id}", response_model=Job)
+async def get_job(job_id: str):
+    job = await job_manager.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+@api_router.get("/jobs/{job_id}/download")
+async def download_job_export(job_id: str):
+    """The file produced by a finished status_export job"""
+    job = await job_manager.get(job_id)
+    if job is None or job.kind != JobKind.status_export.value:
+        raise HTTPException(status_code=404, detail="Export job not found")
+    if job.status is not JobStatus.succeeded:
+        raise HTTPException(status_code=409, detail=f"Export job is {job.status.value}")
+    path = JOB_EXPORT_DIR / job.result["filename"]
+    if not path.exists():
+        raise HTTPException(status_code=410, detail="Export file has expired")
+    fmt = ExportFormat(job.params["format"])
+    return FileResponse(path, media_type=fmt.media_type, filename=f"status_checks.{fmt.extension}")
+
+@api_router.get("/metrics")
+async def get_metrics():
+    return {
+        "coalescing": read_coalescer.snapshot(),
+        "jobs": job_manager.snapshot(),
+        "cpu_executor": cpu_executor.snapshot(),
+        "startup": startup_metrics,
+        "drain": drain_state.metrics,
+    }
+
+@app.get("/healthz")
+async def healthz():
+    """Liveness: the process is up and its event loop is responsive"""
+    ok, body = health_prober.liveness()
+    return JSONResponse(body, status_code=200 if ok else 503)
+
+@app.get("/readyz")
+async def readyz():
+    """Readiness: Mongo reachable, indexes present, write backlog below its limit"""
+    ok, body = health_prober.readiness()
+    return JSONResponse(body, status_code=200 if ok else 503)
 
 # Include the router in the main app
 app.include_router(api_router)
 
+app.add_middleware(DrainMiddleware)
+
 app.add_middleware(
     CORSMiddleware,
     allow_credentials=True,
@@ -70,6 +883,98 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-@app.on_event("shutdown")
-async def shutdown_db_client():
-    client.close()
\ No newline at end of file
+
+# On-demand request profiling
+#
+# Disabled unless PROFILING_ENABLED is set *and* PROFILING_TOKEN is configured.
+# When disabled the middleware is never installed, so normal requests pay nothing.
+# A request is profiled when it carries `X-Profile: 1` (or `?profile=1`) together
+# with `X-Profile-Token: <PROFILING_TOKEN>`. The response body is replaced by a
+# pstats report and the raw .prof file is kept in PROFILE_DIR.
+class ProfilingMiddleware:
+    def __init__(self, app, token: str, profile_dir: Path, keep: int = 20, sort_by: str = "cumulative"):
+        self.app = app
+        self.token = token.encode()
+        self.profile_dir = profile_dir
+        self.keep = keep
+        self.sort_by = sort_by
+        # cProfile hooks the whole thread, so only one request is profiled at a time
+        self._lock = asyncio.Lock()
+
+    def _requested(self, scope) -> bool:
+        headers = Headers(scope=scope)
+        flagged = headers.get("x-profile") == "1"
+        if not flagged and scope.get("query_string"):
+            flagged = parse_qs(scope["query_string"].decode("latin-1")).get("profile") == ["1"]
+        if not flagged:
+            return False
+        supplied = headers.get("x-profile-token", "").encode()
+        return hmac.compare_digest(supplied, self.token)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self._requested(scope):
+            await self.app(scope, receive, send)
+            return
+
+        async with self._lock:
+            captured = {"status": 500}
+
+            async def capture_send(message):
+                if message["type"] == "http.response.start":
+                    captured["status"] = message["status"]
+
+            profiler = cProfile.Profile()
+            started = time.perf_counter()
+            profiler.enable()
+            try:
+                await self.app(scope, receive, capture_send)
+            finally:
+                profiler.disable()
+            elapsed_ms = (time.perf_counter() - started) * 1000
+
+        path = await asyncio.to_thread(self._save, profiler, scope)
+        report = io.StringIO()
+        stats = pstats.Stats(profiler, stream=report)
+        stats.sort_stats(self.sort_by).print_stats(50)
+        body = (
+            f"{scope['method']} {scope['path']} -> {captured['status']} in {elapsed_ms:.1f} ms\n"
+            f"profile saved to {path}\n\n{report.getvalue()}"
+        ).encode()
+
+        logger.info("Profiled %s %s (%.1f ms) -> %s", scope["method"], scope["path"], elapsed_ms, path)
+        await send({
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [
+                (b"content-type", b"text/plain; charset=utf-8"),
+                (b"content-length", str(len(body)).encode()),
+                (b"x-profile-file", path.name.encode()),
+                (b"x-profiled-status", str(captured["status"]).encode()),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
+
+    def _save(self, profiler: cProfile.Profile, scope) -> Path:
+        self.profile_dir.mkdir(parents=True, exist_ok=True)
+        slug = scope["path"].strip("/").replace("/", "_") or "root"
+        path = self.profile_dir / f"{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:8]}-{scope['method']}-{slug}.prof"
+        profiler.dump_stats(path)
+        # Rotate: keep only the newest `keep` profiles
+        profiles = sorted(self.profile_dir.glob("*.prof"), key=lambda p: p.stat().st_mtime)
+        for old in profiles[:-self.keep]:
+            old.unlink(missing_ok=True)
+        return path
+
+
+if os.environ.get('PROFILING_ENABLED', '').lower() in ('1', 'true', 'yes'):
+    profiling_token = os.environ.get('PROFILING_TOKEN', '')
+    if profiling_token:
+        app.add_middleware(
+            ProfilingMiddleware,
+            token=profiling_token,
+            profile_dir=Path(os.environ.get('PROFILE_DIR', ROOT_DIR / 'profiles')),
+            keep=int(os.environ.get('PROFILE_KEEP', '20')),
+        )
+        logger.info("Request profiling enabled")
+    else:
+        logger.warning("PROFILING_ENABLED is set but PROFILING_TOKEN is empty; profiling stays off")
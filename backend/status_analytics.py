@@ -0,0 +1,254 @@
+"""Vectorised check-in gap and liveness analysis.
+
+(client_name, timestamp) pairs are loaded from Mongo as raw BSON cursor batches,
+which the CPU executor decodes into NumPy arrays (int32 client codes, int64
+millisecond timestamps); only the arrays come back. All per-client
+statistics are then computed with sort/reduce primitives over those arrays, so
+cost is a couple of O(n log n) sorts rather than a Python loop per check-in.
+
+For each client the expected cadence is the median inter-arrival gap. A gap
+longer than ``expected * (1 + tolerance)`` counts ``round(gap / expected) - 1``
+missed check-ins. The liveness score decays exponentially once the current
+silence exceeds the tolerated cadence, and cadence drift compares the mean of
+the most recent gaps with the median.
+"""
+import os
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+import bson
+import numpy as np
+
+from executors import run_cpu
+from models import ClientHealth, HealthReport, RollupBucket, RollupInterval, StatusRollup
+
+ANALYTICS_BATCH_SIZE = int(os.environ.get('ANALYTICS_BATCH_SIZE', '100000'))
+
+ANALYTICS_PROJECTION = {"_id": 0, "client_name": 1, "timestamp": 1}
+
+
+class CheckinArrays:
+    """Columnar check-ins: `codes` index into `names`, `timestamps` are epoch ms"""
+
+    def __init__(self, names: List[str], codes: np.ndarray, timestamps: np.ndarray):
+        self.names = names
+        self.codes = codes
+        self.timestamps = timestamps
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+
+def decode_checkin_batch(raw: bytes) -> Tuple[List[str], np.ndarray, np.ndarray]:
+    """(unique client names, int32 codes into them, epoch-ms timestamps) of one raw BSON batch"""
+    documents = bson.decode_all(raw)
+    names, inverse = np.unique(np.array([doc["client_name"] for doc in documents], dtype=object), return_inverse=True)
+    timestamps = np.array([doc["timestamp"] for doc in documents], dtype="datetime64[ms]").astype(np.int64)
+    return names.tolist(), inverse.astype(np.int32), timestamps
+
+
+async def load_checkins(collections: List[Any], query: Dict[str, Any], batch_size: int = ANALYTICS_BATCH_SIZE) -> CheckinArrays:
+    """Pull (client_name, timestamp) columns from Mongo into NumPy arrays batch by batch"""
+    name_codes: Dict[str, int] = {}
+    code_chunks: List[np.ndarray] = []
+    timestamp_chunks: List[np.ndarray] = []
+
+    for collection in collections:
+        async for raw in collection.find_raw_batches(query, ANALYTICS_PROJECTION).batch_size(batch_size):
+            batch_names, codes, timestamps = await run_cpu(decode_checkin_batch, raw)
+            # Map this batch's unique names onto the run-wide code space
+            remap = np.array([name_codes.setdefault(name, len(name_codes)) for name in batch_names], dtype=np.int32)
+            code_chunks.append(remap[codes])
+            timestamp_chunks.append(timestamps)
+
+    if not code_chunks:
+        return CheckinArrays([], np.empty(0, dtype=np.int32), np.empty(0, dtype=np.int64))
+    return CheckinArrays(list(name_codes), np.concatenate(code_chunks), np.concatenate(timestamp_chunks))
+
+
+def _group_sort(groups: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """Indices ordering by (group, value) for non-negative integer groups and integer values"""
+    if len(values) == 0:
+        return np.empty(0, dtype=np.intp)
+    low = int(values.min())
+    span = int(values.max()) - low + 1
+    if (int(groups.max()) + 1) * span < 2 ** 62:
+        # One argsort over a packed int64 key is several times faster than lexsort
+        return np.argsort(groups.astype(np.int64) * span + (values - low))
+    return np.lexsort((values, groups))
+
+
+def _grouped_median(values: np.ndarray, groups: np.ndarray, group_sizes: np.ndarray) -> np.ndarray:
+    """Median of integer `values` per group id (NaN for empty groups)"""
+    ordered = values[_group_sort(groups, values)].astype(np.float64)
+    starts = np.concatenate(([0], np.cumsum(group_sizes)[:-1]))
+    medians = np.full(len(group_sizes), np.nan)
+    has = group_sizes > 0
+    lo = starts[has] + (group_sizes[has] - 1) // 2
+    hi = starts[has] + group_sizes[has] // 2
+    medians[has] = (ordered[lo] + ordered[hi]) / 2
+    return medians
+
+
+def compute_client_stats(
+    checkins: CheckinArrays,
+    now_ms: int,
+    tolerance: float = 0.5,
+    recent_window: int = 10,
+) -> Dict[str, np.ndarray]:
+    """Per-client statistics as parallel arrays, all times in milliseconds"""
+    if len(checkins) == 0:
+        return {}
+    order = _group_sort(checkins.codes, checkins.timestamps)
+    codes = checkins.codes[order]
+    ts = checkins.timestamps[order]
+    n = len(ts)
+
+    new_group = np.empty(n, dtype=bool)
+    new_group[0] = True
+    np.not_equal(codes[1:], codes[:-1], out=new_group[1:])
+    starts = np.flatnonzero(new_group)
+    counts = np.diff(np.append(starts, n))
+    group_count = len(starts)
+
+    # Inter-arrival gaps between consecutive check-ins of the same client (time-ordered per client)
+    same_client = ~new_group[1:]
+    int_gaps = np.diff(ts)[same_client]
+    gaps = int_gaps.astype(np.float64)
+    gap_groups = (np.cumsum(new_group) - 1)[1:][same_client]
+    gap_counts = counts - 1
+    has_gaps = gap_counts > 0
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        gap_sum = np.bincount(gap_groups, weights=gaps, minlength=group_count)
+        gap_sq_sum = np.bincount(gap_groups, weights=gaps * gaps, minlength=group_count)
+        mean = np.where(has_gaps, gap_sum / gap_counts, np.nan)
+        stddev = np.where(has_gaps, np.sqrt(np.maximum(gap_sq_sum / gap_counts - mean * mean, 0)), np.nan)
+        # Gaps are contiguous per client, so per-client maxima are a reduceat over group starts
+        gap_max = np.full(group_count, np.nan)
+        gap_starts = np.cumsum(gap_counts) - gap_counts
+        if len(gaps):
+            gap_max[has_gaps] = np.maximum.reduceat(gaps, gap_starts[has_gaps])
+
+        expected = _grouped_median(int_gaps, gap_groups, gap_counts)
+        expected_per_gap = expected[gap_groups]
+        late_gap = (expected_per_gap > 0) & (gaps > expected_per_gap * (1 + tolerance))
+        missed_per_gap = np.where(late_gap, np.maximum(np.rint(gaps / expected_per_gap) - 1, 1), 0)
+        missed = np.bincount(gap_groups, weights=missed_per_gap, minlength=group_count).astype(np.int64)
+
+        # Cadence drift: mean of the last `recent_window` gaps relative to the median
+        gap_index = np.arange(len(gaps))
+        gap_ends = np.cumsum(gap_counts)
+        recent = gap_index >= (gap_ends[gap_groups] - recent_window)
+        recent_sum = np.bincount(gap_groups, weights=np.where(recent, gaps, 0), minlength=group_count)
+        recent_n = np.bincount(gap_groups, weights=recent.astype(np.float64), minlength=group_count)
+        drift = np.where(has_gaps & (expected > 0), (recent_sum / recent_n) / expected, np.nan)
+
+        first_seen = ts[starts]
+        last_seen = ts[starts + counts - 1]
+        silence = (now_ms - last_seen).astype(np.float64)
+        overdue = np.where(expected > 0, silence / expected, np.nan)
+        score = np.where(np.isnan(overdue), np.nan, np.exp(-np.maximum(overdue - (1 + tolerance), 0)))
+
+    return {
+        "codes": codes[starts],
+        "checkins": counts,
+        "first_seen": first_seen,
+        "last_seen": last_seen,
+        "expected": expected,
+        "mean": mean,
+        "stddev": stddev,
+        "max": gap_max,
+        "missed": missed,
+        "silence": silence,
+        "overdue": overdue,
+        "drift": drift,
+        "score": score,
+    }
+
+
+def _seconds(value: float) -> Optional[float]:
+    return None if np.isnan(value) else round(float(value) / 1000, 3)
+
+def _rounded(value: float) -> Optional[float]:
+    return None if np.isnan(value) else round(float(value), 4)
+
+
+def build_health_report(
+    checkins: CheckinArrays,
+    now: Optional[datetime] = None,
+    tolerance: float = 0.5,
+    recent_window: int = 10,
+    drift_threshold: float = 0.5,
+) -> HealthReport:
+    now = now or datetime.utcnow()
+    now_ms = int(np.datetime64(now, "ms").astype(np.int64))
+    stats = compute_client_stats(checkins, now_ms, tolerance, recent_window)
+    summary = {"alive": 0, "late": 0, "quiet": 0, "insufficient_data": 0}
+    clients: List[Tuple[float, ClientHealth]] = []
+
+    for i in range(len(stats.get("codes", ()))):
+        score = stats["score"][i]
+        drift = stats["drift"][i]
+        if np.isnan(score):
+            status = "insufficient_data"
+        elif stats["overdue"][i] <= 1 + tolerance:
+            status = "alive"
+        elif score >= 0.1:
+            status = "late"
+        else:
+            status = "quiet"
+        summary[status] += 1
+        clients.append((2.0 if np.isnan(score) else float(score), ClientHealth(
+            client_name=checkins.names[stats["codes"][i]],
+            checkins=int(stats["checkins"][i]),
+            first_seen=np.datetime64(int(stats["first_seen"][i]), "ms").astype(datetime),
+            last_seen=np.datetime64(int(stats["last_seen"][i]), "ms").astype(datetime),
+            expected_interval_s=_seconds(stats["expected"][i]),
+            mean_interval_s=_seconds(stats["mean"][i]),
+            stddev_interval_s=_seconds(stats["stddev"][i]),
+            max_interval_s=_seconds(stats["max"][i]),
+            missed_intervals=int(stats["missed"][i]),
+            silence_s=round(float(stats["silence"][i]) / 1000, 3),
+            overdue_ratio=_rounded(stats["overdue"][i]),
+            cadence_drift=_rounded(drift),
+            drifting=bool(not np.isnan(drift) and (drift > 1 + drift_threshold or drift < 1 / (1 + drift_threshold))),
+            liveness_score=_rounded(score),
+            status=status,
+        )))
+
+    # Least healthy clients first, clients without a cadence last
+    clients.sort(key=lambda item: item[0])
+    return HealthReport(
+        generated_at=now,
+        rows=len(checkins),
+        tolerance=tolerance,
+        summary=summary,
+        clients=[client for _, client in clients],
+    )
+
+
+def build_rollup(checkins: CheckinArrays, interval: RollupInterval) -> StatusRollup:
+    """Check-in counts per client per fixed UTC interval, ordered by client then time"""
+    if len(checkins) == 0:
+        return StatusRollup(interval=interval, rows=0, buckets=[])
+    bucket_ms = interval.milliseconds
+    slots = checkins.timestamps // bucket_ms
+    order = _group_sort(checkins.codes, slots)
+    codes = checkins.codes[order]
+    slots = slots[order]
+
+    new_bucket = np.empty(len(slots), dtype=bool)
+    new_bucket[0] = True
+    new_bucket[1:] = (codes[1:] != codes[:-1]) | (slots[1:] != slots[:-1])
+    starts = np.flatnonzero(new_bucket)
+    counts = np.diff(np.append(starts, len(slots)))
+    bucket_starts = (slots[starts] * bucket_ms).astype("datetime64[ms]").astype(datetime)
+
+    names = checkins.names
+    buckets = [
+        RollupBucket(client_name=names[code], bucket_start=start, checkins=int(count))
+        for code, start, count in zip(codes[starts].tolist(), bucket_starts, counts.tolist())
+    ]
+    buckets.sort(key=lambda bucket: (bucket.client_name, bucket.bucket_start))
+    return StatusRollup(interval=interval, rows=len(checkins), buckets=buckets)
@@ -0,0 +1,177 @@
+"""Columnar Parquet / Arrow IPC export of status checks.
+
+Documents are pulled from Mongo as raw BSON cursor batches, converted to Arrow
+record batches (typed UTC timestamps, dictionary-encoded ``client_name``) and
+written incrementally, so neither the HTTP endpoint nor the CLI materialises the
+whole collection. Decoding and conversion run on the CPU executor, which receives
+the undecoded batch bytes and returns an Arrow batch; the stateful file writer
+stays in-process on a thread, where compression releases the GIL.
+
+Usage:
+    python status_export.py status.parquet
+    python status_export.py status.arrows --format arrow --client-name bot-1 --since 2024-01-01
+"""
+import os
+import asyncio
+from pathlib import Path
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+import bson
+import pyarrow as pa
+import pyarrow.ipc as ipc
+import pyarrow.parquet as pq
+
+from executors import run_cpu
+from models import ExportFormat, status_range_query
+
+EXPORT_BATCH_SIZE = int(os.environ.get('EXPORT_BATCH_SIZE', '50000'))
+
+STATUS_SCHEMA = pa.schema([
+    pa.field("id", pa.string(), nullable=False),
+    pa.field("client_name", pa.dictionary(pa.int32(), pa.string()), nullable=False),
+    pa.field("timestamp", pa.timestamp("ms", tz="UTC"), nullable=False),
+])
+
+EXPORT_PROJECTION = {"_id": 0, "id": 1, "client_name": 1, "timestamp": 1}
+
+
+async def iter_raw_batches(collections: List[Any], query: Dict[str, Any], batch_size: int = EXPORT_BATCH_SIZE) -> AsyncIterator[bytes]:
+    """Yield undecoded cursor batches (concatenated BSON documents) of at most `batch_size` rows"""
+    for collection in collections:
+        async for raw in collection.find_raw_batches(query, EXPORT_PROJECTION).batch_size(batch_size):
+            yield raw
+
+
+def decode_status_batch(raw: bytes) -> pa.RecordBatch:
+    documents = bson.decode_all(raw)
+    ids = [document["id"] for document in documents]
+    names = [document["client_name"] for document in documents]
+    timestamps = [document["timestamp"] for document in documents]
+    return pa.RecordBatch.from_arrays([
+        pa.array(ids, type=pa.string()),
+        pa.array(names, type=pa.string()).dictionary_encode(),
+        pa.array(timestamps, type=pa.timestamp("ms", tz="UTC")),
+    ], schema=STATUS_SCHEMA)
+
+
+class _ChunkSink:
+    """Write-only file object whose contents are drained after every batch"""
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+        self._position = 0
+        self.closed = False
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        self._chunks.append(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks = []
+        return data
+
+
+class StatusExportWriter:
+    """Incremental encoder; `write` and `close` return the bytes produced so far"""
+
+    def __init__(self, fmt: ExportFormat, sink=None):
+        self.fmt = fmt
+        self._sink = sink if sink is not None else _ChunkSink()
+        if fmt is ExportFormat.parquet:
+            self._writer = pq.ParquetWriter(self._sink, STATUS_SCHEMA, compression="zstd")
+        else:
+            # The stream format allows each batch to carry its own client_name dictionary
+            self._writer = ipc.new_stream(self._sink, STATUS_SCHEMA)
+
+    def _drain(self) -> bytes:
+        return self._sink.drain() if isinstance(self._sink, _ChunkSink) else b""
+
+    def write(self, batch: pa.RecordBatch) -> bytes:
+        if self.fmt is ExportFormat.parquet:
+            self._writer.write_batch(batch, row_group_size=batch.num_rows)
+        else:
+            self._writer.write_batch(batch)
+        return self._drain()
+
+    def close(self) -> bytes:
+        self._writer.close()
+        return self._drain()
+
+
+async def stream_export(collections: List[Any], fmt: ExportFormat, query: Dict[str, Any],
+                        batch_size: int = EXPORT_BATCH_SIZE) -> AsyncIterator[bytes]:
+    """Encoded export as an async byte stream, suitable for a StreamingResponse"""
+    writer = StatusExportWriter(fmt)
+    async for raw in iter_raw_batches(collections, query, batch_size):
+        batch = await run_cpu(decode_status_batch, raw)
+        data = await asyncio.to_thread(writer.write, batch)
+        if data:
+            yield data
+    data = await asyncio.to_thread(writer.close)
+    if data:
+        yield data
+
+
+async def export_to_file(collections: List[Any], fmt: ExportFormat, query: Dict[str, Any], path: Path,
+                         batch_size: int = EXPORT_BATCH_SIZE) -> int:
+    """Write an export to `path`; returns the number of rows written"""
+    rows = 0
+    with pa.OSFile(str(path), "wb") as sink:
+        writer = StatusExportWriter(fmt, sink)
+        async for raw in iter_raw_batches(collections, query, batch_size):
+            batch = await run_cpu(decode_status_batch, raw)
+            await asyncio.to_thread(writer.write, batch)
+            rows += batch.num_rows
+        await asyncio.to_thread(writer.close)
+    return rows
+
+
+def cli():
+    import typer
+    from dotenv import load_dotenv
+    from motor.motor_asyncio import AsyncIOMotorClient
+    from status_layout import make_status_layout
+
+    def export(
+        output: Path = typer.Argument(..., help="Destination file"),
+        format: ExportFormat = typer.Option(ExportFormat.parquet, help="parquet or arrow (IPC stream)"),
+        client_name: Optional[str] = typer.Option(None, help="Only export this client"),
+        since: Optional[datetime] = typer.Option(None, help="Inclusive lower timestamp bound (UTC)"),
+        until: Optional[datetime] = typer.Option(None, help="Exclusive upper timestamp bound (UTC)"),
+        batch_size: int = typer.Option(EXPORT_BATCH_SIZE, help="Rows per cursor batch / row group"),
+    ):
+        """Export status_checks to a Parquet or Arrow IPC file"""
+        load_dotenv(Path(__file__).parent / '.env')
+        query = status_range_query(client_name, since, until)
+
+        async def run() -> int:
+            client = AsyncIOMotorClient(os.environ['MONGO_URL'])
+            try:
+                db = client[os.environ['DB_NAME']]
+                layout = make_status_layout(os.environ.get('STATUS_LAYOUT', 'single'), lambda: db)
+                collections = await layout.collections(since, until)
+                return await export_to_file(collections, format, query, output, batch_size)
+            finally:
+                client.close()
+
+        rows = asyncio.run(run())
+        typer.echo(f"Exported {rows} status checks to {output} ({output.stat().st_size} bytes)")
+
+    typer.run(export)
+
+
+if __name__ == "__main__":
+    cli()
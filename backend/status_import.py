@@ -0,0 +1,274 @@
+"""Streaming bulk import of status check history from NDJSON or CSV uploads.
+
+Uploads are consumed chunk by chunk from the request stream, split into lines,
+validated in fixed-size batches and written with unordered ``insert_many``. At
+most one batch of rows and a capped list of error samples are held at a time,
+so memory stays flat regardless of upload size.
+
+Validation runs on the CPU executor (see executors.py). Batches cross the
+process boundary packed: line numbers and timestamps as int64 buffers and the
+raw lines as one newline-joined byte string, rather than lists of tuples and dicts.
+"""
+import csv
+import json
+import time
+import logging
+from array import array
+from datetime import datetime, timedelta, timezone
+from enum import Enum
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from pydantic import BaseModel, ValidationError
+from pymongo.errors import BulkWriteError
+
+from executors import run_cpu
+from models import StatusCheck
+
+try:
+    from python_multipart.multipart import MultipartParser, parse_options_header
+except ImportError:  # python-multipart < 0.0.13
+    from multipart.multipart import MultipartParser, parse_options_header
+
+logger = logging.getLogger(__name__)
+
+IMPORT_COLUMNS = ("client_name", "timestamp", "id")
+
+EPOCH = datetime(1970, 1, 1)
+ONE_MICROSECOND = timedelta(microseconds=1)
+
+
+class ImportFormat(str, Enum):
+    ndjson = "ndjson"
+    csv = "csv"
+
+class ImportRowError(BaseModel):
+    line: int
+    error: str
+
+class ImportSummary(BaseModel):
+    format: ImportFormat
+    rows: int = 0
+    inserted: int = 0
+    failed: int = 0
+    batches: int = 0
+    errors: List[ImportRowError] = []
+    errors_truncated: bool = False
+    elapsed_ms: float = 0.0
+
+
+class ImportFormatError(ValueError):
+    """The upload cannot be parsed at all (bad header, oversized line, ...)"""
+
+
+async def iter_lines(chunks: AsyncIterator[bytes], max_line_bytes: int) -> AsyncIterator[Tuple[int, bytes]]:
+    """Yield (line_number, line) from a byte stream, holding at most one partial line"""
+    buffer = b""
+    line_number = 0
+    async for chunk in chunks:
+        if not chunk:
+            continue
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            line_number += 1
+            yield line_number, line.rstrip(b"\r")
+        if len(buffer) > max_line_bytes:
+            raise ImportFormatError(f"line {line_number + 1} exceeds {max_line_bytes} bytes")
+    if buffer.strip():
+        yield line_number + 1, buffer.rstrip(b"\r")
+
+
+async def multipart_file_chunks(chunks: AsyncIterator[bytes], content_type: str) -> AsyncIterator[bytes]:
+    """Stream the body of the first file part of a multipart/form-data upload"""
+    _, params = parse_options_header(content_type)
+    boundary = params.get(b"boundary")
+    if not boundary:
+        raise ImportFormatError("multipart upload without boundary")
+
+    pending: List[bytes] = []
+    part = {"header_field": b"", "headers": {}, "active": False, "done": False}
+
+    def on_part_begin():
+        part["headers"] = {}
+
+    def on_header_field(data, start, end):
+        part["header_field"] = data[start:end].lower()
+
+    def on_header_value(data, start, end):
+        part["headers"][part["header_field"]] = part["headers"].get(part["header_field"], b"") + data[start:end]
+
+    def on_headers_finished():
+        disposition = part["headers"].get(b"content-disposition", b"")
+        part["active"] = not part["done"] and b"filename=" in disposition
+
+    def on_part_data(data, start, end):
+        if part["active"]:
+            pending.append(data[start:end])
+
+    def on_part_end():
+        if part["active"]:
+            part["active"] = False
+            part["done"] = True
+
+    parser = MultipartParser(boundary, {
+        "on_part_begin": on_part_begin,
+        "on_header_field": on_header_field,
+        "on_header_value": on_header_value,
+        "on_headers_finished": on_headers_finished,
+        "on_part_data": on_part_data,
+        "on_part_end": on_part_end,
+    })
+    async for chunk in chunks:
+        parser.write(chunk)
+        while pending:
+            yield pending.pop(0)
+    parser.finalize()
+    while pending:
+        yield pending.pop(0)
+
+
+def decode_line(line: bytes, encoding: str = "utf-8") -> str:
+    try:
+        return line.decode(encoding)
+    except UnicodeDecodeError as e:
+        raise ImportFormatError(f"line is not valid UTF-8 (byte 0x{line[e.start]:02x} at offset {e.start})") from None
+
+
+def parse_csv_header(line: bytes) -> List[str]:
+    header = [column.strip() for column in next(csv.reader([decode_line(line, "utf-8-sig")]))]
+    if "client_name" not in header:
+        raise ImportFormatError("CSV header must include a client_name column")
+    return header
+
+
+def parse_row(fmt: ImportFormat, header: Optional[List[str]], line: bytes) -> Dict[str, Any]:
+    if fmt is ImportFormat.ndjson:
+        row = json.loads(decode_line(line))
+        if not isinstance(row, dict):
+            raise ValueError("expected a JSON object")
+        return row
+    # Rows are parsed line by line, so quoted fields may not contain newlines
+    values = next(csv.reader([decode_line(line)]))
+    if len(values) != len(header):
+        raise ValueError(f"expected {len(header)} columns, got {len(values)}")
+    return {name: value for name, value in zip(header, values) if value != "" and name in IMPORT_COLUMNS}
+
+
+def validate_batch(
+    fmt: ImportFormat,
+    header: Optional[List[str]],
+    lines: List[Tuple[int, bytes]],
+) -> Tuple[List[Dict[str, Any]], List[int], List[Tuple[int, str]]]:
+    """Parse and validate one batch; returns (documents, their line numbers, errors)"""
+    documents: List[Dict[str, Any]] = []
+    document_lines: List[int] = []
+    errors: List[Tuple[int, str]] = []
+    for line_number, line in lines:
+        try:
+            row = parse_row(fmt, header, line)
+            documents.append(StatusCheck(**row).dict())
+            document_lines.append(line_number)
+        except ValidationError as e:
+            errors.append((line_number, "; ".join(
+                f"{'.'.join(str(loc) for loc in err['loc'])}: {err['msg']}" for err in e.errors()
+            )))
+        except (ValueError, UnicodeDecodeError, csv.Error) as e:
+            errors.append((line_number, str(e)))
+    return documents, document_lines, errors
+
+
+# (ids, client_names, timestamps as int64 µs, document line numbers as int64, errors)
+PackedDocuments = Tuple[List[str], List[str], bytes, bytes, List[Tuple[int, str]]]
+
+def pack_lines(lines: List[Tuple[int, bytes]]) -> Tuple[bytes, bytes]:
+    return array("q", [number for number, _ in lines]).tobytes(), b"\n".join(line for _, line in lines)
+
+def _epoch_micros(value: datetime) -> int:
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return (value - EPOCH) // ONE_MICROSECOND
+
+def validate_packed_batch(fmt: ImportFormat, header: Optional[List[str]], numbers: bytes, blob: bytes) -> PackedDocuments:
+    """validate_batch over a pack_lines() payload, with a packed result"""
+    line_numbers = array("q")
+    line_numbers.frombytes(numbers)
+    documents, document_lines, errors = validate_batch(fmt, header, list(zip(line_numbers, blob.split(b"\n"))))
+    return (
+        [document["id"] for document in documents],
+        [document["client_name"] for document in documents],
+        array("q", [_epoch_micros(document["timestamp"]) for document in documents]).tobytes(),
+        array("q", document_lines).tobytes(),
+        errors,
+    )
+
+def unpack_documents(ids: List[str], names: List[str], micros: bytes) -> List[Dict[str, Any]]:
+    timestamps = array("q")
+    timestamps.frombytes(micros)
+    return [
+        {"id": id, "client_name": name, "timestamp": EPOCH + timedelta(microseconds=us)}
+        for id, name, us in zip(ids, names, timestamps)
+    ]
+
+
+class StatusImporter:
+    def __init__(self, collection, fmt: ImportFormat, batch_size: int = 1000,
+                 max_errors: int = 100, max_line_bytes: int = 1 << 20):
+        self.collection = collection
+        self.fmt = fmt
+        self.batch_size = batch_size
+        self.max_errors = max_errors
+        self.max_line_bytes = max_line_bytes
+        self.summary = ImportSummary(format=fmt)
+        self._header: Optional[List[str]] = None
+
+    def _record_error(self, line: int, error: str):
+        self.summary.failed += 1
+        if len(self.summary.errors) < self.max_errors:
+            self.summary.errors.append(ImportRowError(line=line, error=error))
+        else:
+            self.summary.errors_truncated = True
+
+    async def run(self, chunks: AsyncIterator[bytes]) -> ImportSummary:
+        started = time.perf_counter()
+        batch: List[Tuple[int, bytes]] = []
+        async for line_number, line in iter_lines(chunks, self.max_line_bytes):
+            if not line.strip():
+                continue
+            if self.fmt is ImportFormat.csv and self._header is None:
+                self._header = parse_csv_header(line)
+                continue
+            batch.append((line_number, line))
+            if len(batch) >= self.batch_size:
+                await self._flush(batch)
+                batch = []
+        if batch:
+            await self._flush(batch)
+        self.summary.elapsed_ms = round((time.perf_counter() - started) * 1000, 1)
+        return self.summary
+
+    async def _flush(self, batch: List[Tuple[int, bytes]]):
+        ids, names, micros, packed_lines, errors = await run_cpu(
+            validate_packed_batch, self.fmt, self._header, *pack_lines(batch),
+        )
+        documents = unpack_documents(ids, names, micros)
+        document_lines = array("q")
+        document_lines.frombytes(packed_lines)
+        self.summary.rows += len(batch)
+        self.summary.batches += 1
+        for line, error in errors:
+            self._record_error(line, error)
+
+        if documents:
+            try:
+                await self.collection.insert_many(documents, ordered=False)
+                self.summary.inserted += len(documents)
+            except BulkWriteError as e:
+                write_errors = e.details.get("writeErrors", [])
+                self.summary.inserted += e.details.get("nInserted", 0)
+                for write_error in write_errors:
+                    self._record_error(document_lines[write_error["index"]], write_error.get("errmsg", "write failed"))
+
+        logger.info(
+            "Import batch %d: %d rows, %d inserted, %d failed so far",
+            self.summary.batches, self.summary.rows, self.summary.inserted, self.summary.failed,
+        )
@@ -0,0 +1,223 @@
+"""Physical layout of the status checks data.
+
+STATUS_LAYOUT selects how status checks are stored:
+
+- ``single`` (default): one ``status_checks`` collection.
+- ``monthly``: one collection per UTC month, named ``status_checks_YYYY_MM``.
+  Range reads only touch the months they overlap. Retention drops whole months
+  with ``drop_collection``, which costs the same however many rows a month holds.
+- ``timeseries``: one MongoDB time-series collection, ``status_checks_ts``, with
+  ``timestamp`` as the time field and ``client_name`` as the meta field.
+  Retention deletes by time need MongoDB 7.0 or newer on time-series collections.
+  Time-series collections have no ``_id`` index, so this layout also creates a
+  secondary ``_id`` index (MongoDB 6.0+). Without it, every ``/status/changes``
+  poll would scan the whole collection. The changes feed keeps its ``_id``
+  watermark: imported rows carry historical timestamps, so a watermark on the
+  time field would never return them.
+
+Every read and write of status checks goes through the layout.
+``collections(since, until)`` lists the collections a range touches.
+``writer(write_concern)`` returns an object with ``insert_one``/``insert_many``
+that routes each document to its collection.
+"""
+import re
+import time
+import asyncio
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Set
+
+from pymongo import ASCENDING, IndexModel
+from pymongo.errors import BulkWriteError, CollectionInvalid, OperationFailure
+from pymongo.results import InsertManyResult, InsertOneResult
+from pymongo.write_concern import WriteConcern
+
+from models import as_utc_naive
+
+# Serve per-client and time-range filters (counts, range reads) from indexes
+STATUS_CHECK_INDEXES = [
+    IndexModel([("client_name", ASCENDING), ("timestamp", ASCENDING)], name="client_name_timestamp"),
+    IndexModel([("timestamp", ASCENDING)], name="timestamp"),
+]
+
+# The /status/changes watermark query, find({"_id": {"$gt": ...}}).sort("_id"); time-series collections lack the default _id index
+WATERMARK_INDEX = IndexModel([("_id", ASCENDING)], name="id_watermark")
+
+# How long a listing of monthly buckets is trusted before other workers' new buckets are looked for
+BUCKET_LIST_TTL = 5.0
+
+
+class SingleCollectionLayout:
+    name = "single"
+    indexes = STATUS_CHECK_INDEXES
+
+    def __init__(self, db: Callable[[], Any], collection_name: str = "status_checks"):
+        self._db = db
+        self.collection_name = collection_name
+
+    def _collection(self):
+        return self._db()[self.collection_name]
+
+    async def ensure(self):
+        await self._collection().create_indexes(self.indexes)
+
+    async def collections(self, since: Optional[datetime] = None, until: Optional[datetime] = None) -> List[Any]:
+        return [self._collection()]
+
+    def writer(self, write_concern: WriteConcern):
+        return self._collection().with_options(write_concern=write_concern)
+
+    async def missing_indexes(self) -> List[str]:
+        existing = await self._collection().index_information()
+        return [index.document["name"] for index in self.indexes if index.document["name"] not in existing]
+
+    async def drop_before(self, cutoff: datetime) -> Dict[str, Any]:
+        result = await self._collection().delete_many({"timestamp": {"$lt": as_utc_naive(cutoff)}})
+        return {"deleted": result.deleted_count, "dropped_collections": []}
+
+
+class TimeSeriesLayout(SingleCollectionLayout):
+    name = "timeseries"
+    indexes = [*STATUS_CHECK_INDEXES, WATERMARK_INDEX]
+
+    def __init__(self, db: Callable[[], Any], collection_name: str = "status_checks_ts"):
+        super().__init__(db, collection_name)
+
+    async def ensure(self):
+        if self.collection_name not in await self._db().list_collection_names():
+            try:
+                await self._db().create_collection(self.collection_name, timeseries={
+                    "timeField": "timestamp",
+                    "metaField": "client_name",
+                    "granularity": "seconds",
+                })
+            except (CollectionInvalid, OperationFailure):
+                pass  # created concurrently by another worker
+        await super().ensure()
+
+
+class MonthlyLayout:
+    name = "monthly"
+
+    def __init__(self, db: Callable[[], Any], prefix: str = "status_checks_"):
+        self._db = db
+        self.prefix = prefix
+        self._pattern = re.compile(rf"^{re.escape(prefix)}(\d{{4}})_(\d{{2}})$")
+        self._ensured: Set[str] = set()
+        self._buckets: List[str] = []
+        self._listed_at: Optional[float] = None
+
+    def bucket_name(self, timestamp: datetime) -> str:
+        timestamp = as_utc_naive(timestamp)
+        return f"{self.prefix}{timestamp.year:04d}_{timestamp.month:02d}"
+
+    def bucket_range(self, name: str):
+        """[start, end) of the month a bucket holds"""
+        year, month = map(int, self._pattern.match(name).groups())
+        start = datetime(year, month, 1)
+        end = datetime(year + month // 12, month % 12 + 1, 1)
+        return start, end
+
+    async def buckets(self) -> List[str]:
+        """Existing bucket names, oldest first"""
+        if self._listed_at is None or time.monotonic() - self._listed_at > BUCKET_LIST_TTL:
+            names = await self._db().list_collection_names()
+            self._buckets = sorted(set(name for name in names if self._pattern.match(name)) | self._ensured)
+            self._listed_at = time.monotonic()
+        return self._buckets
+
+    async def _ensure_bucket(self, name: str):
+        if name not in self._ensured:
+            await self._db()[name].create_indexes(STATUS_CHECK_INDEXES)
+            self._ensured.add(name)
+            if name not in self._buckets:
+                self._buckets = sorted([*self._buckets, name])
+
+    async def ensure(self):
+        await self._ensure_bucket(self.bucket_name(datetime.utcnow()))
+
+    async def collections(self, since: Optional[datetime] = None, until: Optional[datetime] = None) -> List[Any]:
+        since, until = as_utc_naive(since), as_utc_naive(until)
+        selected = []
+        for name in await self.buckets():
+            start, end = self.bucket_range(name)
+            if (since is None or end > since) and (until is None or start < until):
+                selected.append(self._db()[name])
+        return selected
+
+    def writer(self, write_concern: WriteConcern) -> "MonthlyWriter":
+        return MonthlyWriter(self, write_concern)
+
+    async def missing_indexes(self) -> List[str]:
+        # The newest bucket that is not in the future is the one being written to
+        current = self.bucket_name(datetime.utcnow())
+        candidates = [name for name in await self.buckets() if name <= current]
+        if not candidates:
+            return []
+        existing = await self._db()[candidates[-1]].index_information()
+        return [
+            f"{candidates[-1]}.{index.document['name']}"
+            for index in STATUS_CHECK_INDEXES if index.document["name"] not in existing
+        ]
+
+    async def drop_before(self, cutoff: datetime) -> Dict[str, Any]:
+        """Drop every month that ends at or before `cutoff`; a partially covered month is kept whole"""
+        cutoff = as_utc_naive(cutoff)
+        doomed = [name for name in await self.buckets() if self.bucket_range(name)[1] <= cutoff]
+        for name in doomed:
+            await self._db().drop_collection(name)
+            self._ensured.discard(name)
+        self._buckets = [name for name in self._buckets if name not in doomed]
+        return {"deleted": None, "dropped_collections": doomed}
+
+
+class MonthlyWriter:
+    """Collection-like insert interface that splits writes across monthly buckets"""
+
+    def __init__(self, layout: MonthlyLayout, write_concern: WriteConcern):
+        self.layout = layout
+        self.write_concern = write_concern
+
+    def _bucket(self, name: str):
+        return self.layout._db()[name].with_options(write_concern=self.write_concern)
+
+    async def insert_one(self, document: Dict[str, Any]) -> InsertOneResult:
+        name = self.layout.bucket_name(document["timestamp"])
+        await self.layout._ensure_bucket(name)
+        return await self._bucket(name).insert_one(document)
+
+    async def insert_many(self, documents: List[Dict[str, Any]], ordered: bool = True) -> InsertManyResult:
+        groups: Dict[str, List[int]] = {}
+        for index, document in enumerate(documents):
+            groups.setdefault(self.layout.bucket_name(document["timestamp"]), []).append(index)
+        await asyncio.gather(*(self.layout._ensure_bucket(name) for name in groups))
+
+        inserted_ids: List[Any] = []
+        write_errors: List[Dict[str, Any]] = []
+        inserted = 0
+        for name, indexes in groups.items():
+            try:
+                result = await self._bucket(name).insert_many([documents[i] for i in indexes], ordered=ordered)
+                inserted += len(indexes)
+                inserted_ids.extend(result.inserted_ids)
+            except BulkWriteError as e:
+                inserted += e.details.get("nInserted", 0)
+                # Report positions in the caller's list, not the bucket's sub-list
+                write_errors.extend({**error, "index": indexes[error["index"]]} for error in e.details.get("writeErrors", []))
+                if ordered:
+                    break
+        if write_errors:
+            raise BulkWriteError({"writeErrors": write_errors, "nInserted": inserted})
+        return InsertManyResult(inserted_ids, self.write_concern.acknowledged)
+
+
+LAYOUTS = {
+    SingleCollectionLayout.name: SingleCollectionLayout,
+    MonthlyLayout.name: MonthlyLayout,
+    TimeSeriesLayout.name: TimeSeriesLayout,
+}
+
+def make_status_layout(name: str, db: Callable[[], Any]):
+    try:
+        return LAYOUTS[name](db)
+    except KeyError:
+        raise ValueError(f"unknown STATUS_LAYOUT {name!r}; expected one of {', '.join(LAYOUTS)}") from None
@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""
+FastAPI Backend Benchmarks
+Measuring insert latency/throughput, cold-start time and event-loop lag of the status_checks backend
+"""
+
+import os
+import sys
+import json
+import time
+import asyncio
+import argparse
+import statistics
+import subprocess
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).parent / "backend"
+sys.path.insert(0, str(BACKEND_DIR))
+
+
+# Runs in a fresh interpreter: import the app, run its lifespan startup and serve one request
+STARTUP_PROBE = r"""
+import asyncio, json, time
+import httpx
+import_started = time.perf_counter()
+import server
+imported = time.perf_counter()
+
+async def main():
+    async with server.app.router.lifespan_context(server.app):
+        started = time.perf_counter()
+        transport = httpx.ASGITransport(app=server.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://backend") as client:
+            response = await client.get("/api/status")
+            response.raise_for_status()
+        served = time.perf_counter()
+    print(json.dumps({
+        "import_ms": (imported - import_started) * 1000,
+        "startup_ms": (started - imported) * 1000,
+        "first_request_ms": (served - started) * 1000,
+    }))
+
+asyncio.run(main())
+"""
+
+
+def percentile(samples, pct):
+    """Nearest-rank percentile of a list of samples"""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+
+def latency_summary(samples_ms):
+    return {
+        "samples": len(samples_ms),
+        "mean_ms": round(statistics.fmean(samples_ms), 3) if samples_ms else 0.0,
+        "p50_ms": round(percentile(samples_ms, 50), 3),
+        "p95_ms": round(percentile(samples_ms, 95), 3),
+        "p99_ms": round(percentile(samples_ms, 99), 3),
+        "max_ms": round(max(samples_ms), 3) if samples_ms else 0.0,
+    }
+
+
+class BackendBenchmark:
+    def __init__(self, results_file):
+        self.results_file = Path(results_file)
+        self.results = {}
+
+    def record(self, name, result):
+        self.results[name] = result
+
+    async def bench_write_concerns(self, inserts, concurrency):
+        """Insert latency (sequential) and throughput (concurrent) for each durability mode"""
+        print("\n✍️  BENCHMARKING WRITE CONCERNS...")
+        import server
+
+        scratch = server.get_db()["status_checks_benchmark"]
+        await scratch.drop()
+        report = {}
+        try:
+            for durability in server.Durability:
+                collection = scratch.with_options(write_concern=server.WRITE_CONCERNS[durability])
+
+                latencies = []
+                for i in range(inserts):
+                    doc = server.StatusCheck(client_name=f"bench_{durability.value}_{i % 50}").dict()
+                    started = time.perf_counter()
+                    await collection.insert_one(doc)
+                    latencies.append((time.perf_counter() - started) * 1000)
+
+                queue = asyncio.Queue()
+                for i in range(inserts):
+                    queue.put_nowait(i)
+
+                async def worker():
+                    while True:
+                        try:
+                            i = queue.get_nowait()
+                        except asyncio.QueueEmpty:
+                            return
+                        doc = server.StatusCheck(client_name=f"bench_{durability.value}_{i % 50}").dict()
+                        await collection.insert_one(doc)
+
+                started = time.perf_counter()
+                await asyncio.gather(*(worker() for _ in range(concurrency)))
+                elapsed = time.perf_counter() - started
+
+                report[durability.value] = {
+                    "latency": latency_summary(latencies),
+                    "throughput_per_s": round(inserts / elapsed, 1),
+                    "concurrency": concurrency,
+                }
+                print(
+                    f"   {durability.value:<16} p50 {report[durability.value]['latency']['p50_ms']:>8.3f} ms"
+                    f"  p99 {report[durability.value]['latency']['p99_ms']:>8.3f} ms"
+                    f"  {report[durability.value]['throughput_per_s']:>10.1f} inserts/s"
+                )
+        finally:
+            await scratch.drop()
+
+        self.record("write_concerns", report)
+        return report
+
+    def bench_startup(self, runs, engine, import_budget_ms, target_ms):
+        """Cold start (interpreter spawn -> app import -> lifespan -> first response) in fresh processes"""
+        print("\n⏱️  BENCHMARKING COLD START...")
+        env = {**os.environ, "STORAGE_ENGINE": engine}
+        samples = {"import_ms": [], "startup_ms": [], "first_request_ms": [], "cold_start_ms": []}
+        for _ in range(runs):
+            started = time.perf_counter()
+            result = subprocess.run(
+                [sys.executable, "-c", STARTUP_PROBE],
+                cwd=BACKEND_DIR, env=env, capture_output=True, text=True, timeout=60,
+            )
+            elapsed = (time.perf_counter() - started) * 1000
+            if result.returncode != 0:
+                print(f"❌ Startup probe failed:\n{result.stderr}")
+                return False
+            probe = json.loads(result.stdout.strip().splitlines()[-1])
+            for key, value in probe.items():
+                samples[key].append(value)
+            samples["cold_start_ms"].append(elapsed)
+
+        report = {name: latency_summary(values) for name, values in samples.items()}
+        report["engine"] = engine
+        report["import_budget_ms"] = import_budget_ms
+        report["target_ms"] = target_ms
+        import_ok = report["import_ms"]["p50_ms"] <= import_budget_ms
+        cold_ok = report["cold_start_ms"]["p50_ms"] <= target_ms
+        report["passed"] = import_ok and cold_ok
+
+        print(f"   import server      p50 {report['import_ms']['p50_ms']:>8.1f} ms  (budget {import_budget_ms} ms) {'✅' if import_ok else '❌'}")
+        print(f"   lifespan startup   p50 {report['startup_ms']['p50_ms']:>8.1f} ms")
+        print(f"   first request      p50 {report['first_request_ms']['p50_ms']:>8.1f} ms")
+        print(f"   cold start total   p50 {report['cold_start_ms']['p50_ms']:>8.1f} ms  (target {target_ms} ms) {'✅' if cold_ok else '❌'}")
+
+        self.record("startup", report)
+        return report["passed"]
+
+    async def bench_import_lag(self, rows, modes, sample_interval_ms):
+        """Event-loop lag and throughput of a large NDJSON import for each CPU executor mode"""
+        print("\n🧵 BENCHMARKING EVENT-LOOP LAG DURING IMPORT...")
+        os.environ["STORAGE_ENGINE"] = "memory"
+        import httpx
+        import server
+        from executors import ExecutorMode, cpu_executor
+
+        lines = [
+            json.dumps({"client_name": f"bench_{i % 200}", "timestamp": f"2024-01-01T00:00:{i % 60:02d}Z"}).encode()
+            for i in range(rows)
+        ]
+        body = b"\n".join(lines)
+
+        async def body_chunks():
+            for start in range(0, len(body), 64 * 1024):
+                yield body[start:start + 64 * 1024]
+
+        interval = sample_interval_ms / 1000
+        report = {}
+        async with server.app.router.lifespan_context(server.app):
+            transport = httpx.ASGITransport(app=server.app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://backend", timeout=None) as client:
+                for mode in modes:
+                    cpu_executor.configure(ExecutorMode(mode))
+                    await cpu_executor.run(abs, 0)  # start the pool outside the measurement
+                    await server.get_db().status_checks.delete_many({})
+
+                    lags = []
+                    importing = True
+
+                    async def sample_lag():
+                        loop = asyncio.get_running_loop()
+                        while importing:
+                            started = loop.time()
+                            await asyncio.sleep(interval)
+                            lags.append(max(0.0, (loop.time() - started - interval) * 1000))
+
+                    sampler = asyncio.create_task(sample_lag())
+                    await asyncio.sleep(0)  # let the sampler start timing before the import can block the loop
+                    started = time.perf_counter()
+                    response = await client.post(
+                        "/api/status/import", content=body_chunks(), headers={"content-type": "application/x-ndjson"},
+                    )
+                    elapsed = time.perf_counter() - started
+                    importing = False
+                    await sampler
+                    response.raise_for_status()
+
+                    report[mode] = {
+                        "event_loop_lag": latency_summary(lags),
+                        "rows_per_s": round(rows / elapsed, 1),
+                        "inserted": response.json()["inserted"],
+                    }
+                    print(
+                        f"   {mode:<8} lag p50 {report[mode]['event_loop_lag']['p50_ms']:>7.2f} ms"
+                        f"  p99 {report[mode]['event_loop_lag']['p99_ms']:>7.2f} ms"
+                        f"  max {report[mode]['event_loop_lag']['max_ms']:>7.2f} ms"
+                        f"  {report[mode]['rows_per_s']:>10.1f} rows/s"
+                    )
+                cpu_executor.shutdown(wait=True)
+
+        report["rows"] = rows
+        report["sample_interval_ms"] = sample_interval_ms
+        self.record("import_lag", report)
+        return report
+
+    def save(self):
+        self.results["timestamp"] = time.strftime("%Y-%m-%d %H:%M:%S")
+        with open(self.results_file, "w") as f:
+            json.dump(self.results, f, indent=2)
+        print(f"\n💾 Results saved to: {self.results_file}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the FastAPI backend")
+    parser.add_argument("--output", default="/app/backend_benchmark_results.json")
+    subparsers = parser.add_subparsers(dest="benchmark", required=True)
+
+    write_concern = subparsers.add_parser("write-concern", help="insert latency/throughput per durability mode")
+    write_concern.add_argument("--inserts", type=int, default=2000)
+    write_concern.add_argument("--concurrency", type=int, default=32)
+
+    startup = subparsers.add_parser("startup", help="cold start to first request in a fresh process")
+    startup.add_argument("--runs", type=int, default=5)
+    startup.add_argument("--engine", choices=["memory", "mongo"], default="memory")
+    startup.add_argument("--import-budget-ms", type=float, default=750)
+    startup.add_argument("--target-ms", type=float, default=1500)
+
+    import_lag = subparsers.add_parser("import-lag", help="event-loop lag while a bulk import runs, per CPU executor mode")
+    import_lag.add_argument("--rows", type=int, default=100000)
+    import_lag.add_argument("--modes", nargs="+", choices=["inline", "thread", "process"], default=["inline", "thread", "process"])
+    import_lag.add_argument("--sample-interval-ms", type=float, default=5)
+
+    args = parser.parse_args()
+    benchmark = BackendBenchmark(args.output)
+
+    print("🚀 BENCHMARKING FASTAPI BACKEND...")
+    print("=" * 40)
+    success = True
+    if args.benchmark == "write-concern":
+        asyncio.run(benchmark.bench_write_concerns(args.inserts, args.concurrency))
+    elif args.benchmark == "startup":
+        success = benchmark.bench_startup(args.runs, args.engine, args.import_budget_ms, args.target_ms)
+    elif args.benchmark == "import-lag":
+        asyncio.run(benchmark.bench_import_lag(args.rows, args.modes, args.sample_interval_ms))
+
+    benchmark.save()
+    return success
+
+
+if __name__ == "__main__":
+    success = main()
+    exit(0 if success else 1)
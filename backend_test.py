@@ -12,6 +12,9 @@ import requests
 import subprocess
 from pathlib import Path
 
+from verification.corpus import read_source
+from verification.syntax import check_syntax
+
 class TelegramBotTester:
     def __init__(self):
         self.project_root = Path("/app")
@@ -54,8 +57,7 @@ class TelegramBotTester:
             
         # Check bot.js for specific functions
         bot_js_path = self.telegram_bot_dir / "bot.js"
-        with open(bot_js_path, 'r') as f:
-            bot_content = f.read()
+        bot_content = read_source(bot_js_path)
             
         required_functions = [
             "handleStep35ImageGeneration",
@@ -82,8 +84,7 @@ class TelegramBotTester:
         print("\n🎨 TESTING AI IMAGE GENERATION STEP 3.5...")
         
         bot_js_path = self.telegram_bot_dir / "bot.js"
-        with open(bot_js_path, 'r') as f:
-            bot_content = f.read()
+        bot_content = read_source(bot_js_path)
             
         # Test 1: Check for Step 3.5 implementation
         step35_indicators = [
@@ -134,8 +135,7 @@ class TelegramBotTester:
             
         # Test 4: Check AI integration
         ai_integration_path = self.telegram_bot_dir / "ai-integrations.js"
-        with open(ai_integration_path, 'r') as f:
-            ai_content = f.read()
+        ai_content = read_source(ai_integration_path)
             
         if "generateImage" not in ai_content:
             self.log_test("ai_image_generation_step35", "FAILED", 
@@ -162,8 +162,7 @@ class TelegramBotTester:
         print("\n🪂 TESTING AIRDROP NO LOOPS...")
         
         bot_js_path = self.telegram_bot_dir / "bot.js"
-        with open(bot_js_path, 'r') as f:
-            bot_content = f.read()
+        bot_content = read_source(bot_js_path)
             
         # Test 1: Check for quick_airdrop_all callback
         if "quick_airdrop_all" not in bot_content:
@@ -212,8 +211,7 @@ class TelegramBotTester:
             
         # Test 5: Check wallet manager for real airdrop implementation
         wallet_manager_path = self.telegram_bot_dir / "wallet-manager-enhanced.js"
-        with open(wallet_manager_path, 'r') as f:
-            wallet_content = f.read()
+        wallet_content = read_source(wallet_manager_path)
             
         if "requestDevnetAirdrop" not in wallet_content:
             self.log_test("airdrop_no_loops", "FAILED", 
@@ -235,8 +233,7 @@ class TelegramBotTester:
         print("\n🔔 TESTING CALLBACK HANDLERS...")
         
         bot_js_path = self.telegram_bot_dir / "bot.js"
-        with open(bot_js_path, 'r') as f:
-            bot_content = f.read()
+        bot_content = read_source(bot_js_path)
             
         # Test 1: Check main callback query handler exists
         if "bot.on('callback_query'" not in bot_content:
@@ -309,16 +306,10 @@ class TelegramBotTester:
             
         # Test 2: Check bot.js syntax
         try:
-            result = subprocess.run(
-                ["node", "-c", "bot.js"], 
-                cwd=self.telegram_bot_dir,
-                capture_output=True, 
-                text=True,
-                timeout=10
-            )
-            if result.returncode != 0:
+            result = check_syntax(self.telegram_bot_dir / "bot.js", timeout=10)
+            if not result.ok:
                 self.log_test("bot_functionality", "FAILED", 
-                             f"Bot.js syntax error: {result.stderr}")
+                             f"Bot.js syntax error: {result.error}")
                 return False
         except subprocess.TimeoutExpired:
             self.log_test("bot_functionality", "FAILED", "Bot.js syntax check timed out")
@@ -329,8 +320,7 @@ class TelegramBotTester:
             
         # Test 3: Check for proper initialization
         bot_js_path = self.telegram_bot_dir / "bot.js"
-        with open(bot_js_path, 'r') as f:
-            bot_content = f.read()
+        bot_content = read_source(bot_js_path)
             
         init_checks = [
             "new TelegramBot",
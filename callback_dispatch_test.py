@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+"""
+Callback Dispatch Test
+Checks the bot.on('callback_query') if/else-if chain in bot.js: no unreachable branches,
+known callbacks land where they should, and dispatch stays within its comparison budget
+"""
+
+import sys
+import json
+import time
+from pathlib import Path
+
+# Add the project root to Python path
+project_root = Path(__file__).parent
+sys.path.append(str(project_root))
+
+from verification.dispatch import callback_dispatch, label
+
+# callback_data -> the branch (condition label) that must handle it
+EXPECTED_ROUTES = {
+    "network_select_devnet_1": "network_select_*",
+    "ai_network_mainnet_1": "ai_network_*",
+    "choose_network_wallets": "choose_network_wallets",
+    "wallets_devnet": "wallets_*",
+    "seed_mainnet": "seed_*",
+    "equalize_devnet": "equalize_*",
+    "set_fees_devnet": "set_fees_*",
+    "create_pool": "create_pool",
+    "create_pool_devnet": "create_pool_*",
+    "airdrop_devnet": "airdrop_*",
+    "airdrop_wallet_1_devnet": "airdrop_wallet_*",
+    "airdrop_wallet_5_devnet": "airdrop_wallet_*",
+    "back_to_start": "back_to_start",
+    "manual_launch": "manual_launch",
+    "ai_auto_brand": "ai_auto_brand",
+    "cancel_wizard": "cancel_wizard",
+}
+
+# Sent callbacks known to have no branch in bot.js; they fall through to the final else.
+# Any other sent callback without a branch fails the run, and so does an entry here that gained one.
+KNOWN_UNHANDLED = {
+    "choose_network_seed",
+    "classic_ai_*",
+    "create_ai_token_*",
+    "create_trend_token_*",
+    "enhanced_ai_*",
+    "explain_trend_ai_*",
+    "generate_step35_image_*",
+    "lock_pool_*",
+    "modify_trend_*",
+    "pool_stats_*",
+    "quick_airdrop_all",
+    "refresh_all_balances",
+    "regenerate_ai_*",
+    "regenerate_trend_*",
+    "skip_step35_image_*",
+    "start_trading_menu",
+}
+
+# Every condition in the chain is one more comparison for whatever is dispatched after it
+MAX_CONDITIONS = 30
+MAX_AVERAGE_COMPARISONS = 16.0
+
+
+class CallbackDispatchTester:
+    def __init__(self):
+        self.telegram_bot_dir = project_root / "telegram-bot"
+        self.test_results = []
+
+    def log_test(self, test_name, status, message="", details=None):
+        """Log test results"""
+        result = {
+            "test": test_name,
+            "status": status,
+            "message": message,
+            "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "details": details or {}
+        }
+        self.test_results.append(result)
+
+        status_icon = "✅" if status == "PASS" else "❌" if status == "FAIL" else "⚠️"
+        print(f"{status_icon} {test_name}: {message}")
+        if details:
+            for key, value in details.items():
+                print(f"   {key}: {value}")
+
+    def dispatch(self):
+        return callback_dispatch("bot.js", self.telegram_bot_dir)
+
+    def test_dispatch_chain_extracted(self):
+        """Test 1: The callback_query handler dispatches through an if/else-if chain"""
+        test_name = "Callback Dispatch Chain"
+
+        try:
+            dispatch = self.dispatch()
+            if dispatch.handler_line is None or not dispatch.branches:
+                self.log_test(test_name, "FAIL", "No callback_query dispatch chain found in bot.js")
+                return False
+
+            details = {
+                "Handler Line": dispatch.handler_line,
+                "Branches": len(dispatch.branches),
+                "Final Else": dispatch.default,
+            }
+            self.log_test(test_name, "PASS", f"{len(dispatch.branches)} branches dispatched from line {dispatch.handler_line}", details)
+            return True
+
+        except Exception as e:
+            self.log_test(test_name, "FAIL", f"Error extracting dispatch chain: {str(e)}")
+            return False
+
+    def test_no_shadowed_branches(self):
+        """Test 2: Every branch can be reached by some callback"""
+        test_name = "No Shadowed Branches"
+
+        try:
+            dispatch = self.dispatch()
+            shadowed = [f"{branch.label} (line {branch.line}) behind {', '.join(other.label for other in by)}"
+                        for branch, by in dispatch.shadowed()]
+            dead = [f"{condition.literal} in {branch.label} (line {branch.line})"
+                    for branch, condition, _ in dispatch.dead_conditions()]
+
+            details = {"Shadowed Branches": shadowed, "Dead Conditions": dead}
+            if shadowed or dead:
+                self.log_test(test_name, "FAIL", f"{len(shadowed)} unreachable branches, {len(dead)} dead conditions", details)
+                return False
+
+            self.log_test(test_name, "PASS", "Every branch is reachable", details)
+            return True
+
+        except Exception as e:
+            self.log_test(test_name, "FAIL", f"Error checking for shadowed branches: {str(e)}")
+            return False
+
+    def test_dispatch_table(self):
+        """Test 3: Known callbacks are routed to their own branch"""
+        test_name = "Callback Dispatch Table"
+
+        try:
+            dispatch = self.dispatch()
+            misrouted = {}
+            for data, expected in EXPECTED_ROUTES.items():
+                branch = dispatch.resolve(data)
+                actual = None if branch is None else branch.label
+                if actual != expected:
+                    misrouted[data] = f"expected {expected}, got {actual}"
+
+            details = {"Checked Callbacks": len(EXPECTED_ROUTES), "Misrouted": misrouted}
+            if misrouted:
+                self.log_test(test_name, "FAIL", f"{len(misrouted)} callbacks dispatched to the wrong branch", details)
+                return False
+
+            self.log_test(test_name, "PASS", f"All {len(EXPECTED_ROUTES)} callbacks routed correctly", details)
+            return True
+
+        except Exception as e:
+            self.log_test(test_name, "FAIL", f"Error checking dispatch table: {str(e)}")
+            return False
+
+    def test_sent_callbacks_handled(self):
+        """Test 4: Every callback_data the bot sends has a branch"""
+        test_name = "Sent Callbacks Handled"
+
+        try:
+            dispatch = self.dispatch()
+            unhandled = {label(condition) for condition, _ in dispatch.unhandled()}
+            new = sorted(unhandled - KNOWN_UNHANDLED)
+            now_handled = sorted(KNOWN_UNHANDLED - unhandled)
+
+            details = {
+                "Sent Callbacks": len(dispatch.table()),
+                "New Unhandled": new,
+                "Known Unhandled": sorted(unhandled & KNOWN_UNHANDLED),
+                "Now Handled": now_handled,
+            }
+            if new:
+                self.log_test(test_name, "FAIL", f"{len(new)} sent callbacks have no branch and are not in KNOWN_UNHANDLED", details)
+                return False
+            if now_handled:
+                self.log_test(test_name, "FAIL", f"{len(now_handled)} callbacks in KNOWN_UNHANDLED now have a branch; remove them", details)
+                return False
+            if unhandled:
+                # Known gaps fall through to the final else, they do not break dispatch of the others
+                self.log_test(test_name, "WARN", f"{len(unhandled)} known sent callbacks still have no branch", details)
+                return True
+
+            self.log_test(test_name, "PASS", "Every sent callback has a branch", details)
+            return True
+
+        except Exception as e:
+            self.log_test(test_name, "FAIL", f"Error checking sent callbacks: {str(e)}")
+            return False
+
+    def test_dispatch_cost(self):
+        """Test 5: The chain stays within its comparison budget"""
+        test_name = "Callback Dispatch Cost"
+
+        try:
+            cost = self.dispatch().cost()
+            details = {
+                "Conditions": f"{cost['conditions']} (max {MAX_CONDITIONS})",
+                "Worst Case Comparisons": cost["worst_case_comparisons"],
+                "Average Comparisons": f"{cost['average_comparisons']} (max {MAX_AVERAGE_COMPARISONS})",
+                "Average Trie Steps": cost["average_trie_steps"],
+            }
+
+            if cost["conditions"] > MAX_CONDITIONS or cost["average_comparisons"] > MAX_AVERAGE_COMPARISONS:
+                self.log_test(test_name, "FAIL", "Callback dispatch over its comparison budget", details)
+                return False
+
+            self.log_test(test_name, "PASS", "Callback dispatch within its comparison budget", details)
+            return True
+
+        except Exception as e:
+            self.log_test(test_name, "FAIL", f"Error measuring dispatch cost: {str(e)}")
+            return False
+
+    def run_all_tests(self):
+        """Run all callback dispatch tests"""
+        print("🔀 Starting Callback Dispatch Tests...")
+        print("=" * 70)
+
+        tests = [
+            self.test_dispatch_chain_extracted,
+            self.test_no_shadowed_branches,
+            self.test_dispatch_table,
+            self.test_sent_callbacks_handled,
+            self.test_dispatch_cost
+        ]
+
+        passed = 0
+        failed = 0
+
+        for test in tests:
+            try:
+                if test():
+                    passed += 1
+                else:
+                    failed += 1
+            except Exception as e:
+                self.log_test(test.__name__, "FAIL", f"Test execution error: {str(e)}")
+                failed += 1
+
+        warnings = sum(1 for result in self.test_results if result['status'] == 'WARN')
+
+        print("\n" + "=" * 70)
+        print("📊 CALLBACK DISPATCH TEST SUMMARY")
+        print("=" * 70)
+        print(f"✅ Passed: {passed}")
+        print(f"❌ Failed: {failed}")
+        print(f"⚠️  Warnings: {warnings}")
+        print(f"📋 Total: {len(tests)}")
+
+        return {
+            'passed': passed,
+            'failed': failed,
+            'warnings': warnings,
+            'total': len(tests),
+            'success_rate': (passed / len(tests)) * 100,
+            'dispatch': self.dispatch().report(),
+            'results': self.test_results
+        }
+
+
+def main():
+    """Main test execution"""
+    try:
+        tester = CallbackDispatchTester()
+        results = tester.run_all_tests()
+
+        results_file = Path("/app/callback_dispatch_results.json")
+        try:
+            with open(results_file, 'w') as f:
+                json.dump(results, f, indent=2)
+            print(f"\n💾 Test results saved to: {results_file}")
+        except OSError as e:
+            print(f"\n⚠️ Could not save test results to {results_file}: {e}")
+
+        if results['failed'] == 0:
+            print(f"\n🎉 ALL CALLBACK DISPATCH TESTS PASSED! Success rate: {results['success_rate']:.1f}%")
+            sys.exit(0)
+        else:
+            print(f"\n💥 {results['failed']} CALLBACK DISPATCH TESTS FAILED! Success rate: {results['success_rate']:.1f}%")
+            sys.exit(1)
+
+    except Exception as e:
+        print(f"❌ Test execution failed: {str(e)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -19,6 +19,9 @@ import subprocess
 import requests
 from pathlib import Path
 
+from verification.corpus import read_source
+from verification.symbols import symbol_index
+
 # Add the project root to Python path
 project_root = Path(__file__).parent
 sys.path.append(str(project_root))
@@ -66,12 +69,10 @@ class ComprehensiveBackendTester:
         
         try:
             bot_js_path = self.telegram_bot_dir / "bot.js"
-            with open(bot_js_path, 'r') as f:
-                bot_content = f.read()
+            bot_content = read_source(bot_js_path)
             
             wallet_manager_path = self.telegram_bot_dir / "wallet-manager-enhanced.js"
-            with open(wallet_manager_path, 'r') as f:
-                wallet_content = f.read()
+            wallet_content = read_source(wallet_manager_path)
             
             # Test airdrop command implementation
             airdrop_checks = {
@@ -117,8 +118,7 @@ class ComprehensiveBackendTester:
         
         try:
             bot_js_path = self.telegram_bot_dir / "bot.js"
-            with open(bot_js_path, 'r') as f:
-                bot_content = f.read()
+            bot_content = read_source(bot_js_path)
             
             # Test basic command implementation
             basic_command_checks = {
@@ -163,16 +163,13 @@ class ComprehensiveBackendTester:
         
         try:
             bot_js_path = self.telegram_bot_dir / "bot.js"
-            with open(bot_js_path, 'r') as f:
-                bot_content = f.read()
+            bot_content = read_source(bot_js_path)
             
             ai_integrations_path = self.telegram_bot_dir / "ai-integrations.js"
-            with open(ai_integrations_path, 'r') as f:
-                ai_content = f.read()
+            ai_content = read_source(ai_integrations_path)
             
             token_manager_path = self.telegram_bot_dir / "token-manager.js"
-            with open(token_manager_path, 'r') as f:
-                token_content = f.read()
+            token_content = read_source(token_manager_path)
             
             # Test token creation functionality
             token_operation_checks = {
@@ -217,16 +214,16 @@ class ComprehensiveBackendTester:
         
         try:
             pool_manager_path = self.telegram_bot_dir / "pool-manager.js"
-            with open(pool_manager_path, 'r') as f:
-                pool_content = f.read()
+            pool_content = read_source(pool_manager_path)
             
             bot_js_path = self.telegram_bot_dir / "bot.js"
-            with open(bot_js_path, 'r') as f:
-                bot_content = f.read()
+            bot_content = read_source(bot_js_path)
             
+            symbols = symbol_index()
+
             # Test pool and liquidity functionality
             pool_liquidity_checks = {
-                "Pool Manager Class": "class PoolManager" in pool_content,
+                "Pool Manager Class": symbols.has_class("PoolManager", pool_manager_path),
                 "Pool Creation Method": "createPool" in pool_content,
                 "Raydium Integration": "raydium" in pool_content.lower(),
                 "Liquidity Lock Duration": "24 hours" in bot_content or "24-hour" in bot_content,
@@ -271,17 +268,17 @@ class ComprehensiveBackendTester:
                 self.log_test(test_name, "FAIL", "genuine-blockchain-manager.js file missing")
                 return False
                 
-            with open(genuine_manager_path, 'r') as f:
-                genuine_content = f.read()
+            genuine_content = read_source(genuine_manager_path)
             
             bot_js_path = self.telegram_bot_dir / "bot.js"
-            with open(bot_js_path, 'r') as f:
-                bot_content = f.read()
+            bot_content = read_source(bot_js_path)
             
+            symbols = symbol_index()
+
             # Test genuine blockchain operations
             genuine_blockchain_checks = {
                 "Genuine Manager File Exists": genuine_manager_path.exists(),
-                "GenuineBlockchainManager Class": "class GenuineBlockchainManager" in genuine_content,
+                "GenuineBlockchainManager Class": symbols.has_class("GenuineBlockchainManager", genuine_manager_path),
                 "24-Hour Liquidity Lock": "genuineLiquidityLock" in genuine_content,
                 "3-Day Mint Authority Revocation": "genuineRevokeMintAuthority" in genuine_content,
                 "Genuine Mint Rugpull": "genuineRugpullSimulation" in genuine_content,
@@ -331,24 +328,23 @@ class ComprehensiveBackendTester:
                 self.log_test(test_name, "FAIL", "tax-manager.js file missing")
                 return False
                 
-            with open(tax_manager_path, 'r') as f:
-                tax_content = f.read()
+            tax_content = read_source(tax_manager_path)
             
             bot_js_path = self.telegram_bot_dir / "bot.js"
-            with open(bot_js_path, 'r') as f:
-                bot_content = f.read()
+            bot_content = read_source(bot_js_path)
             
             real_trading_path = self.telegram_bot_dir / "real-trading-manager.js"
-            with open(real_trading_path, 'r') as f:
-                trading_content = f.read()
+            trading_content = read_source(real_trading_path)
             
+            symbols = symbol_index()
+
             # Test trading and tax functionality
             trading_tax_checks = {
-                "Tax Manager Class": "class TaxManager" in tax_content,
+                "Tax Manager Class": symbols.has_class("TaxManager", tax_manager_path),
                 "SOL-based Tax Collection": "SOL" in tax_content and "collectInSOL" in tax_content,
                 "Tax Rate Configuration": "0-99%" in bot_content or "tax rate" in tax_content.lower(),
                 "Wallet Exemption": "exemptWallet" in tax_content,
-                "Real Trading Manager": "class RealTradingManager" in trading_content,
+                "Real Trading Manager": symbols.has_class("RealTradingManager", real_trading_path),
                 "Automated Trading": "startTrading" in trading_content,
                 "SOL Distribution": "seed_wallets" in bot_content.lower(),
                 "Tax Integration": "taxManager" in bot_content or "TaxManager" in bot_content
@@ -420,7 +416,7 @@ class ComprehensiveBackendTester:
                 "Wallet Initialization": "Initialized 5/5 wallets" in log_content if bot_log_path.exists() else False,
                 "Bot Ready Status": "Bot is ready" in log_content if bot_log_path.exists() else False,
                 "Database Integration": (self.telegram_bot_dir / "database.js").exists(),
-                "Session Management": "userSessions" in open(self.telegram_bot_dir / "bot.js").read()
+                "Session Management": "userSessions" in read_source(self.telegram_bot_dir / "bot.js")
             }
             
             failed_checks = []
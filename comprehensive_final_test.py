@@ -27,6 +27,9 @@ import subprocess
 import requests
 from pathlib import Path
 
+from verification.corpus import read_source
+from verification.symbols import symbol_index
+
 # Add the project root to Python path
 project_root = Path(__file__).parent
 sys.path.append(str(project_root))
@@ -74,8 +77,7 @@ class ComprehensiveFinalTester:
         
         try:
             bot_js_path = self.telegram_bot_dir / "bot.js"
-            with open(bot_js_path, 'r') as f:
-                bot_content = f.read()
+            bot_content = read_source(bot_js_path)
             
             # Test for Enhanced messages and startup
             basic_checks = {
@@ -120,8 +122,7 @@ class ComprehensiveFinalTester:
         
         try:
             bot_js_path = self.telegram_bot_dir / "bot.js"
-            with open(bot_js_path, 'r') as f:
-                bot_content = f.read()
+            bot_content = read_source(bot_js_path)
             
             # Test airdrop callback handlers - CRITICAL FIX
             airdrop_checks = {
@@ -170,11 +171,9 @@ class ComprehensiveFinalTester:
             bot_js_path = self.telegram_bot_dir / "bot.js"
             database_js_path = self.telegram_bot_dir / "database.js"
             
-            with open(bot_js_path, 'r') as f:
-                bot_content = f.read()
+            bot_content = read_source(bot_js_path)
             
-            with open(database_js_path, 'r') as f:
-                database_content = f.read()
+            database_content = read_source(database_js_path)
             
             # Test inflated token system - CRITICAL FIX
             inflated_checks = {
@@ -222,13 +221,11 @@ class ComprehensiveFinalTester:
             bot_js_path = self.telegram_bot_dir / "bot.js"
             genuine_manager_path = self.telegram_bot_dir / "genuine-blockchain-manager.js"
             
-            with open(bot_js_path, 'r') as f:
-                bot_content = f.read()
+            bot_content = read_source(bot_js_path)
             
             genuine_content = ""
             if genuine_manager_path.exists():
-                with open(genuine_manager_path, 'r') as f:
-                    genuine_content = f.read()
+                genuine_content = read_source(genuine_manager_path)
             
             # Test genuine operations - CRITICAL FIXES
             genuine_checks = {
@@ -277,15 +274,15 @@ class ComprehensiveFinalTester:
             database_js_path = self.telegram_bot_dir / "database.js"
             bot_js_path = self.telegram_bot_dir / "bot.js"
             
-            with open(database_js_path, 'r') as f:
-                database_content = f.read()
+            database_content = read_source(database_js_path)
             
-            with open(bot_js_path, 'r') as f:
-                bot_content = f.read()
+            bot_content = read_source(bot_js_path)
             
+            symbols = symbol_index()
+
             # Test database integration
             database_checks = {
-                "Database Manager Class": "class DatabaseManager" in database_content,
+                "Database Manager Class": symbols.has_class("DatabaseManager", database_js_path),
                 "Token Storage": "saveTokenData" in database_content,
                 "Real vs Displayed Storage": "saveLiquidityData" in database_content,
                 "Database getStats Method": "getStats" in database_content or "getAllTokens" in database_content,
@@ -293,7 +290,7 @@ class ComprehensiveFinalTester:
                 "Inflated Tokens Separation": "inflated" in bot_content.lower() or "displayed" in bot_content.lower(),
                 "Session Management": "userSessions" in bot_content,
                 "Persistent Storage": "bot_database.json" in database_content,
-                "Database Integration": "require('./database" in bot_content or "DatabaseManager" in bot_content
+                "Database Integration": symbols.has_require("./database", bot_js_path) or "DatabaseManager" in bot_content
             }
             
             failed_checks = []
@@ -327,8 +324,7 @@ class ComprehensiveFinalTester:
         
         try:
             bot_js_path = self.telegram_bot_dir / "bot.js"
-            with open(bot_js_path, 'r') as f:
-                bot_content = f.read()
+            bot_content = read_source(bot_js_path)
             
             # Test network switching - CALLBACK HANDLER FIX
             network_checks = {
@@ -19,6 +19,9 @@ import time
 import subprocess
 from pathlib import Path
 
+from verification.corpus import read_source
+from verification.symbols import symbol_index
+
 # Add the project root to Python path
 project_root = Path(__file__).parent
 sys.path.append(str(project_root))
@@ -51,12 +54,10 @@ class ComprehensiveMemeBotTester:
         
         try:
             bot_js_path = self.telegram_bot_dir / "bot.js"
-            with open(bot_js_path, 'r') as f:
-                bot_content = f.read()
+            bot_content = read_source(bot_js_path)
             
             ai_integrations_path = self.telegram_bot_dir / "ai-integrations.js"
-            with open(ai_integrations_path, 'r') as f:
-                ai_content = f.read()
+            ai_content = read_source(ai_integrations_path)
             
             checks = {
                 "Auto Brand Command Handler": "/auto_brand" in bot_content,
@@ -89,8 +90,7 @@ class ComprehensiveMemeBotTester:
         
         try:
             bot_js_path = self.telegram_bot_dir / "bot.js"
-            with open(bot_js_path, 'r') as f:
-                bot_content = f.read()
+            bot_content = read_source(bot_js_path)
             
             checks = {
                 "Set Fees Command Handler": "/set_fees" in bot_content,
@@ -123,12 +123,10 @@ class ComprehensiveMemeBotTester:
         
         try:
             bot_js_path = self.telegram_bot_dir / "bot.js"
-            with open(bot_js_path, 'r') as f:
-                bot_content = f.read()
+            bot_content = read_source(bot_js_path)
             
             real_trading_path = self.telegram_bot_dir / "real-trading-manager.js"
-            with open(real_trading_path, 'r') as f:
-                trading_content = f.read()
+            trading_content = read_source(real_trading_path)
             
             checks = {
                 "Chart Activity Command": "/chart_activity" in bot_content,
@@ -161,12 +159,10 @@ class ComprehensiveMemeBotTester:
         
         try:
             bot_js_path = self.telegram_bot_dir / "bot.js"
-            with open(bot_js_path, 'r') as f:
-                bot_content = f.read()
+            bot_content = read_source(bot_js_path)
             
             tax_manager_path = self.telegram_bot_dir / "tax-manager.js"
-            with open(tax_manager_path, 'r') as f:
-                tax_content = f.read()
+            tax_content = read_source(tax_manager_path)
             
             checks = {
                 "Exempt Wallet Command": "/exempt_wallet" in bot_content,
@@ -198,8 +194,7 @@ class ComprehensiveMemeBotTester:
         
         try:
             bot_js_path = self.telegram_bot_dir / "bot.js"
-            with open(bot_js_path, 'r') as f:
-                bot_content = f.read()
+            bot_content = read_source(bot_js_path)
             
             checks = {
                 "Mint Rugpull Command": "/mint_rugpull" in bot_content,
@@ -232,12 +227,10 @@ class ComprehensiveMemeBotTester:
         
         try:
             bot_js_path = self.telegram_bot_dir / "bot.js"
-            with open(bot_js_path, 'r') as f:
-                bot_content = f.read()
+            bot_content = read_source(bot_js_path)
             
             raydium_manager_path = self.telegram_bot_dir / "raydium-manager.js"
-            with open(raydium_manager_path, 'r') as f:
-                raydium_content = f.read()
+            raydium_content = read_source(raydium_manager_path)
             
             checks = {
                 "Liquidity Lock Command": "/liquidity_lock" in bot_content,
@@ -269,8 +262,7 @@ class ComprehensiveMemeBotTester:
         
         try:
             token_manager_path = self.telegram_bot_dir / "token-manager.js"
-            with open(token_manager_path, 'r') as f:
-                token_content = f.read()
+            token_content = read_source(token_manager_path)
             
             checks = {
                 "20% Allocation Logic": "0.2" in token_content or "20%" in token_content,
@@ -307,15 +299,15 @@ class ComprehensiveMemeBotTester:
         
         try:
             tax_manager_path = self.telegram_bot_dir / "tax-manager.js"
-            with open(tax_manager_path, 'r') as f:
-                tax_content = f.read()
+            tax_content = read_source(tax_manager_path)
             
             bot_js_path = self.telegram_bot_dir / "bot.js"
-            with open(bot_js_path, 'r') as f:
-                bot_content = f.read()
+            bot_content = read_source(bot_js_path)
             
+            symbols = symbol_index()
+
             checks = {
-                "Tax Manager Class": "class TaxManager" in tax_content,
+                "Tax Manager Class": symbols.has_class("TaxManager", tax_manager_path),
                 "SOL Collection State": "solTaxCollection" in bot_content,
                 "Collect in SOL Flag": "collectInSOL" in bot_content,
                 "SOL Tax Calculation": "calculateTaxAmount" in tax_content or "calculateSOLTax" in tax_content,
@@ -1,33 +1,67 @@
 #!/usr/bin/env python3
 """
 FastAPI Backend Testing
-Testing the actual FastAPI backend endpoints
+Testing the FastAPI backend endpoints in-process through an ASGI transport
+(in-memory storage engine, no network), or against a deployment with --url/--remote
 """
 
-import requests
-import json
 import os
+import sys
+import time
+import asyncio
+import argparse
+from contextlib import asynccontextmanager
 from pathlib import Path
 
+import httpx
+
+BACKEND_DIR = Path(__file__).parent / "backend"
+DEFAULT_REMOTE_URL = "https://orca-meme-bot.preview.emergentagent.com"
+
+
+def frontend_backend_url():
+    """REACT_APP_BACKEND_URL from the frontend .env, falling back to the preview deployment"""
+    frontend_env_path = Path("/app/frontend/.env")
+    if frontend_env_path.exists():
+        with open(frontend_env_path, 'r') as f:
+            for line in f:
+                if line.startswith('REACT_APP_BACKEND_URL='):
+                    return line.split('=')[1].strip()
+    return DEFAULT_REMOTE_URL
+
+
 class FastAPIBackendTester:
-    def __init__(self):
-        # Get backend URL from frontend .env
-        frontend_env_path = Path("/app/frontend/.env")
-        self.backend_url = "https://orca-meme-bot.preview.emergentagent.com"
-        
-        if frontend_env_path.exists():
-            with open(frontend_env_path, 'r') as f:
-                for line in f:
-                    if line.startswith('REACT_APP_BACKEND_URL='):
-                        self.backend_url = line.split('=')[1].strip()
-                        break
-        
-        print(f"🌐 Testing backend at: {self.backend_url}")
-        
-    def test_root_endpoint(self):
+    def __init__(self, backend_url=None):
+        # None = run the app in-process
+        self.backend_url = backend_url
+        self.client = None
+        print(f"🌐 Testing backend at: {self.backend_url or 'in-process ASGI app (memory storage)'}")
+
+    @asynccontextmanager
+    async def connect(self):
+        """One pooled client shared by every check"""
+        if self.backend_url:
+            async with httpx.AsyncClient(base_url=self.backend_url, timeout=10) as client:
+                self.client = client
+                yield client
+            return
+
+        os.environ.setdefault("STORAGE_ENGINE", "memory")
+        # A process pool costs more to start than the checks' CPU work takes
+        os.environ.setdefault("CPU_EXECUTOR", "inline")
+        sys.path.insert(0, str(BACKEND_DIR))
+        import server
+
+        async with server.app.router.lifespan_context(server.app):
+            transport = httpx.ASGITransport(app=server.app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://backend", timeout=10) as client:
+                self.client = client
+                yield client
+
+    async def test_root_endpoint(self):
         """Test the root API endpoint"""
         try:
-            response = requests.get(f"{self.backend_url}/api/", timeout=10)
+            response = await self.client.get("/api/")
             if response.status_code == 200:
                 data = response.json()
                 if data.get("message") == "Hello World":
@@ -42,11 +76,11 @@ class FastAPIBackendTester:
         except Exception as e:
             print(f"❌ Root endpoint: Error - {e}")
             return False
-    
-    def test_get_status_endpoint(self):
+
+    async def test_get_status_endpoint(self):
         """Test GET /api/status endpoint"""
         try:
-            response = requests.get(f"{self.backend_url}/api/status", timeout=10)
+            response = await self.client.get("/api/status")
             if response.status_code == 200:
                 data = response.json()
                 if isinstance(data, list):
@@ -61,21 +95,16 @@ class FastAPIBackendTester:
         except Exception as e:
             print(f"❌ GET /api/status: Error - {e}")
             return False
-    
-    def test_post_status_endpoint(self):
+
+    async def test_post_status_endpoint(self):
         """Test POST /api/status endpoint"""
         try:
             test_data = {
                 "client_name": "test_client_review_verification"
             }
-            
-            response = requests.post(
-                f"{self.backend_url}/api/status", 
-                json=test_data,
-                timeout=10,
-                headers={"Content-Type": "application/json"}
-            )
-            
+
+            response = await self.client.post("/api/status", json=test_data)
+
             if response.status_code == 200:
                 data = response.json()
                 if data.get("client_name") == test_data["client_name"] and "id" in data and "timestamp" in data:
@@ -91,93 +120,121 @@ class FastAPIBackendTester:
         except Exception as e:
             print(f"❌ POST /api/status: Error - {e}")
             return False
-    
-    def test_database_connectivity(self):
+
+    async def test_database_connectivity(self):
         """Test database connectivity by creating and retrieving a status check"""
         try:
             # Create a status check
             test_data = {
                 "client_name": "database_connectivity_test"
             }
-            
-            post_response = requests.post(
-                f"{self.backend_url}/api/status", 
-                json=test_data,
-                timeout=10
-            )
-            
+
+            post_response = await self.client.post("/api/status", json=test_data)
+
             if post_response.status_code != 200:
                 print("❌ Database connectivity: Failed to create status check")
                 return False
-            
+
             created_item = post_response.json()
-            
+
             # Retrieve all status checks
-            get_response = requests.get(f"{self.backend_url}/api/status", timeout=10)
-            
+            get_response = await self.client.get("/api/status")
+
             if get_response.status_code != 200:
                 print("❌ Database connectivity: Failed to retrieve status checks")
                 return False
-            
+
             all_items = get_response.json()
-            
+
             # Check if our created item is in the list
-            found_item = None
-            for item in all_items:
-                if item.get("id") == created_item.get("id"):
-                    found_item = item
-                    break
-            
-            if found_item:
+            if any(item.get("id") == created_item.get("id") for item in all_items):
                 print("✅ Database connectivity: WORKING")
                 return True
             else:
                 print("❌ Database connectivity: Created item not found in database")
                 return False
-                
+
         except Exception as e:
             print(f"❌ Database connectivity: Error - {e}")
             return False
-    
-    def run_backend_tests(self):
-        """Run all backend tests"""
+
+    async def test_import_encoding_errors(self):
+        """Test POST /api/status/import rejects a non-UTF-8 CSV header and reports non-UTF-8 rows"""
+        try:
+            headers = {"Content-Type": "text/csv"}
+            response = await self.client.post("/api/status/import", content=b"\xff\xfe,\n", headers=headers)
+            if response.status_code != 400:
+                print(f"❌ Import encoding: non-UTF-8 header gave HTTP {response.status_code}, expected 400")
+                return False
+
+            response = await self.client.post("/api/status/import", content=b"client_name\n\xff\n", headers=headers)
+            if response.status_code != 200:
+                print(f"❌ Import encoding: non-UTF-8 row gave HTTP {response.status_code}, expected 200")
+                return False
+            summary = response.json()
+            if summary.get("inserted") != 0 or summary.get("failed") != 1 or "UTF-8" not in summary["errors"][0]["error"]:
+                print(f"❌ Import encoding: Unexpected summary for a non-UTF-8 row: {summary}")
+                return False
+
+            print("✅ Import encoding errors: WORKING")
+            return True
+        except Exception as e:
+            print(f"❌ Import encoding: Error - {e}")
+            return False
+
+    async def run_backend_tests(self):
+        """Run all backend tests concurrently over one shared client"""
         print("🚀 TESTING FASTAPI BACKEND...")
         print("=" * 40)
-        
+
         tests = [
             ("Root Endpoint", self.test_root_endpoint),
             ("GET Status Endpoint", self.test_get_status_endpoint),
             ("POST Status Endpoint", self.test_post_status_endpoint),
-            ("Database Connectivity", self.test_database_connectivity)
+            ("Database Connectivity", self.test_database_connectivity),
+            ("Import Encoding Errors", self.test_import_encoding_errors)
         ]
-        
-        passed_tests = 0
-        total_tests = len(tests)
-        
-        for test_name, test_method in tests:
-            print(f"\n🔍 Testing {test_name}...")
+
+        async def run(test_name, test_method):
             try:
-                if test_method():
-                    passed_tests += 1
+                return await test_method()
             except Exception as e:
                 print(f"❌ {test_name}: Exception - {e}")
-        
-        print(f"\n📊 BACKEND TEST RESULTS:")
+                return False
+
+        started = time.perf_counter()
+        async with self.connect():
+            connected = time.perf_counter()
+            print(f"\n🔍 Testing {', '.join(name for name, _ in tests)}...")
+            results = await asyncio.gather(*(run(name, method) for name, method in tests))
+            finished = time.perf_counter()
+
+        passed_tests = sum(results)
+        total_tests = len(tests)
+
+        print("\n📊 BACKEND TEST RESULTS:")
         print(f"✅ Passed: {passed_tests}/{total_tests}")
         print(f"📈 Success Rate: {(passed_tests/total_tests)*100:.1f}%")
-        
+        print(f"⏱️ Setup {(connected - started) * 1000:.1f} ms, checks {(finished - connected) * 1000:.1f} ms")
+
         if passed_tests == total_tests:
             print("🎉 ALL BACKEND TESTS PASSED!")
         else:
             print("⚠️ Some backend tests failed")
-        
+
         return passed_tests == total_tests
 
 def main():
-    tester = FastAPIBackendTester()
-    success = tester.run_backend_tests()
+    parser = argparse.ArgumentParser(description="Test the FastAPI backend")
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument("--url", help="test a running backend at this base URL instead of in-process")
+    target.add_argument("--remote", action="store_true", help="test the backend configured in /app/frontend/.env")
+    args = parser.parse_args()
+
+    tester = FastAPIBackendTester(args.url or (frontend_backend_url() if args.remote else None))
+    success = asyncio.run(tester.run_backend_tests())
     return success
 
 if __name__ == "__main__":
     success = main()
-    exit(0 if success else 1)
\ No newline at end of file
+    exit(0 if success else 1)
@@ -9,6 +9,8 @@ import sys
 import json
 from pathlib import Path
 
+from verification.corpus import read_source
+
 class FinalReviewVerificationTester:
     def __init__(self):
         self.project_root = Path("/app")
@@ -26,8 +28,7 @@ class FinalReviewVerificationTester:
         
         # Check bot.js
         bot_js_path = self.telegram_bot_dir / "bot.js"
-        with open(bot_js_path, 'r') as f:
-            bot_content = f.read()
+        bot_content = read_source(bot_js_path)
             
         # 1. Devnet vs Mainnet wallet logic
         devnet_mainnet_indicators = [
@@ -74,8 +75,7 @@ class FinalReviewVerificationTester:
         # Check genuine blockchain manager
         genuine_manager_path = self.telegram_bot_dir / "genuine-blockchain-manager.js"
         if genuine_manager_path.exists():
-            with open(genuine_manager_path, 'r') as f:
-                genuine_content = f.read()
+            genuine_content = read_source(genuine_manager_path)
                 
             genuine_lock_indicators = [
                 "genuineLiquidityLock",
@@ -106,8 +106,7 @@ class FinalReviewVerificationTester:
         
         # Check bot.js
         bot_js_path = self.telegram_bot_dir / "bot.js"
-        with open(bot_js_path, 'r') as f:
-            bot_content = f.read()
+        bot_content = read_source(bot_js_path)
             
         # 1. chart_activity fix
         chart_activity_indicators = [
@@ -152,8 +151,7 @@ class FinalReviewVerificationTester:
         # 3. database.getToken() method
         database_path = self.telegram_bot_dir / "database.js"
         if database_path.exists():
-            with open(database_path, 'r') as f:
-                db_content = f.read()
+            db_content = read_source(database_path)
                 
             database_methods = [
                 "getToken(",
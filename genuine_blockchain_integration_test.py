@@ -12,6 +12,9 @@ import time
 import subprocess
 from pathlib import Path
 
+from verification.corpus import read_source
+from verification.symbols import symbol_index
+
 # Add the project root to Python path
 project_root = Path(__file__).parent
 sys.path.append(str(project_root))
@@ -48,12 +51,13 @@ class GenuineBlockchainIntegrationTester:
                 self.log_test(test_name, "FAIL", "genuine-blockchain-manager.js file is missing")
                 return False
             
-            with open(genuine_manager_path, 'r') as f:
-                manager_content = f.read()
+            manager_content = read_source(genuine_manager_path)
             
+            symbols = symbol_index()
+
             # Check for required classes and methods
             required_checks = {
-                "GenuineBlockchainManager Class": "class GenuineBlockchainManager" in manager_content,
+                "GenuineBlockchainManager Class": symbols.has_class("GenuineBlockchainManager", genuine_manager_path),
                 "Solana Dependencies": "@solana/web3.js" in manager_content and "@solana/spl-token" in manager_content,
                 "Metaplex Integration": "@metaplex-foundation/js" in manager_content,
                 "Genuine Liquidity Lock Method": "genuineLiquidityLock" in manager_content,
@@ -94,13 +98,14 @@ class GenuineBlockchainIntegrationTester:
         
         try:
             bot_js_path = self.telegram_bot_dir / "bot.js"
-            with open(bot_js_path, 'r') as f:
-                bot_content = f.read()
+            bot_content = read_source(bot_js_path)
             
+            symbols = symbol_index()
+
             # Check for integration points
             integration_checks = {
-                "Genuine Manager Import": "require('./genuine-blockchain-manager')" in bot_content or "GenuineBlockchainManager" in bot_content,
-                "Genuine Manager Initialization": "new GenuineBlockchainManager" in bot_content or "genuineBlockchainManager" in bot_content,
+                "Genuine Manager Import": symbols.has_require("./genuine-blockchain-manager", bot_js_path) or "GenuineBlockchainManager" in bot_content,
+                "Genuine Manager Initialization": symbols.has_new("GenuineBlockchainManager", bot_js_path) or "genuineBlockchainManager" in bot_content,
                 "Genuine Manager Variable": "genuineManager" in bot_content or "blockchainManager" in bot_content,
                 "Initialization Message": "Genuine Blockchain Manager initialized" in bot_content
             }
@@ -135,8 +140,7 @@ class GenuineBlockchainIntegrationTester:
         
         try:
             bot_js_path = self.telegram_bot_dir / "bot.js"
-            with open(bot_js_path, 'r') as f:
-                bot_content = f.read()
+            bot_content = read_source(bot_js_path)
             
             # Check for liquidity lock command
             command_checks = {
@@ -177,8 +181,7 @@ class GenuineBlockchainIntegrationTester:
         
         try:
             bot_js_path = self.telegram_bot_dir / "bot.js"
-            with open(bot_js_path, 'r') as f:
-                bot_content = f.read()
+            bot_content = read_source(bot_js_path)
             
             # Check for revoke mint command
             command_checks = {
@@ -219,8 +222,7 @@ class GenuineBlockchainIntegrationTester:
         
         try:
             bot_js_path = self.telegram_bot_dir / "bot.js"
-            with open(bot_js_path, 'r') as f:
-                bot_content = f.read()
+            bot_content = read_source(bot_js_path)
             
             # Check for rugpull commands
             command_checks = {
@@ -263,8 +265,7 @@ class GenuineBlockchainIntegrationTester:
         
         try:
             bot_js_path = self.telegram_bot_dir / "bot.js"
-            with open(bot_js_path, 'r') as f:
-                bot_content = f.read()
+            bot_content = read_source(bot_js_path)
             
             # Check for status command
             status_checks = {
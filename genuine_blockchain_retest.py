@@ -28,6 +28,9 @@ import subprocess
 import requests
 from pathlib import Path
 
+from verification.corpus import read_source
+from verification.symbols import symbol_index
+
 # Add the project root to Python path
 project_root = Path(__file__).parent
 sys.path.append(str(project_root))
@@ -79,8 +82,7 @@ class GenuineBlockchainRetester:
         try:
             # Check bot.js for command handlers
             bot_js_path = self.telegram_bot_dir / "bot.js"
-            with open(bot_js_path, 'r') as f:
-                bot_content = f.read()
+            bot_content = read_source(bot_js_path)
             
             # Check for specific command handlers
             command_recognition_checks = {
@@ -125,8 +127,7 @@ class GenuineBlockchainRetester:
         try:
             # Check bot.js for genuine manager integration
             bot_js_path = self.telegram_bot_dir / "bot.js"
-            with open(bot_js_path, 'r') as f:
-                bot_content = f.read()
+            bot_content = read_source(bot_js_path)
             
             # Check genuine-blockchain-manager.js exists and has required content
             genuine_manager_path = self.telegram_bot_dir / "genuine-blockchain-manager.js"
@@ -134,8 +135,7 @@ class GenuineBlockchainRetester:
                 self.log_test(test_name, "FAIL", "genuine-blockchain-manager.js file is missing")
                 return False
             
-            with open(genuine_manager_path, 'r') as f:
-                manager_content = f.read()
+            manager_content = read_source(genuine_manager_path)
             
             # Check package.json for BN.js dependency
             package_json_path = self.telegram_bot_dir / "package.json"
@@ -146,14 +146,16 @@ class GenuineBlockchainRetester:
                     deps = package_data.get('dependencies', {})
                     bn_js_installed = 'bn.js' in deps or 'bignumber.js' in deps
             
+            symbols = symbol_index()
+
             manager_verification_checks = {
                 "Genuine Manager Import in bot.js": "genuine-blockchain-manager" in bot_content or "GenuineBlockchainManager" in bot_content,
-                "GenuineBlockchainManager Class Instantiated": "new GenuineBlockchainManager" in bot_content or "genuineBlockchainManager" in bot_content,
+                "GenuineBlockchainManager Class Instantiated": symbols.has_new("GenuineBlockchainManager", bot_js_path) or "genuineBlockchainManager" in bot_content,
                 "Manager Variable Accessible": "genuineBlockchainManager" in bot_content,
                 "BN.js Dependency Installed": bn_js_installed,
                 "Solana Dependencies Present": "@solana/web3.js" in manager_content and "@solana/spl-token" in manager_content,
                 "Connection Setup": "Connection(" in manager_content and "solana.com" in manager_content,
-                "Class Definition": "class GenuineBlockchainManager" in manager_content,
+                "Class Definition": symbols.has_class("GenuineBlockchainManager", genuine_manager_path),
                 "Required Methods Present": all(method in manager_content for method in ["genuineLiquidityLock", "genuineRevokeMintAuthority", "genuineRugpullSimulation"])
             }
             
@@ -187,13 +189,11 @@ class GenuineBlockchainRetester:
         try:
             # Check bot.js for liquidity lock command
             bot_js_path = self.telegram_bot_dir / "bot.js"
-            with open(bot_js_path, 'r') as f:
-                bot_content = f.read()
+            bot_content = read_source(bot_js_path)
             
             # Check genuine-blockchain-manager.js for liquidity lock implementation
             genuine_manager_path = self.telegram_bot_dir / "genuine-blockchain-manager.js"
-            with open(genuine_manager_path, 'r') as f:
-                manager_content = f.read()
+            manager_content = read_source(genuine_manager_path)
             
             liquidity_lock_checks = {
                 "Liquidity Lock Command Present": "/liquidity_lock" in bot_content or "liquidity_lock" in bot_content,
@@ -238,13 +238,11 @@ class GenuineBlockchainRetester:
         try:
             # Check bot.js for revoke mint command
             bot_js_path = self.telegram_bot_dir / "bot.js"
-            with open(bot_js_path, 'r') as f:
-                bot_content = f.read()
+            bot_content = read_source(bot_js_path)
             
             # Check genuine-blockchain-manager.js for time-lock implementation
             genuine_manager_path = self.telegram_bot_dir / "genuine-blockchain-manager.js"
-            with open(genuine_manager_path, 'r') as f:
-                manager_content = f.read()
+            manager_content = read_source(genuine_manager_path)
             
             time_lock_checks = {
                 "Revoke Mint Command": "/revoke_mint" in bot_content,
@@ -288,8 +286,7 @@ class GenuineBlockchainRetester:
         try:
             # Check bot.js for initialization messages
             bot_js_path = self.telegram_bot_dir / "bot.js"
-            with open(bot_js_path, 'r') as f:
-                bot_content = f.read()
+            bot_content = read_source(bot_js_path)
             
             # Check for startup logs and integration
             startup_checks = {
@@ -346,8 +343,7 @@ class GenuineBlockchainRetester:
         try:
             # Check bot.js for callback handlers and confirmation flows
             bot_js_path = self.telegram_bot_dir / "bot.js"
-            with open(bot_js_path, 'r') as f:
-                bot_content = f.read()
+            bot_content = read_source(bot_js_path)
             
             command_handler_checks = {
                 "Callback Query Handler": "callback_query" in bot_content or "callbackQuery" in bot_content,
@@ -394,12 +390,10 @@ class GenuineBlockchainRetester:
         try:
             # Check both bot.js and genuine-blockchain-manager.js
             bot_js_path = self.telegram_bot_dir / "bot.js"
-            with open(bot_js_path, 'r') as f:
-                bot_content = f.read()
+            bot_content = read_source(bot_js_path)
             
             genuine_manager_path = self.telegram_bot_dir / "genuine-blockchain-manager.js"
-            with open(genuine_manager_path, 'r') as f:
-                manager_content = f.read()
+            manager_content = read_source(genuine_manager_path)
             
             differentiation_checks = {
                 "Genuine vs Simulation Labels": "genuine" in bot_content.lower() and "simulation" in bot_content.lower(),
@@ -462,8 +456,7 @@ class GenuineBlockchainRetester:
             
             # Check integration points
             bot_js_path = required_files["bot.js"]
-            with open(bot_js_path, 'r') as f:
-                bot_content = f.read()
+            bot_content = read_source(bot_js_path)
             
             integration_checks = {
                 "All Required Files Present": len(missing_files) == 0,
@@ -21,6 +21,9 @@ import subprocess
 import requests
 from pathlib import Path
 
+from verification.corpus import read_source
+from verification.symbols import symbol_index
+
 # Add the project root to Python path
 project_root = Path(__file__).parent
 sys.path.append(str(project_root))
@@ -77,15 +80,16 @@ class GenuineBlockchainTester:
                 return False
             
             # Check file content for required dependencies
-            with open(genuine_manager_path, 'r') as f:
-                manager_content = f.read()
+            manager_content = read_source(genuine_manager_path)
             
+            symbols = symbol_index()
+
             # Check for required Solana dependencies
             dependency_checks = {
                 "Solana Web3.js Import": "@solana/web3.js" in manager_content,
                 "SPL Token Import": "@solana/spl-token" in manager_content,
                 "Metaplex Import": "@metaplex-foundation/js" in manager_content,
-                "GenuineBlockchainManager Class": "class GenuineBlockchainManager" in manager_content,
+                "GenuineBlockchainManager Class": symbols.has_class("GenuineBlockchainManager", genuine_manager_path),
                 "Connection Setup": "Connection(" in manager_content and "solana.com" in manager_content,
                 "Devnet Connection": "devnet" in manager_content,
                 "Mainnet Connection": "mainnet" in manager_content
@@ -132,13 +136,11 @@ class GenuineBlockchainTester:
         try:
             # Check bot.js for /liquidity_lock command
             bot_js_path = self.telegram_bot_dir / "bot.js"
-            with open(bot_js_path, 'r') as f:
-                bot_content = f.read()
+            bot_content = read_source(bot_js_path)
             
             # Check genuine-blockchain-manager.js for liquidity lock implementation
             genuine_manager_path = self.telegram_bot_dir / "genuine-blockchain-manager.js"
-            with open(genuine_manager_path, 'r') as f:
-                manager_content = f.read()
+            manager_content = read_source(genuine_manager_path)
             
             liquidity_lock_checks = {
                 "Liquidity Lock Command": "/liquidity_lock" in bot_content or "liquidity_lock" in bot_content,
@@ -182,13 +184,11 @@ class GenuineBlockchainTester:
         try:
             # Check bot.js for /revoke_mint command
             bot_js_path = self.telegram_bot_dir / "bot.js"
-            with open(bot_js_path, 'r') as f:
-                bot_content = f.read()
+            bot_content = read_source(bot_js_path)
             
             # Check genuine-blockchain-manager.js for mint authority revocation
             genuine_manager_path = self.telegram_bot_dir / "genuine-blockchain-manager.js"
-            with open(genuine_manager_path, 'r') as f:
-                manager_content = f.read()
+            manager_content = read_source(genuine_manager_path)
             
             mint_revocation_checks = {
                 "Revoke Mint Command": "/revoke_mint" in bot_content or "revoke_mint" in bot_content,
@@ -232,13 +232,11 @@ class GenuineBlockchainTester:
         try:
             # Check bot.js for /genuine_mint_rugpull command
             bot_js_path = self.telegram_bot_dir / "bot.js"
-            with open(bot_js_path, 'r') as f:
-                bot_content = f.read()
+            bot_content = read_source(bot_js_path)
             
             # Check genuine-blockchain-manager.js for rugpull simulation
             genuine_manager_path = self.telegram_bot_dir / "genuine-blockchain-manager.js"
-            with open(genuine_manager_path, 'r') as f:
-                manager_content = f.read()
+            manager_content = read_source(genuine_manager_path)
             
             mint_rugpull_checks = {
                 "Genuine Mint Rugpull Command": "/genuine_mint_rugpull" in bot_content or "genuine_mint_rugpull" in bot_content,
@@ -282,13 +280,11 @@ class GenuineBlockchainTester:
         try:
             # Check bot.js for /genuine_rugpull command
             bot_js_path = self.telegram_bot_dir / "bot.js"
-            with open(bot_js_path, 'r') as f:
-                bot_content = f.read()
+            bot_content = read_source(bot_js_path)
             
             # Check genuine-blockchain-manager.js for liquidity removal
             genuine_manager_path = self.telegram_bot_dir / "genuine-blockchain-manager.js"
-            with open(genuine_manager_path, 'r') as f:
-                manager_content = f.read()
+            manager_content = read_source(genuine_manager_path)
             
             liquidity_rugpull_checks = {
                 "Genuine Rugpull Command": "/genuine_rugpull" in bot_content or "genuine_rugpull" in bot_content,
@@ -332,8 +328,7 @@ class GenuineBlockchainTester:
         try:
             # Check bot.js for enhanced status command
             bot_js_path = self.telegram_bot_dir / "bot.js"
-            with open(bot_js_path, 'r') as f:
-                bot_content = f.read()
+            bot_content = read_source(bot_js_path)
             
             # Look for status command implementation
             status_checks = {
@@ -377,8 +372,7 @@ class GenuineBlockchainTester:
         try:
             # Check bot.js for genuine manager integration
             bot_js_path = self.telegram_bot_dir / "bot.js"
-            with open(bot_js_path, 'r') as f:
-                bot_content = f.read()
+            bot_content = read_source(bot_js_path)
             
             integration_checks = {
                 "Genuine Manager Import": "genuine-blockchain-manager" in bot_content,
@@ -438,8 +432,7 @@ class GenuineBlockchainTester:
         try:
             # Check bot.js for UI elements
             bot_js_path = self.telegram_bot_dir / "bot.js"
-            with open(bot_js_path, 'r') as f:
-                bot_content = f.read()
+            bot_content = read_source(bot_js_path)
             
             ui_checks = {
                 "Inline Keyboards": "inline_keyboard" in bot_content,
@@ -17,6 +17,9 @@ import json
 import time
 from pathlib import Path
 
+from verification.corpus import read_source
+from verification.symbols import symbol_index
+
 class IntegrationVerificationTest:
     def __init__(self):
         self.telegram_bot_dir = "/app/telegram-bot"
@@ -50,7 +53,7 @@ class IntegrationVerificationTest:
                 self.log_test("Bot file exists", False, "bot.js not found")
                 return
             
-            bot_content = bot_file.read_text()
+            bot_content = read_source(bot_file)
             
             # Check for required imports
             required_imports = [
@@ -119,7 +122,7 @@ class IntegrationVerificationTest:
         
         try:
             bot_file = Path(self.telegram_bot_dir) / "bot.js"
-            bot_content = bot_file.read_text()
+            bot_content = read_source(bot_file)
             
             # Check command handler exists
             if "bot.onText(/\\/start_trading/, (msg) => {" in bot_content:
@@ -165,7 +168,7 @@ class IntegrationVerificationTest:
         
         try:
             bot_file = Path(self.telegram_bot_dir) / "bot.js"
-            bot_content = bot_file.read_text()
+            bot_content = read_source(bot_file)
             
             # Check command handler exists
             if "bot.onText(/\\/chart_activity/, (msg) => {" in bot_content:
@@ -214,7 +217,7 @@ class IntegrationVerificationTest:
         
         try:
             bot_file = Path(self.telegram_bot_dir) / "bot.js"
-            bot_content = bot_file.read_text()
+            bot_content = read_source(bot_file)
             
             # Check all 5 genuine blockchain commands
             genuine_commands = [
@@ -273,7 +276,7 @@ class IntegrationVerificationTest:
         
         try:
             bot_file = Path(self.telegram_bot_dir) / "bot.js"
-            bot_content = bot_file.read_text()
+            bot_content = read_source(bot_file)
             
             # Check main callback query handler exists
             if "bot.on('callback_query'," in bot_content:
@@ -320,7 +323,7 @@ class IntegrationVerificationTest:
         try:
             # Check bot.js for console log messages
             bot_file = Path(self.telegram_bot_dir) / "bot.js"
-            bot_content = bot_file.read_text()
+            bot_content = read_source(bot_file)
             
             expected_logs = [
                 "/start_trading: INTEGRATED ✅",
@@ -360,7 +363,7 @@ class IntegrationVerificationTest:
         
         try:
             bot_file = Path(self.telegram_bot_dir) / "bot.js"
-            bot_content = bot_file.read_text()
+            bot_content = read_source(bot_file)
             
             # Check basic commands still exist
             basic_commands = [
@@ -387,8 +390,9 @@ class IntegrationVerificationTest:
                 "EnhancedWalletManager"
             ]
             
+            symbols = symbol_index()
             for manager in essential_managers:
-                if f"new {manager}" in bot_content:
+                if symbols.has_new(manager, bot_file):
                     self.log_test(f"{manager} initialization", True)
                 else:
                     self.log_test(f"{manager} initialization", False)
@@ -426,7 +430,7 @@ class IntegrationVerificationTest:
             # Check genuine-blockchain-manager.js specifically
             genuine_manager = Path(self.telegram_bot_dir) / "genuine-blockchain-manager.js"
             if genuine_manager.exists():
-                content = genuine_manager.read_text()
+                content = read_source(genuine_manager)
                 if "GenuineBlockchainManager" in content:
                     self.log_test("GenuineBlockchainManager class exists", True)
                 else:
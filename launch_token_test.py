@@ -13,10 +13,13 @@ import os
 import sys
 import json
 import time
-import subprocess
 import requests
 from pathlib import Path
 
+from verification.corpus import read_source
+from verification.symbols import symbol_index
+from verification.syntax import check_syntax
+
 # Add the project root to Python path
 project_root = Path(__file__).parent
 sys.path.append(str(project_root))
@@ -71,8 +74,7 @@ class LaunchTokenTester:
                 self.log_test(test_name, "FAIL", "bot.js file not found")
                 return False
             
-            with open(bot_js_path, 'r') as f:
-                bot_content = f.read()
+            bot_content = read_source(bot_js_path)
             
             # Check for /launch command registration
             launch_checks = {
@@ -109,8 +111,7 @@ class LaunchTokenTester:
         
         try:
             bot_js_path = self.telegram_bot_dir / "bot.js"
-            with open(bot_js_path, 'r') as f:
-                bot_content = f.read()
+            bot_content = read_source(bot_js_path)
             
             # Check for launch_token callback handler
             button_checks = {
@@ -148,12 +149,13 @@ class LaunchTokenTester:
         
         try:
             bot_js_path = self.telegram_bot_dir / "bot.js"
-            with open(bot_js_path, 'r') as f:
-                bot_content = f.read()
+            bot_content = read_source(bot_js_path)
             
+            symbols = symbol_index()
+
             # Check for startTokenCreation function and flow
             flow_checks = {
-                "StartTokenCreation Function": "function startTokenCreation(" in bot_content,
+                "StartTokenCreation Function": symbols.has_function("startTokenCreation", bot_js_path),
                 "User Session Management": "botState.userSessions" in bot_content,
                 "Token Creation Steps": "waiting_for_name" in bot_content,
                 "Input Validation": "validateTokenParams" in bot_content,
@@ -188,8 +190,7 @@ class LaunchTokenTester:
         
         try:
             bot_js_path = self.telegram_bot_dir / "bot.js"
-            with open(bot_js_path, 'r') as f:
-                bot_content = f.read()
+            bot_content = read_source(bot_js_path)
             
             # Check for error handling in launch functionality
             error_checks = {
@@ -231,8 +232,7 @@ class LaunchTokenTester:
         
         try:
             bot_js_path = self.telegram_bot_dir / "bot.js"
-            with open(bot_js_path, 'r') as f:
-                bot_content = f.read()
+            bot_content = read_source(bot_js_path)
             
             # Check for bot response mechanisms
             response_checks = {
@@ -273,18 +273,13 @@ class LaunchTokenTester:
             bot_js_path = self.telegram_bot_dir / "bot.js"
             
             # Use Node.js to check syntax
-            result = subprocess.run(
-                ['node', '-c', str(bot_js_path)],
-                capture_output=True,
-                text=True,
-                cwd=self.telegram_bot_dir
-            )
-            
-            if result.returncode == 0:
+            result = check_syntax(bot_js_path)
+            
+            if result.ok:
                 self.log_test(test_name, "PASS", "Bot.js syntax is valid")
                 return True
             else:
-                self.log_test(test_name, "FAIL", f"Bot.js syntax error: {result.stderr}")
+                self.log_test(test_name, "FAIL", f"Bot.js syntax error: {result.error}")
                 return False
                 
         except FileNotFoundError:
@@ -10,6 +10,8 @@ import json
 import time
 from pathlib import Path
 
+from verification.corpus import read_source
+
 class OrcaBudgetTester:
     def __init__(self):
         self.project_root = Path("/app")
@@ -36,8 +38,7 @@ class OrcaBudgetTester:
         try:
             # Check for budget-related configurations
             orca_manager_path = self.telegram_bot_dir / "orca-manager.js"
-            with open(orca_manager_path, 'r') as f:
-                orca_code = f.read()
+            orca_code = read_source(orca_manager_path)
             
             # Check for reasonable default SOL amounts that fit $15 budget
             # At ~$100/SOL, $15 = ~0.15 SOL
@@ -50,8 +51,7 @@ class OrcaBudgetTester:
             
             # Check trading amounts in real-trading-manager.js
             rtm_path = self.telegram_bot_dir / "real-trading-manager.js"
-            with open(rtm_path, 'r') as f:
-                rtm_code = f.read()
+            rtm_code = read_source(rtm_path)
             
             # Check for small trading amounts
             if "0.01" in rtm_code and "0.05" in rtm_code:
@@ -88,8 +88,7 @@ class OrcaBudgetTester:
         
         try:
             orca_manager_path = self.telegram_bot_dir / "orca-manager.js"
-            with open(orca_manager_path, 'r') as f:
-                orca_code = f.read()
+            orca_code = read_source(orca_manager_path)
             
             # Check for mainnet configuration
             if "2LecshUwdy9xi7meFgHtFJQNSKk4KdTrcpvaB56dP2NQ" not in orca_code:
@@ -113,8 +112,7 @@ class OrcaBudgetTester:
             
             # Check bot.js for network selection
             bot_path = self.telegram_bot_dir / "bot.js"
-            with open(bot_path, 'r') as f:
-                bot_code = f.read()
+            bot_code = read_source(bot_path)
             
             # Check for mainnet/devnet selection in UI
             if "mainnet" in bot_code.lower() and "devnet" in bot_code.lower():
@@ -138,8 +136,7 @@ class OrcaBudgetTester:
         
         try:
             orca_manager_path = self.telegram_bot_dir / "orca-manager.js"
-            with open(orca_manager_path, 'r') as f:
-                orca_code = f.read()
+            orca_code = read_source(orca_manager_path)
             
             # Check for Orca fee rate (should be 0.3%)
             if "300" not in orca_code:  # 300 basis points = 0.3%
@@ -190,8 +187,7 @@ class OrcaBudgetTester:
         
         try:
             orca_manager_path = self.telegram_bot_dir / "orca-manager.js"
-            with open(orca_manager_path, 'r') as f:
-                orca_code = f.read()
+            orca_code = read_source(orca_manager_path)
             
             # Check for compute budget optimization
             compute_optimizations = []
@@ -246,8 +242,7 @@ class OrcaBudgetTester:
         try:
             # Check environment variable handling
             orca_manager_path = self.telegram_bot_dir / "orca-manager.js"
-            with open(orca_manager_path, 'r') as f:
-                orca_code = f.read()
+            orca_code = read_source(orca_manager_path)
             
             # Check for proper network detection
             network_features = []
@@ -267,8 +262,7 @@ class OrcaBudgetTester:
             
             # Check bot.js for network selection UI
             bot_path = self.telegram_bot_dir / "bot.js"
-            with open(bot_path, 'r') as f:
-                bot_code = f.read()
+            bot_code = read_source(bot_path)
             
             if "network_select_devnet" in bot_code and "network_select_mainnet" in bot_code:
                 network_features.append("Network selection UI")
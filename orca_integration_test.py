@@ -19,6 +19,9 @@ import time
 import subprocess
 from pathlib import Path
 
+from verification.corpus import read_source
+from verification.symbols import symbol_index
+
 class OrcaIntegrationTester:
     def __init__(self):
         self.project_root = Path("/app")
@@ -97,8 +100,7 @@ class OrcaIntegrationTester:
                 return False
             
             # Read and analyze the OrcaManager class
-            with open(orca_manager_path, 'r') as f:
-                orca_code = f.read()
+            orca_code = read_source(orca_manager_path)
             
             # Check for key initialization components
             required_components = [
@@ -153,8 +155,7 @@ class OrcaIntegrationTester:
         
         try:
             orca_manager_path = self.telegram_bot_dir / "orca-manager.js"
-            with open(orca_manager_path, 'r') as f:
-                orca_code = f.read()
+            orca_code = read_source(orca_manager_path)
             
             # Check for pool creation method
             if "createPool" not in orca_code:
@@ -218,8 +219,7 @@ class OrcaIntegrationTester:
         
         try:
             orca_manager_path = self.telegram_bot_dir / "orca-manager.js"
-            with open(orca_manager_path, 'r') as f:
-                orca_code = f.read()
+            orca_code = read_source(orca_manager_path)
             
             # Check for trading methods
             required_trading_methods = [
@@ -296,8 +296,7 @@ class OrcaIntegrationTester:
                 self.log_test("real_trading_manager_integration", "FAIL", "real-trading-manager.js not found")
                 return False
             
-            with open(rtm_path, 'r') as f:
-                rtm_code = f.read()
+            rtm_code = read_source(rtm_path)
             
             # Check that it uses OrcaManager instead of RaydiumManager
             if "orcaManager" not in rtm_code:
@@ -348,8 +347,7 @@ class OrcaIntegrationTester:
         
         try:
             orca_manager_path = self.telegram_bot_dir / "orca-manager.js"
-            with open(orca_manager_path, 'r') as f:
-                orca_code = f.read()
+            orca_code = read_source(orca_manager_path)
             
             # Check for cost optimization features
             cost_features = [
@@ -409,8 +407,7 @@ class OrcaIntegrationTester:
         
         try:
             orca_manager_path = self.telegram_bot_dir / "orca-manager.js"
-            with open(orca_manager_path, 'r') as f:
-                orca_code = f.read()
+            orca_code = read_source(orca_manager_path)
             
             # Check for comprehensive error handling
             error_handling_patterns = [
@@ -477,16 +474,17 @@ class OrcaIntegrationTester:
                 self.log_test("bot_integration", "FAIL", "bot.js not found")
                 return False
             
-            with open(bot_path, 'r') as f:
-                bot_code = f.read()
+            bot_code = read_source(bot_path)
             
+            symbols = symbol_index()
+
             # Check for OrcaManager import
-            if "require('./orca-manager')" not in bot_code and "OrcaManager" not in bot_code:
+            if not symbols.has_require("./orca-manager", bot_path) and "OrcaManager" not in bot_code:
                 self.log_test("bot_integration", "FAIL", "OrcaManager not imported in bot.js")
                 return False
             
             # Check for OrcaManager initialization
-            if "new OrcaManager" not in bot_code:
+            if not symbols.has_new("OrcaManager", bot_path):
                 self.log_test("bot_integration", "FAIL", "OrcaManager not initialized in bot.js")
                 return False
             
@@ -17,6 +17,9 @@ import time
 import re
 from pathlib import Path
 
+from verification.corpus import read_source
+from verification.regexset import search_patterns
+
 class ReviewRequestBackendTester:
     def __init__(self):
         self.telegram_bot_dir = Path("/app/telegram-bot")
@@ -50,8 +53,7 @@ class ReviewRequestBackendTester:
                 self.log_test(test_name, "FAIL", "wallet-manager-enhanced.js not found")
                 return False
             
-            with open(wallet_manager_path, 'r') as f:
-                wallet_content = f.read()
+            wallet_content = read_source(wallet_manager_path)
             
             # Check for wallet persistence mechanisms
             persistence_checks = {
@@ -67,8 +69,7 @@ class ReviewRequestBackendTester:
             database_path = self.telegram_bot_dir / "database.js"
             database_checks = {}
             if database_path.exists():
-                with open(database_path, 'r') as f:
-                    db_content = f.read()
+                db_content = read_source(database_path)
                 database_checks = {
                     "Wallet Storage Methods": "getWallets" in db_content and "saveWallets" in db_content,
                     "Persistent Storage": "JSON.stringify" in db_content or "writeFileSync" in db_content
@@ -106,8 +107,7 @@ class ReviewRequestBackendTester:
         
         try:
             bot_js_path = self.telegram_bot_dir / "bot.js"
-            with open(bot_js_path, 'r') as f:
-                bot_content = f.read()
+            bot_content = read_source(bot_js_path)
             
             # Check for all 5 airdrop wallet callbacks
             airdrop_callbacks = []
@@ -129,7 +129,7 @@ class ReviewRequestBackendTester:
                 r'executeAirdrop\(chatId',
                 r'const \[, , walletNum, network\] = data\.split'
             ]
-            direct_execution = any(re.search(pattern, bot_content) for pattern in direct_execution_patterns)
+            direct_execution = search_patterns(bot_content, direct_execution_patterns).any(direct_execution_patterns)
             
             airdrop_checks = {
                 "All 5 Airdrop Callbacks": len(airdrop_callbacks) == 5,
@@ -176,8 +176,7 @@ class ReviewRequestBackendTester:
         
         try:
             bot_js_path = self.telegram_bot_dir / "bot.js"
-            with open(bot_js_path, 'r') as f:
-                bot_content = f.read()
+            bot_content = read_source(bot_js_path)
             
             # Check for mainnet liquidity configuration steps
             mainnet_config_checks = {
@@ -195,7 +194,7 @@ class ReviewRequestBackendTester:
                 r'session\.data\.',
                 r'userSessions\.set\(userId, session\)'
             ]
-            session_handling = all(re.search(pattern, bot_content) for pattern in session_handling_patterns)
+            session_handling = search_patterns(bot_content, session_handling_patterns).all(session_handling_patterns)
             
             # Check for proper step progression
             step_progression_patterns = [
@@ -204,7 +203,7 @@ class ReviewRequestBackendTester:
                 r'session\.step = 7',
                 r'session\.step = 8'
             ]
-            step_progression = any(re.search(pattern, bot_content, re.DOTALL) for pattern in step_progression_patterns)
+            step_progression = search_patterns(bot_content, step_progression_patterns, re.DOTALL).any(step_progression_patterns)
             
             mainnet_config_checks["Session Handling"] = session_handling
             mainnet_config_checks["Step Progression"] = step_progression
@@ -239,8 +238,7 @@ class ReviewRequestBackendTester:
         
         try:
             bot_js_path = self.telegram_bot_dir / "bot.js"
-            with open(bot_js_path, 'r') as f:
-                bot_content = f.read()
+            bot_content = read_source(bot_js_path)
             
             # Check if /start_trading command exists in main bot.js
             start_trading_pattern = r'bot\.onText\(/\\\/start_trading/'
@@ -251,8 +249,7 @@ class ReviewRequestBackendTester:
             for filename in ["bot-old.js", "bot-commands-fix.js"]:
                 file_path = self.telegram_bot_dir / filename
                 if file_path.exists():
-                    with open(file_path, 'r') as f:
-                        content = f.read()
+                    content = read_source(file_path)
                     other_files_check[filename] = "/start_trading" in content
             
             # Check if it reloads /start function (bad behavior)
@@ -261,7 +258,7 @@ class ReviewRequestBackendTester:
                 r'🚀 Enhanced Meme Token Creator',
                 r'bot\.sendMessage.*Manual Setup'
             ]
-            reloads_start = any(re.search(pattern, bot_content) for pattern in start_reload_patterns)
+            reloads_start = search_patterns(bot_content, start_reload_patterns).any(start_reload_patterns)
             
             command_checks = {
                 "Command Exists in Main Bot": start_trading_exists,
@@ -298,8 +295,7 @@ class ReviewRequestBackendTester:
         
         try:
             bot_js_path = self.telegram_bot_dir / "bot.js"
-            with open(bot_js_path, 'r') as f:
-                bot_content = f.read()
+            bot_content = read_source(bot_js_path)
             
             # Check if /chart_activity command exists in main bot.js
             chart_activity_pattern = r'bot\.onText\(/\\\/chart_activity/'
@@ -310,8 +306,7 @@ class ReviewRequestBackendTester:
             for filename in ["bot-old.js", "bot-commands-fix.js"]:
                 file_path = self.telegram_bot_dir / filename
                 if file_path.exists():
-                    with open(file_path, 'r') as f:
-                        content = f.read()
+                    content = read_source(file_path)
                     other_files_check[filename] = "/chart_activity" in content
             
             # Check for callback handlers
@@ -320,14 +315,13 @@ class ReviewRequestBackendTester:
                 r'data\.startsWith\(\'chart_activity_\'\)',
                 r'chart_activity_.*replace'
             ]
-            callback_handlers = any(re.search(pattern, bot_content) for pattern in callback_patterns)
+            callback_handlers = search_patterns(bot_content, callback_patterns).any(callback_patterns)
             
             # Check for chart activity implementation in real-trading-manager
             trading_manager_path = self.telegram_bot_dir / "real-trading-manager.js"
             trading_manager_methods = {}
             if trading_manager_path.exists():
-                with open(trading_manager_path, 'r') as f:
-                    trading_content = f.read()
+                trading_content = read_source(trading_manager_path)
                 trading_manager_methods = {
                     "startChartActivity": "startChartActivity" in trading_content,
                     "stopChartActivity": "stopChartActivity" in trading_content,
@@ -14,6 +14,9 @@ import sys
 import re
 from pathlib import Path
 
+from verification.corpus import read_source
+from verification.regexset import search_patterns
+
 class ReviewRequestTester:
     def __init__(self):
         self.bot_path = "/app/telegram-bot/bot.js"
@@ -29,8 +32,7 @@ class ReviewRequestTester:
         print("🔍 Testing /start_trading command...")
         
         try:
-            with open(self.bot_path, 'r') as f:
-                bot_content = f.read()
+            bot_content = read_source(self.bot_path)
             
             # Check if /start_trading command exists
             start_trading_pattern = r'bot\.onText\(/\\\/start_trading/'
@@ -61,8 +63,7 @@ class ReviewRequestTester:
         print("🔍 Testing /chart_activity command...")
         
         try:
-            with open(self.bot_path, 'r') as f:
-                bot_content = f.read()
+            bot_content = read_source(self.bot_path)
             
             # Check if /chart_activity command exists
             chart_activity_pattern = r'bot\.onText\(/\\\/chart_activity/'
@@ -80,11 +81,7 @@ class ReviewRequestTester:
                     r'executeChartActivityTrade'
                 ]
                 
-                callback_found = False
-                for pattern in callback_patterns:
-                    if re.search(pattern, bot_content):
-                        callback_found = True
-                        break
+                callback_found = search_patterns(bot_content, callback_patterns).any(callback_patterns)
                 
                 if callback_found:
                     self.test_results["chart_activity_command"]["working"] = True
@@ -104,8 +101,7 @@ class ReviewRequestTester:
         print("🔍 Testing Airdrop functionality...")
         
         try:
-            with open(self.bot_path, 'r') as f:
-                bot_content = f.read()
+            bot_content = read_source(self.bot_path)
             
             # Check for airdrop wallet callbacks
             airdrop_callbacks = []
@@ -131,7 +127,7 @@ class ReviewRequestTester:
                         r'if.*return'
                     ]
                     
-                    loop_prevention = any(re.search(pattern, bot_content) for pattern in loop_prevention_patterns)
+                    loop_prevention = search_patterns(bot_content, loop_prevention_patterns).any(loop_prevention_patterns)
                     
                     if loop_prevention:
                         self.test_results["airdrop_functionality"]["working"] = True
@@ -153,8 +149,7 @@ class ReviewRequestTester:
         print("🔍 Testing Mainnet liquidity configuration...")
         
         try:
-            with open(self.bot_path, 'r') as f:
-                bot_content = f.read()
+            bot_content = read_source(self.bot_path)
             
             # Check for mainnet liquidity configuration
             mainnet_patterns = [
@@ -164,10 +159,7 @@ class ReviewRequestTester:
                 r'SOL.*amount.*input'
             ]
             
-            found_patterns = []
-            for pattern in mainnet_patterns:
-                if re.search(pattern, bot_content):
-                    found_patterns.append(pattern.split('.*')[0])
+            found_patterns = [pattern.split('.*')[0] for pattern in search_patterns(bot_content, mainnet_patterns).found(mainnet_patterns)]
             
             if len(found_patterns) >= 2:
                 self.test_results["mainnet_liquidity_config"]["exists"] = True
@@ -181,7 +173,7 @@ class ReviewRequestTester:
                     r'displayedLiquidity.*=.*parseInt'
                 ]
                 
-                input_processing = any(re.search(pattern, bot_content) for pattern in input_processing_patterns)
+                input_processing = search_patterns(bot_content, input_processing_patterns).any(input_processing_patterns)
                 
                 if input_processing:
                     self.test_results["mainnet_liquidity_config"]["details"] += " - Input processing found ✅"
@@ -193,7 +185,7 @@ class ReviewRequestTester:
                         r'session\.step'
                     ]
                     
-                    session_handling = any(re.search(pattern, bot_content) for pattern in session_patterns)
+                    session_handling = search_patterns(bot_content, session_patterns).any(session_patterns)
                     
                     if session_handling:
                         self.test_results["mainnet_liquidity_config"]["working"] = True
@@ -217,13 +209,12 @@ class ReviewRequestTester:
             return False
         
         try:
-            with open(self.bot_path, 'r') as f:
-                content = f.read()
-                if len(content) < 1000:  # Bot file should be substantial
-                    print(f"⚠️ Bot file seems too small: {len(content)} characters")
-                    return False
-                print(f"✅ Bot file found: {len(content)} characters, {len(content.splitlines())} lines")
-                return True
+            content = read_source(self.bot_path)
+            if len(content) < 1000:  # Bot file should be substantial
+                print(f"⚠️ Bot file seems too small: {len(content)} characters")
+                return False
+            print(f"✅ Bot file found: {len(content)} characters, {len(content.splitlines())} lines")
+            return True
         except Exception as e:
             print(f"❌ Error reading bot file: {str(e)}")
             return False
@@ -21,6 +21,8 @@ import time
 import subprocess
 from pathlib import Path
 
+from verification.corpus import read_source
+
 class ReviewRequestTester:
     def __init__(self):
         self.project_root = Path("/app")
@@ -48,8 +50,7 @@ class ReviewRequestTester:
         
         # Check bot.js for network separation
         bot_js_path = self.telegram_bot_dir / "bot.js"
-        with open(bot_js_path, 'r') as f:
-            bot_content = f.read()
+        bot_content = read_source(bot_js_path)
             
         # Test 1: Check for network selection in commands
         network_selection_indicators = [
@@ -77,8 +78,7 @@ class ReviewRequestTester:
                          "wallet-manager-enhanced.js not found")
             return False
             
-        with open(wallet_manager_path, 'r') as f:
-            wallet_content = f.read()
+        wallet_content = read_source(wallet_manager_path)
             
         wallet_network_checks = [
             "getWallets(network)",
@@ -119,8 +119,7 @@ class ReviewRequestTester:
         
         # Check bot.js for mint authority options
         bot_js_path = self.telegram_bot_dir / "bot.js"
-        with open(bot_js_path, 'r') as f:
-            bot_content = f.read()
+        bot_content = read_source(bot_js_path)
             
         # Test 1: Check for mint authority decision UI
         mint_authority_ui = [
@@ -148,8 +147,7 @@ class ReviewRequestTester:
                          "genuine-blockchain-manager.js not found")
             return False
             
-        with open(genuine_manager_path, 'r') as f:
-            genuine_content = f.read()
+        genuine_content = read_source(genuine_manager_path)
             
         # Test 3: Check for genuine revocation implementation
         revocation_checks = [
@@ -193,8 +191,7 @@ class ReviewRequestTester:
         
         # Check bot.js for liquidity lock UI
         bot_js_path = self.telegram_bot_dir / "bot.js"
-        with open(bot_js_path, 'r') as f:
-            bot_content = f.read()
+        bot_content = read_source(bot_js_path)
             
         # Test 1: Check for 24-hour lock UI
         lock_ui_checks = [
@@ -217,8 +214,7 @@ class ReviewRequestTester:
             
         # Test 2: Check genuine blockchain manager for real lock implementation
         genuine_manager_path = self.telegram_bot_dir / "genuine-blockchain-manager.js"
-        with open(genuine_manager_path, 'r') as f:
-            genuine_content = f.read()
+        genuine_content = read_source(genuine_manager_path)
             
         # Test 3: Check for genuine liquidity lock implementation
         genuine_lock_checks = [
@@ -242,8 +238,7 @@ class ReviewRequestTester:
         # Test 4: Check database for lock duration setting
         database_path = self.telegram_bot_dir / "database.js"
         if database_path.exists():
-            with open(database_path, 'r') as f:
-                db_content = f.read()
+            db_content = read_source(database_path)
                 
             if "24 * 60 * 60 * 1000" in db_content:  # 24 hours in milliseconds
                 self.log_test("liquidity_lock_24h", "INFO", 
@@ -275,8 +270,7 @@ class ReviewRequestTester:
         
         # Check bot.js for chart_activity command
         bot_js_path = self.telegram_bot_dir / "bot.js"
-        with open(bot_js_path, 'r') as f:
-            bot_content = f.read()
+        bot_content = read_source(bot_js_path)
             
         # Test 1: Check for chart_activity command handler
         if "/chart_activity" not in bot_content:
@@ -312,8 +306,7 @@ class ReviewRequestTester:
                          "database.js not found")
             return False
             
-        with open(database_path, 'r') as f:
-            db_content = f.read()
+        db_content = read_source(database_path)
             
         # Test 5: Check for multiple fallback methods
         fallback_methods = [
@@ -335,8 +328,7 @@ class ReviewRequestTester:
         # Test 6: Check real trading manager for chart activity methods
         trading_manager_path = self.telegram_bot_dir / "real-trading-manager.js"
         if trading_manager_path.exists():
-            with open(trading_manager_path, 'r') as f:
-                trading_content = f.read()
+            trading_content = read_source(trading_manager_path)
                 
             chart_methods = [
                 "startChartActivity",
@@ -359,8 +351,7 @@ class ReviewRequestTester:
         
         # Check bot.js for start_trading command
         bot_js_path = self.telegram_bot_dir / "bot.js"
-        with open(bot_js_path, 'r') as f:
-            bot_content = f.read()
+        bot_content = read_source(bot_js_path)
             
         # Test 1: Check for start_trading command handler
         if "/start_trading" not in bot_content:
@@ -444,8 +435,7 @@ class ReviewRequestTester:
                          "database.js not found")
             return False
             
-        with open(database_path, 'r') as f:
-            db_content = f.read()
+        db_content = read_source(database_path)
             
         # Test 1: Check for getToken method
         if "getToken(" not in db_content:
@@ -488,8 +478,7 @@ class ReviewRequestTester:
         
         # Check bot.js for enhanced error handling patterns
         bot_js_path = self.telegram_bot_dir / "bot.js"
-        with open(bot_js_path, 'r') as f:
-            bot_content = f.read()
+        bot_content = read_source(bot_js_path)
             
         # Test 1: Count try-catch blocks
         try_catch_count = bot_content.count("try {")
@@ -809,12 +809,12 @@ Please enter your ticker symbol:`);
         }
 
     // Airdrop Handlers
-    } else if (data.startsWith('airdrop_')) {
-        const network = data.replace('airdrop_', '');
-        showAirdropMenu(chatId, network);
     } else if (data.startsWith('airdrop_wallet_')) {
         const [, , walletNum, network] = data.split('_');
         await executeAirdrop(chatId, parseInt(walletNum), network);
+    } else if (data.startsWith('airdrop_')) {
+        const network = data.replace('airdrop_', '');
+        showAirdropMenu(chatId, network);
     } else if (data.startsWith('configure_fees_')) {
         const network = data.replace('configure_fees_', '');
         bot.sendMessage(chatId, `💸 Fee Configuration - ${network.charAt(0).toUpperCase() + network.slice(1)}
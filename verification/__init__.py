@@ -0,0 +1 @@
+"""Shared infrastructure for the verification suites at the repository root"""
@@ -0,0 +1,5 @@
+import sys
+
+from verification.runner import main
+
+sys.exit(main())
@@ -0,0 +1,70 @@
+"""
+Verification Cache
+On-disk cache for data derived from a source file's content, shared across runs
+
+Entries live in ``.verification-cache/<namespace>/<version>-<sha256>.json`` under the
+repository root (VERIFICATION_CACHE_DIR overrides the location). They are keyed by
+content, not by path or mtime, so a touched-but-unchanged file or a checkout of
+an old revision reuses its entry. Bumping a namespace's version invalidates what
+older code wrote. The cache is best effort: unreadable or unwritable entries are
+rebuilt and never fail a check.
+"""
+
+import os
+import json
+import tempfile
+from pathlib import Path
+
+from verification.corpus import corpus
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+CACHE_DIR = Path(os.environ.get("VERIFICATION_CACHE_DIR", REPO_ROOT / ".verification-cache"))
+
+
+class ContentCache:
+    def __init__(self, namespace, version):
+        self.directory = CACHE_DIR / namespace
+        self.version = version
+        self.hits = 0
+        self.builds = 0
+
+    def _entry(self, digest):
+        return self.directory / f"{self.version}-{digest}.json"
+
+    def get(self, digest):
+        try:
+            with open(self._entry(digest)) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def put(self, digest, data):
+        temporary = None
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            # Write then rename, so concurrent suites never read a half-written entry
+            fd, temporary = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "w") as f:
+                json.dump(data, f, separators=(",", ":"))
+            os.replace(temporary, self._entry(digest))
+        except OSError:
+            if temporary is not None:
+                try:
+                    os.unlink(temporary)
+                except OSError:
+                    pass
+
+    def load(self, path, build):
+        """build(text) for the current content of `path`, from disk when this content was built before"""
+        source = corpus.get(path)
+        data = self.get(source.digest)
+        if data is None:
+            data = build(source.text)
+            self.put(source.digest, data)
+            self.builds += 1
+        else:
+            self.hits += 1
+        return source.digest, data
+
+    def stats(self):
+        return {"hits": self.hits, "builds": self.builds}
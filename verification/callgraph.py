@@ -0,0 +1,435 @@
+"""
+JS Call Graph
+Caller-to-callee edges across a telegram-bot entry file and the local modules it requires
+
+Built from verification.jstokens, so "does handler X end up calling Y" is a graph
+query instead of a DOTALL regex across bot.js. Nodes are:
+
+- functions, nested ones included, by name: ``executeQuickAirdropAll``
+- class methods: ``RealTradingManager.startTrading``
+- bot handlers: ``onText:/start_trading`` for ``bot.onText(/\\/start_trading/, ...)``,
+  ``on:callback_query`` for ``bot.on('callback_query', ...)``
+- callback branches inside ``on:callback_query``: ``callback:quick_airdrop_all`` for
+  ``data === 'quick_airdrop_all'`` and ``callback:airdrop_wallet_*`` for
+  ``data.startsWith('airdrop_wallet_')``
+- each file's top-level code: ``<bot.js>``
+
+An edge comes from a call or a reference to a known function (``name(...)``,
+``setTimeout(name)``), a method call on ``this``, on an instance (``x = new Class()``)
+or on a field (``this.x``, typed by ``this.x = new Class()`` or by the constructor
+argument it was assigned from), and ``new Class()`` to ``Class.constructor``.
+
+Per-file edges persist in ``.verification-cache/callgraph`` keyed by file content.
+Each program's graph is rebuilt only when one of its files changes, and reachability
+is computed once per node:
+
+    graph = call_graph("bot-old.js")
+    graph.reaches("/start_trading", "RealTradingManager.startTrading")
+    graph.path("callback:airdrop_wallet_*", "EnhancedWalletManager.requestDevnetAirdrop")
+
+Usage:
+    python -m verification.callgraph on:callback_query
+    python -m verification.callgraph --entry bot-old.js /start_trading RealTradingManager.startTrading
+"""
+
+import sys
+import argparse
+from pathlib import Path
+from collections import deque
+
+from verification.cache import ContentCache
+from verification.corpus import corpus
+from verification.dispatch import data_conditions, label
+from verification.jstokens import bracket_pairs, tokenize
+from verification.symbols import TELEGRAM_BOT_DIR
+
+VERSION = 2
+MODULE = "<module>"
+CALLBACK_HANDLER = "on:callback_query"
+
+_HANDLER_METHODS = {"onText", "on", "once"}
+_NOT_CALLS = {
+    "if", "for", "while", "switch", "catch", "function", "return", "typeof", "await", "async", "new",
+    "super", "this", "require", "const", "let", "var", "class", "else", "case", "throw", "delete", "in", "of",
+}
+_DECLARATIONS = {"const", "let", "var"}
+_NOT_METHODS = {"if", "for", "while", "switch", "catch", "function", "return", "super"}
+
+cache = ContentCache("callgraph", VERSION)
+
+
+def _is(token, kind, value=None):
+    return token is not None and token.kind == kind and (value is None or token.value == value)
+
+
+def _function_body(tokens, pairs, index):
+    """Index of the `{` opening the body of the function expression at `index`, or None"""
+    at = lambda position: tokens[position] if position < len(tokens) else None
+    if _is(at(index), "name", "async"):
+        index += 1
+    if _is(at(index), "name", "function"):
+        index += 1
+        if _is(at(index), "punct", "*"):
+            index += 1
+        if _is(at(index), "name"):
+            index += 1
+        if not _is(at(index), "punct", "("):
+            return None
+        index = pairs.get(index, len(tokens)) + 1
+        return index if _is(at(index), "punct", "{") else None
+    if _is(at(index), "name"):
+        index += 1
+    elif _is(at(index), "punct", "("):
+        index = pairs.get(index, len(tokens)) + 1
+    else:
+        return None
+    if _is(at(index), "punct", "=>") and _is(at(index + 1), "punct", "{"):
+        return index + 1
+    return None
+
+
+def _arguments(tokens, pairs, index):
+    """Names passed as whole arguments to the call whose `(` is at `index` (None for other expressions)"""
+    end = pairs.get(index, len(tokens))
+    arguments, start = [], index + 1
+    position = start
+    while position <= end and position < len(tokens):
+        token = tokens[position]
+        if token.kind == "punct" and token.value in ("(", "[", "{") and position in pairs:
+            position = pairs[position] + 1
+            continue
+        if position == end or _is(token, "punct", ","):
+            if position > start:
+                arguments.append(tokens[start].value if position - start == 1 and tokens[start].kind == "name" else None)
+            start = position + 1
+        position += 1
+    return arguments
+
+
+def _handler_name(method, argument):
+    if argument.kind == "regex":
+        pattern = argument.value[1:argument.value.rindex("/")]
+        return f"{method}:{pattern.replace(chr(92) + '/', '/')}"
+    if argument.kind == "string":
+        return f"{method}:{argument.value}"
+    return None
+
+
+def index_calls(text):
+    """Definitions and outgoing references of one JS source, as plain JSON-serializable dicts
+
+    References are unresolved strings (``call:name``, ``method:Class.name``,
+    ``member:object.name``, ``field:Class.field.name``, ``new:Class``, ``node:name``),
+    because what an instance or a name stands for may be defined in another file.
+    """
+    tokens = tokenize(text)
+    pairs = bracket_pairs(tokens)
+    at = lambda position: tokens[position] if 0 <= position < len(tokens) else None
+    data = {
+        "functions": {}, "methods": {}, "handlers": {}, "branches": {},
+        "instances": {}, "fields": {}, "requires": [], "edges": {},
+    }
+    edges = {}
+
+    starts = {}       # body index -> node names
+    scopes = []       # (node names, end index)
+    classes = []      # (name, body index, end index)
+    braces = []       # indices of the open `{`s
+    parameters = {}   # Class -> constructor parameter names
+
+    def define(kind, name, line, body):
+        data[kind].setdefault(name, line)
+        starts.setdefault(body, []).append(name)
+
+    def refer(reference):
+        for caller in scopes[-1][0] if scopes else (MODULE,):
+            edges.setdefault(caller, set()).add(reference)
+
+    for i, (kind, value, line) in enumerate(tokens):
+        while scopes and scopes[-1][1] < i:
+            scopes.pop()
+        while classes and classes[-1][2] < i:
+            classes.pop()
+        if i in starts:
+            scopes.append((starts[i], pairs.get(i, len(tokens))))
+
+        if kind == "punct":
+            if value == "{":
+                braces.append(i)
+            elif value == "}" and braces:
+                braces.pop()
+            continue
+        if kind != "name":
+            continue
+
+        previous, following = at(i - 1), at(i + 1)
+        if _is(previous, "punct", "."):
+            if value in _HANDLER_METHODS and _is(following, "punct", "(") and at(i + 2) is not None:
+                name = _handler_name(value, at(i + 2))
+                if name is not None:
+                    define("handlers", name, line, i + 1)
+            continue
+
+        if value == "function" and _is(following, "name") and _is(at(i + 2), "punct", "("):
+            body = pairs.get(i + 2, len(tokens)) + 1
+            if _is(at(body), "punct", "{"):
+                define("functions", following.value, line, body)
+        elif value in _DECLARATIONS and _is(following, "name") and _is(at(i + 2), "punct", "="):
+            body = _function_body(tokens, pairs, i + 3)
+            if body is not None:
+                define("functions", following.value, line, body)
+        elif value == "class" and _is(following, "name"):
+            body = i + 2
+            while body < len(tokens) and not _is(tokens[body], "punct", "{"):
+                body += 1
+            classes.append((following.value, body, pairs.get(body, len(tokens))))
+        elif value == "require" and _is(following, "punct", "(") and _is(at(i + 2), "string"):
+            if at(i + 2).value.startswith("."):
+                data["requires"].append(at(i + 2).value)
+        elif value == "new" and _is(following, "name"):
+            parts, position = [following.value], i + 2
+            while _is(at(position), "punct", ".") and _is(at(position + 1), "name"):
+                parts.append(at(position + 1).value)
+                position += 2
+            cls = ".".join(parts)
+            refer(f"new:{cls}")
+            arguments = _arguments(tokens, pairs, position) if _is(at(position), "punct", "(") else []
+            instance = ["new", cls, arguments]
+            if _is(previous, "punct", "=") and _is(at(i - 2), "name"):
+                target = at(i - 2).value
+                if _is(at(i - 3), "punct", ".") and _is(at(i - 4), "name", "this") and classes:
+                    data["fields"][f"{classes[-1][0]}.{target}"] = instance
+                elif not _is(at(i - 3), "punct", "."):
+                    data["instances"][target] = instance
+        elif value == "this" and _is(following, "punct", ".") and _is(at(i + 2), "name") and classes:
+            cls, member = classes[-1][0], at(i + 2).value
+            if _is(at(i + 3), "punct", "("):
+                refer(f"method:{cls}.{member}")
+            elif _is(at(i + 3), "punct", ".") and _is(at(i + 4), "name") and _is(at(i + 5), "punct", "("):
+                refer(f"field:{cls}.{member}.{at(i + 4).value}")
+            elif _is(at(i + 3), "punct", "=") and _is(at(i + 4), "name") and _is(at(i + 5), "punct", ";"):
+                # this.x = parameter, in the constructor: x has the type of that constructor argument
+                names = parameters.get(cls, [])
+                if scopes and f"{cls}.constructor" in scopes[-1][0] and at(i + 4).value in names:
+                    data["fields"].setdefault(f"{cls}.{member}", ["parameter", names.index(at(i + 4).value)])
+        elif value == "if" and _is(following, "punct", "(") and any(CALLBACK_HANDLER in names for names, _ in scopes):
+            end = pairs.get(i + 1, len(tokens))
+            names = [f"callback:{label(condition)}" for condition in data_conditions(tokens, i + 1, end)[0]]
+            if names and _is(at(end + 1), "punct", "{"):
+                for name in names:
+                    refer(f"node:{name}")
+                    define("branches", name, line, end + 1)
+        elif classes and braces and braces[-1] == classes[-1][1] and _is(following, "punct", "(") \
+                and value not in _NOT_METHODS and not _is(previous, "punct", "="):
+            closing = pairs.get(i + 1, len(tokens))
+            if _is(at(closing + 1), "punct", "{"):
+                name = f"{classes[-1][0]}.{value}"
+                define("methods", name, line, closing + 1)
+                if value == "constructor":
+                    parameters[classes[-1][0]] = [
+                        tokens[position].value for position in range(i + 2, closing)
+                        if tokens[position].kind == "name" and tokens[position - 1].kind == "punct"
+                        and tokens[position - 1].value in ("(", ",")
+                    ]
+            continue
+        elif value not in _NOT_CALLS:
+            if _is(following, "punct", ".") and _is(at(i + 2), "name") and _is(at(i + 3), "punct", "("):
+                refer(f"member:{value}.{at(i + 2).value}")
+            elif not _is(following, "punct", ":") and not _is(previous, "name", "function") \
+                    and not (previous is not None and previous.kind == "name" and previous.value in _DECLARATIONS):
+                refer(f"call:{value}")
+
+    data["edges"] = {caller: sorted(references) for caller, references in edges.items()}
+    return data
+
+
+class CallGraph:
+    def __init__(self, entry, files):
+        """`files` maps each file name of the program to its index_calls() data, entry first"""
+        self.entry = entry
+        self.nodes = {}   # name -> (file, line)
+        self.edges = {}   # name -> set of callee names
+        self._reachable = {}
+
+        instances, fields, functions = {}, {}, set()
+        for file, data in files.items():
+            self.nodes.setdefault(f"<{file}>", (file, 1))
+            for kind in ("functions", "methods", "handlers", "branches"):
+                for name, line in data[kind].items():
+                    self.nodes.setdefault(name, (file, line))
+            functions.update(data["functions"])
+            for name, instance in data["instances"].items():
+                instances.setdefault(name, instance)
+            for name, field in data["fields"].items():
+                fields.setdefault(name, field)
+
+        types = {name: instance[1] for name, instance in instances.items()}
+        constructed = {}
+        for instance in list(instances.values()) + list(fields.values()):
+            if instance[0] == "new":
+                constructed.setdefault(instance[1], []).append(instance[2])
+        field_types = {}
+        for name, field in fields.items():
+            if field[0] == "new":
+                field_types[name] = field[1]
+            else:
+                cls = name.rsplit(".", 1)[0]
+                for arguments in constructed.get(cls, []):
+                    argument = arguments[field[1]] if field[1] < len(arguments) else None
+                    if argument in types:
+                        field_types[name] = types[argument]
+                        break
+
+        def resolve(reference):
+            kind, _, target = reference.partition(":")
+            if kind == "call":
+                return target if target in functions else None
+            if kind == "node" or kind == "method":
+                return target
+            if kind == "new":
+                return f"{target}.constructor"
+            if kind == "member":
+                owner, _, method = target.partition(".")
+                return f"{types.get(owner, owner)}.{method}"
+            if kind == "field":
+                owner, _, method = target.rpartition(".")
+                return f"{field_types[owner]}.{method}" if owner in field_types else None
+            return None
+
+        for file, data in files.items():
+            for caller, references in data["edges"].items():
+                caller = f"<{file}>" if caller == MODULE else caller
+                callees = self.edges.setdefault(caller, set())
+                for reference in references:
+                    callee = resolve(reference)
+                    if callee is not None and callee in self.nodes and callee != caller:
+                        callees.add(callee)
+
+        self.callers_of = {}
+        for caller, callees in self.edges.items():
+            for callee in callees:
+                self.callers_of.setdefault(callee, set()).add(caller)
+
+    def resolve(self, name):
+        """Node for `name`: a node name, a ``/command`` or a method name unique to one class"""
+        if name in self.nodes:
+            return name
+        if name.startswith("/") and f"onText:{name}" in self.nodes:
+            return f"onText:{name}"
+        if "." not in name:
+            candidates = [node for node in self.nodes if node.endswith(f".{name}") and ":" not in node]
+            if len(candidates) == 1:
+                return candidates[0]
+        return None
+
+    def callees(self, name):
+        return set(self.edges.get(self.resolve(name), ()))
+
+    def callers(self, name):
+        return set(self.callers_of.get(self.resolve(name), ()))
+
+    def reachable(self, name):
+        """Every node reachable from `name` (not counting itself unless it is recursive)"""
+        node = self.resolve(name)
+        if node is None:
+            return frozenset()
+        if node not in self._reachable:
+            seen, stack = set(), list(self.edges.get(node, ()))
+            while stack:
+                current = stack.pop()
+                if current in seen:
+                    continue
+                seen.add(current)
+                known = self._reachable.get(current)
+                if known is not None:
+                    seen.update(known)
+                    seen.add(current)
+                    continue
+                stack.extend(self.edges.get(current, ()))
+            self._reachable[node] = frozenset(seen)
+        return self._reachable[node]
+
+    def reaches(self, source, target):
+        """Whether `source` ends up calling `target`"""
+        target = self.resolve(target)
+        return target is not None and target in self.reachable(source)
+
+    def path(self, source, target):
+        """Shortest call chain from `source` to `target` as a list of nodes, or None"""
+        source, target = self.resolve(source), self.resolve(target)
+        if source is None or target is None:
+            return None
+        parents, queue = {source: None}, deque([source])
+        while queue:
+            current = queue.popleft()
+            for callee in sorted(self.edges.get(current, ())):
+                if callee == target:
+                    chain = [callee, current]
+                    while parents[chain[-1]] is not None:
+                        chain.append(parents[chain[-1]])
+                    return chain[::-1]
+                if callee not in parents:
+                    parents[callee] = current
+                    queue.append(callee)
+        return None
+
+
+def program_files(root, entry):
+    """The entry file and the local modules it requires, transitively, in discovery order"""
+    root = Path(root)
+    files, pending = {}, [entry]
+    while pending:
+        name = pending.pop(0)
+        path = root / name
+        if name in files or not path.exists():
+            continue
+        digest, data = cache.load(path, index_calls)
+        files[name] = (digest, data)
+        for module in data["requires"]:
+            module = Path(module).name
+            pending.append(module if module.endswith(".js") else f"{module}.js")
+    return files
+
+
+_graphs = {}
+
+
+def call_graph(entry="bot.js", root=TELEGRAM_BOT_DIR):
+    """The shared CallGraph of `entry`, rebuilt only when one of its files changed"""
+    key = (str(Path(root).resolve()), entry)
+    cached = _graphs.get(key)
+    if cached is not None:
+        digests, graph = cached
+        if all(corpus.digest(Path(root) / name) == digest for name, digest in digests.items()):
+            return graph
+    files = program_files(root, entry)
+    graph = CallGraph(entry, {name: data for name, (_, data) in files.items()})
+    _graphs[key] = ({name: digest for name, (digest, _) in files.items()}, graph)
+    return graph
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m verification.callgraph", description="Query the telegram-bot call graph")
+    parser.add_argument("source", help="node to start from, e.g. on:callback_query or /start_trading")
+    parser.add_argument("target", nargs="?", help="print the call chain from source to this node")
+    parser.add_argument("--entry", default="bot.js", help="entry file under telegram-bot/")
+    args = parser.parse_args(argv)
+
+    graph = call_graph(args.entry)
+    if graph.resolve(args.source) is None:
+        print(f"❌ Unknown node: {args.source}")
+        return 1
+    if args.target is None:
+        for node in sorted(graph.reachable(args.source)):
+            print(node)
+        return 0
+    chain = graph.path(args.source, args.target)
+    if chain is None:
+        print(f"❌ {args.source} does not reach {args.target}")
+        return 1
+    print(" → ".join(chain))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
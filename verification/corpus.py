@@ -0,0 +1,111 @@
+"""
+Source Corpus
+Reads each telegram-bot/backend source file once per run and hands the same text to every check
+
+Entries are keyed by resolved path and validated against the file's mtime and size
+on every lookup, so an edited file is re-read while an unchanged one never is.
+Files of MMAP_THRESHOLD bytes or more are memory-mapped and decoded straight
+from the mapping. ``view()`` exposes that mapping as a read-only memoryview for
+byte-level scanners.
+
+Text is decoded as UTF-8 with universal newlines, same as ``open(path, 'r')``.
+A missing file raises FileNotFoundError, same as ``open``.
+
+Every lookup is recorded in ``corpus.reads`` with the path, mtime, size and hit count.
+"""
+
+import os
+import mmap
+import hashlib
+import threading
+from pathlib import Path
+
+MMAP_THRESHOLD = 64 * 1024
+
+
+class SourceFile:
+    __slots__ = ("path", "mtime_ns", "size", "text", "_buffer", "_digest")
+
+    def __init__(self, path, mtime_ns, size, text, buffer):
+        self.path = path
+        self.mtime_ns = mtime_ns
+        self.size = size
+        self.text = text
+        self._buffer = buffer
+        self._digest = None
+
+    @property
+    def digest(self):
+        """SHA-256 of the file's bytes, the key for anything derived from its content"""
+        if self._digest is None:
+            self._digest = hashlib.sha256(self._buffer).hexdigest()
+        return self._digest
+
+    @property
+    def key(self):
+        return (self.path, self.mtime_ns, self.size)
+
+    def view(self):
+        return memoryview(self._buffer).toreadonly()
+
+
+def _load(path, stat):
+    with open(path, "rb") as f:
+        if stat.st_size >= MMAP_THRESHOLD:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            buffer = f.read()
+    text = str(buffer, "utf-8")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return SourceFile(path, stat.st_mtime_ns, stat.st_size, text, buffer)
+
+
+class SourceCorpus:
+    def __init__(self):
+        self._files = {}
+        self._lock = threading.Lock()
+        self.reads = {}
+        self.loads = 0
+        self.hits = 0
+
+    def get(self, path):
+        """The current SourceFile for `path`, loading it if it is new or has changed on disk"""
+        path = str(Path(path).resolve())
+        stat = os.stat(path)
+        with self._lock:
+            entry = self._files.get(path)
+            if entry is None or (entry.mtime_ns, entry.size) != (stat.st_mtime_ns, stat.st_size):
+                entry = self._files[path] = _load(path, stat)
+                self.loads += 1
+            else:
+                self.hits += 1
+            record = self.reads.setdefault(path, {"hits": 0})
+            record.update(mtime_ns=entry.mtime_ns, size=entry.size)
+            record["hits"] += 1
+        return entry
+
+    def read(self, path):
+        """Decoded text of `path`; a drop-in for ``open(path, 'r').read()``"""
+        return self.get(path).text
+
+    def view(self, path):
+        """Read-only bytes of `path` (backed by the mapping for large files)"""
+        return self.get(path).view()
+
+    def digest(self, path):
+        return self.get(path).digest
+
+    def invalidate(self, path=None):
+        with self._lock:
+            if path is None:
+                self._files.clear()
+            else:
+                self._files.pop(str(Path(path).resolve()), None)
+
+    def stats(self):
+        return {"files": len(self._files), "loads": self.loads, "hits": self.hits}
+
+
+corpus = SourceCorpus()
+read_source = corpus.read
@@ -0,0 +1,346 @@
+"""
+Callback Dispatch
+The ``bot.on('callback_query')`` if/else-if chain of a bot file as an ordered dispatch table
+
+The handler routes ``callbackQuery.data`` through conditions like
+``data === 'back_to_start'`` and ``data.startsWith('airdrop_')``, first match
+wins. This extracts that chain and every ``callback_data`` the bot sends
+(``'seed_devnet'`` exactly, or ``\\`airdrop_wallet_${n}_${network}\\``` by its static
+prefix) and answers:
+
+- ``shadowed()``: branches no callback can reach because earlier conditions match
+  everything theirs would, e.g. ``airdrop_wallet_*`` after ``airdrop_*``
+- ``dead_conditions()``: single ``||`` alternatives that are shadowed the same way
+- ``resolve(data)``: the branch a callback lands in, through a prefix trie of the
+  conditions instead of the linear scan the handler does
+- ``table()``: each sent callback with its branch (None when it falls through to the
+  final ``else``) and the comparisons the chain makes to get there
+- ``cost()``: conditions in the chain, worst-case and average comparisons per callback
+
+Condition labels are the literal, with a trailing ``*`` for prefixes
+(``airdrop_wallet_*``), the same names verification.callgraph gives its
+``callback:`` nodes. Extractions persist in ``.verification-cache/dispatch`` keyed
+by file content:
+
+    dispatch = callback_dispatch("bot.js")
+    dispatch.resolve("airdrop_wallet_1_devnet").label, dispatch.cost()["average_comparisons"]
+"""
+
+from collections import namedtuple
+from pathlib import Path
+
+from verification.cache import ContentCache
+from verification.corpus import corpus
+from verification.jstokens import bracket_pairs, tokenize
+from verification.symbols import TELEGRAM_BOT_DIR
+
+VERSION = 1
+EXACT, PREFIX = "exact", "prefix"
+
+Condition = namedtuple("Condition", "kind literal")
+
+cache = ContentCache("dispatch", VERSION)
+
+
+def _is(token, kind, value=None):
+    return token is not None and token.kind == kind and (value is None or token.value == value)
+
+
+def label(condition):
+    return condition.literal + "*" if condition.kind == PREFIX else condition.literal
+
+
+def data_conditions(tokens, start, end, variable="data"):
+    """([Condition], pure) for the condition between the parentheses at `start` and `end`
+
+    Conditions are the literals `variable` is compared against with ``===``/``==``
+    or ``startsWith``. The condition is pure when it is nothing but those
+    comparisons joined by ``||``; anything else (``&&``, other operands) could
+    make the branch skip a callback its literals match.
+    """
+    at = lambda position: tokens[position] if start < position < end else None
+    is_variable = lambda position: _is(at(position), "name", variable) and not _is(tokens[position - 1], "punct", ".")
+    conditions, pure = [], True
+    position = start + 1
+    expect_operand = True
+    while position < end:
+        if not expect_operand and _is(at(position), "punct", "||"):
+            expect_operand = True
+            position += 1
+            continue
+        if expect_operand:
+            if is_variable(position) and _is(at(position + 1), "punct") and at(position + 1).value in ("===", "==") \
+                    and _is(at(position + 2), "string"):
+                conditions.append(Condition(EXACT, at(position + 2).value))
+                position, expect_operand = position + 3, False
+                continue
+            if _is(at(position), "string") and _is(at(position + 1), "punct") and at(position + 1).value in ("===", "==") \
+                    and is_variable(position + 2):
+                conditions.append(Condition(EXACT, at(position).value))
+                position, expect_operand = position + 3, False
+                continue
+            if is_variable(position) and _is(at(position + 1), "punct", ".") and _is(at(position + 2), "name", "startsWith") \
+                    and _is(at(position + 3), "punct", "(") and _is(at(position + 4), "string") and _is(at(position + 5), "punct", ")"):
+                conditions.append(Condition(PREFIX, at(position + 4).value))
+                position, expect_operand = position + 6, False
+                continue
+        # Not a plain comparison: keep the literals it compares against, but it may not match them all
+        pure = False
+        token = at(position)
+        if token.kind == "string":
+            if _is(tokens[position - 1], "punct", "(") and _is(tokens[position - 2], "name", "startsWith") \
+                    and is_variable(position - 4):
+                conditions.append(Condition(PREFIX, token.value))
+            elif (_is(tokens[position - 1], "punct") and tokens[position - 1].value in ("===", "==") and is_variable(position - 2)) \
+                    or (_is(tokens[position + 1], "punct") and tokens[position + 1].value in ("===", "==") and is_variable(position + 2)):
+                conditions.append(Condition(EXACT, token.value))
+        position += 1
+    return conditions, pure and bool(conditions)
+
+
+def _handler_body(tokens, pairs, event):
+    """(start, end) of the `{...}` body of the ``.on('<event>', ...)`` handler, or None"""
+    for i, token in enumerate(tokens):
+        if _is(token, "name", "on") and _is(tokens[i - 1], "punct", ".") and i + 2 < len(tokens) \
+                and _is(tokens[i + 1], "punct", "(") and _is(tokens[i + 2], "string", event):
+            for position in range(i + 3, pairs.get(i + 1, len(tokens))):
+                if _is(tokens[position], "punct", "{"):
+                    return position, pairs.get(position, len(tokens) - 1)
+    return None
+
+
+def _chains(tokens, pairs, start, end):
+    """Every if/else-if chain among the statements directly inside `start`..`end`"""
+    chains, position = [], start + 1
+    while position < end:
+        token = tokens[position]
+        if _is(token, "name", "if") and _is(tokens[position + 1], "punct", "("):
+            chain, default = [], False
+            while True:
+                close = pairs.get(position + 1, end)
+                conditions, pure = data_conditions(tokens, position + 1, close)
+                body = close + 1
+                chain.append({"line": tokens[position].line, "conditions": conditions, "pure": pure})
+                position = pairs.get(body, body) + 1 if _is(tokens[body], "punct", "{") else body
+                if position < end and _is(tokens[position], "name", "else"):
+                    if _is(tokens[position + 1], "name", "if") and _is(tokens[position + 2], "punct", "("):
+                        position += 1
+                        continue
+                    default = True
+                    body = position + 1
+                    position = pairs.get(body, body) + 1 if _is(tokens[body], "punct", "{") else body
+                break
+            chains.append({"branches": chain, "default": default})
+            continue
+        if token.kind == "punct" and token.value in ("(", "[", "{") and position in pairs:
+            position = pairs[position] + 1
+            continue
+        position += 1
+    return chains
+
+
+def _sent_callbacks(tokens):
+    """[Condition, line] for every ``callback_data:`` value: exact literals, or the static prefix of a built one"""
+    sent = []
+    for i, token in enumerate(tokens[:-2]):
+        if not (_is(token, "name", "callback_data") and _is(tokens[i + 1], "punct", ":")):
+            continue
+        value, following = tokens[i + 2], tokens[i + 3] if i + 3 < len(tokens) else None
+        if value.kind == "string":
+            kind = PREFIX if _is(following, "punct", "+") else EXACT
+        elif value.kind == "template":
+            # A template's text is followed by punctuation only when it has no ${...} part
+            static = following is None or (following.kind == "punct" and following.value in (",", "}", "]", ")"))
+            kind = EXACT if static else PREFIX
+        else:
+            continue
+        sent.append([kind, value.value, value.line])
+    return sent
+
+
+def extract_dispatch(text, event="callback_query"):
+    """Branches and sent callbacks of one bot source, as plain JSON-serializable dicts"""
+    tokens = tokenize(text)
+    pairs = bracket_pairs(tokens)
+    data = {"handler_line": None, "branches": [], "default": False, "callbacks": _sent_callbacks(tokens)}
+    body = _handler_body(tokens, pairs, event)
+    if body is None:
+        return data
+    data["handler_line"] = tokens[body[0]].line
+    # The dispatch chain is the longest one that tests `data`, not e.g. an early-return guard
+    chains = [chain for chain in _chains(tokens, pairs, *body) if any(branch["conditions"] for branch in chain["branches"])]
+    if chains:
+        chain = max(chains, key=lambda chain: len(chain["branches"]))
+        data["branches"] = [
+            {"line": branch["line"], "conditions": [list(condition) for condition in branch["conditions"]], "pure": branch["pure"]}
+            for branch in chain["branches"]
+        ]
+        data["default"] = chain["default"]
+    return data
+
+
+class Branch:
+    __slots__ = ("index", "line", "conditions", "pure")
+
+    def __init__(self, index, line, conditions, pure):
+        self.index = index
+        self.line = line
+        self.conditions = conditions
+        self.pure = pure
+
+    @property
+    def label(self):
+        return " || ".join(label(condition) for condition in self.conditions) or "<condition>"
+
+    def __repr__(self):
+        return f"Branch({self.index}, {self.label!r}, line {self.line})"
+
+
+def _covers(earlier, later):
+    """Whether every value matching `later` also matches `earlier`"""
+    if earlier.kind == PREFIX:
+        return later.literal.startswith(earlier.literal)
+    return later.kind == EXACT and later.literal == earlier.literal
+
+
+class CallbackDispatch:
+    def __init__(self, data):
+        self.handler_line = data["handler_line"]
+        self.default = data["default"]
+        self.branches = [
+            Branch(index, branch["line"], [Condition(*condition) for condition in branch["conditions"]], branch["pure"])
+            for index, branch in enumerate(data["branches"])
+        ]
+        self.callbacks = [(Condition(kind, literal), line) for kind, literal, line in data["callbacks"]]
+
+        # Flattened chain in evaluation order: (branch, comparisons made once this condition has been tested)
+        self.order = []
+        for branch in self.branches:
+            for condition in branch.conditions or [None]:
+                self.order.append((branch, condition, len(self.order) + 1))
+
+        # Trie over the condition literals; each node keeps the first (lowest-order) exact and prefix entry
+        self.trie = {}
+        for position, (branch, condition, _) in enumerate(self.order):
+            if condition is None or not branch.pure:
+                continue
+            node = self.trie
+            for char in condition.literal:
+                node = node.setdefault(char, {})
+            node.setdefault(condition.kind, position)
+
+    def _walk(self, value, exact):
+        """Lowest chain position whose condition surely matches `value` (a whole callback, or only its prefix)"""
+        best, node = None, self.trie
+        for char in value:
+            if PREFIX in node and (best is None or node[PREFIX] < best):
+                best = node[PREFIX]
+            node = node.get(char)
+            if node is None:
+                return best
+        for kind in (PREFIX, EXACT) if exact else (PREFIX,):
+            if kind in node and (best is None or node[kind] < best):
+                best = node[kind]
+        return best
+
+    def resolve(self, value, exact=True):
+        """The Branch `value` is dispatched to, or None when it falls through the whole chain
+
+        With ``exact=False``, `value` is only the static prefix of a callback; the
+        branch is the first one every callback with that prefix reaches.
+        """
+        position = self._walk(value, exact)
+        return None if position is None else self.order[position][0]
+
+    def comparisons(self, value, exact=True):
+        """Conditions the if/else-if chain tests before it settles `value`"""
+        position = self._walk(value, exact)
+        return len(self.order) if position is None else self.order[position][2]
+
+    def shadowed(self):
+        """[(Branch, [shadowing Branch])] for branches no callback can reach"""
+        shadowed = []
+        for branch in self.branches:
+            if not branch.conditions:
+                continue
+            by = self._shadowing(branch)
+            if all(by[condition] for condition in branch.conditions):
+                shadowed.append((branch, sorted({earlier for shadows in by.values() for earlier in shadows}, key=lambda b: b.index)))
+        return shadowed
+
+    def dead_conditions(self):
+        """[(Branch, Condition, [shadowing Branch])] for alternatives that can never be the one that matches"""
+        dead = []
+        for branch in self.branches:
+            for condition, by in self._shadowing(branch).items():
+                if by:
+                    dead.append((branch, condition, by))
+        return dead
+
+    def _shadowing(self, branch):
+        by = {}
+        for position, condition in enumerate(branch.conditions):
+            earlier = [other for other in self.branches[:branch.index] if other.pure and any(_covers(c, condition) for c in other.conditions)]
+            earlier += [branch] if any(_covers(c, condition) for c in branch.conditions[:position]) else []
+            by[condition] = earlier
+        return by
+
+    def unhandled(self):
+        """Sent callbacks that fall through to the final ``else`` (or nowhere)"""
+        return [(condition, line) for condition, line in self.callbacks if self.resolve(condition.literal, condition.kind == EXACT) is None]
+
+    def table(self):
+        """{sent callback label: {"branch", "line", "comparisons"}}, first send site per label"""
+        table = {}
+        for condition, line in self.callbacks:
+            name = label(condition)
+            if name in table:
+                continue
+            exact = condition.kind == EXACT
+            branch = self.resolve(condition.literal, exact)
+            table[name] = {
+                "branch": None if branch is None else branch.label,
+                "line": line,
+                "comparisons": self.comparisons(condition.literal, exact),
+            }
+        return table
+
+    def cost(self):
+        """Size of the chain and the comparisons it makes per sent callback"""
+        table = self.table()
+        comparisons = [entry["comparisons"] for entry in table.values()]
+        return {
+            "branches": len(self.branches),
+            "conditions": len(self.order),
+            # Anything that matches no condition is compared against all of them
+            "worst_case_comparisons": len(self.order),
+            "worst_sent_comparisons": max(comparisons, default=0),
+            "average_comparisons": round(sum(comparisons) / len(comparisons), 2) if comparisons else 0.0,
+            # The trie reads each callback once instead
+            "average_trie_steps": round(sum(len(name.rstrip("*")) for name in table) / len(table), 2) if table else 0.0,
+        }
+
+    def report(self):
+        return {
+            "handler_line": self.handler_line,
+            "branches": [{"branch": branch.label, "line": branch.line, "pure": branch.pure} for branch in self.branches],
+            "shadowed": [{"branch": branch.label, "line": branch.line, "by": [other.label for other in by]}
+                         for branch, by in self.shadowed()],
+            "unhandled": [{"callback": label(condition), "line": line} for condition, line in self.unhandled()],
+            "table": self.table(),
+            "cost": self.cost(),
+        }
+
+
+_dispatches = {}
+
+
+def callback_dispatch(file="bot.js", root=TELEGRAM_BOT_DIR):
+    """The CallbackDispatch of `file`, re-extracted only when its content changed"""
+    path = Path(root) / file
+    digest = corpus.digest(path)
+    cached = _dispatches.get(str(path.resolve()))
+    if cached is None or cached[0] != digest:
+        digest, data = cache.load(path, extract_dispatch)
+        cached = _dispatches[str(path.resolve())] = (digest, CallbackDispatch(data))
+    return cached[1]
@@ -0,0 +1,259 @@
+"""
+Incremental Verification
+Reuses a suite's last result while nothing it read has changed
+
+Suites run under verification.worker, which records every input as the suite runs:
+
+- ``file``: files opened for reading (including through the source corpus) or
+  stat'ed, e.g. an ``exists()`` check, keyed by their SHA-256 (None when missing)
+- ``listing``: directories listed or globbed, keyed by their sorted entry names
+- ``tool``: executables whose output is a pure function of their input files
+  (``node -c <file>``, the verification.syntax server), keyed by mtime and size
+- the suite script itself and every repository module it imported
+
+A run that resolves or connects to a host, spawns any other process or reads /proc, /sys
+or /dev depends on more than files. It is marked volatile and never reused.
+
+``ResultCache`` stores each cacheable run with the fingerprints of its inputs in
+``.verification-cache/results``. The next run reuses the stored result only if
+every fingerprint still matches. Editing telegram-bot/bot.js re-runs the suites
+that read it, and only those.
+"""
+
+import io
+import os
+import sys
+import time
+import shutil
+import socket
+import hashlib
+import builtins
+import subprocess
+
+from verification.cache import CACHE_DIR, ContentCache, REPO_ROOT
+from verification.syntax import SERVER_SCRIPT
+
+VERSION = 1
+VOLATILE_PREFIXES = ("/proc/", "/sys/", "/dev/")
+# Commands whose result depends only on the files named in their arguments
+PURE_COMMANDS = {"node": ("-c", "--check", str(SERVER_SCRIPT))}
+
+cache = ContentCache("results", VERSION)
+
+
+def fingerprint(kind, path):
+    """Current fingerprint of one recorded input, None when it does not exist"""
+    try:
+        if kind == "file":
+            if os.path.isdir(path):
+                return "directory"
+            with open(path, "rb") as f:
+                return hashlib.file_digest(f, "sha256").hexdigest()
+        if kind == "listing":
+            return hashlib.sha256("\n".join(sorted(os.listdir(path))).encode()).hexdigest()
+        if kind == "tool":
+            stat = os.stat(path)
+            return f"{stat.st_mtime_ns}:{stat.st_size}"
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+    except OSError as e:
+        return f"error:{e.errno}"
+    raise ValueError(f"Unknown input kind: {kind}")
+
+
+def _path(path, cwd=None):
+    if isinstance(path, int):
+        return None
+    path = os.fsdecode(os.fspath(path))
+    return os.path.normpath(os.path.join(cwd or os.getcwd(), path))
+
+
+class InputRecorder:
+    """Records what a suite reads by wrapping open, stat, directory listing, subprocess and socket calls"""
+
+    def __init__(self):
+        self.inputs = {"file": set(), "listing": set(), "tool": set()}
+        self.volatile = []
+        self._originals = []
+        self._paused = False
+
+    def add(self, kind, path):
+        if path is None or self._paused:
+            return
+        if path.startswith(VOLATILE_PREFIXES):
+            self.mark_volatile(f"reads {path}")
+        else:
+            self.inputs[kind].add(path)
+
+    def mark_volatile(self, reason):
+        if reason not in self.volatile:
+            self.volatile.append(reason)
+
+    def _patch(self, owner, name, replacement):
+        self._originals.append((owner, name, getattr(owner, name)))
+        setattr(owner, name, replacement)
+
+    def install(self):
+        recorder = self
+        original_open, original_stat = builtins.open, os.stat
+        original_listdir, original_scandir = os.listdir, os.scandir
+        original_connect, original_connect_ex = socket.socket.connect, socket.socket.connect_ex
+        original_getaddrinfo = socket.getaddrinfo
+
+        def recording_open(file, mode="r", *args, **kwargs):
+            if not any(flag in mode for flag in "wax+"):
+                recorder.add("file", _path(file))
+            return original_open(file, mode, *args, **kwargs)
+
+        def recording_stat(path, *args, **kwargs):
+            recorder.add("file", _path(path))
+            return original_stat(path, *args, **kwargs)
+
+        def recording_listdir(path="."):
+            recorder.add("listing", _path(path))
+            return original_listdir(path)
+
+        def recording_scandir(path="."):
+            recorder.add("listing", _path(path))
+            return original_scandir(path)
+
+        class RecordingPopen(subprocess.Popen):
+            def __init__(self, args, *popen_args, **kwargs):
+                recorder.command(args, kwargs.get("cwd"))
+                super().__init__(args, *popen_args, **kwargs)
+
+        def connect(sock, address):
+            recorder.mark_volatile(f"connects to {address}")
+            return original_connect(sock, address)
+
+        def connect_ex(sock, address):
+            recorder.mark_volatile(f"connects to {address}")
+            return original_connect_ex(sock, address)
+
+        def getaddrinfo(host, *args, **kwargs):
+            recorder.mark_volatile(f"resolves {host}")
+            return original_getaddrinfo(host, *args, **kwargs)
+
+        def shell(original):
+            def run(command, *args, **kwargs):
+                recorder.mark_volatile(f"runs {command!r}")
+                return original(command, *args, **kwargs)
+            return run
+
+        self._patch(builtins, "open", recording_open)
+        self._patch(io, "open", recording_open)
+        self._patch(os, "stat", recording_stat)
+        self._patch(os, "listdir", recording_listdir)
+        self._patch(os, "scandir", recording_scandir)
+        self._patch(subprocess, "Popen", RecordingPopen)
+        self._patch(socket.socket, "connect", connect)
+        self._patch(socket.socket, "connect_ex", connect_ex)
+        self._patch(socket, "getaddrinfo", getaddrinfo)
+        self._patch(os, "system", shell(os.system))
+        self._patch(os, "popen", shell(os.popen))
+        return self
+
+    def uninstall(self):
+        while self._originals:
+            owner, name, original = self._originals.pop()
+            setattr(owner, name, original)
+
+    def command(self, args, cwd=None):
+        """Record a subprocess: a pure command adds its executable and input files, anything else is volatile"""
+        argv = [args] if isinstance(args, (str, bytes, os.PathLike)) else list(args)
+        argv = [os.fsdecode(os.fspath(arg)) for arg in argv]
+        program = os.path.basename(argv[0]) if argv else ""
+        flags = PURE_COMMANDS.get(program)
+        if flags is None or len(argv) < 2 or not any(flag in argv for flag in flags):
+            self.mark_volatile(f"runs {' '.join(argv)[:80]}")
+            return
+        # which() stats every PATH entry; those lookups are not the suite's inputs
+        self._paused = True
+        try:
+            executable = shutil.which(argv[0])
+        finally:
+            self._paused = False
+        self.add("tool", os.path.realpath(executable) if executable else None)
+        for argument in argv[1:]:
+            if not argument.startswith("-"):
+                self.add("file", _path(argument, os.fspath(cwd) if cwd else None))
+
+    def record(self, script):
+        """Inputs with their fingerprints, plus the suite script and every repository module it loaded"""
+        self.add("file", _path(script))
+        for module in list(sys.modules.values()):
+            file = getattr(module, "__file__", None)
+            if file and os.path.abspath(file).startswith(str(REPO_ROOT) + os.sep):
+                self.add("file", os.path.abspath(file))
+        cache_dir = str(CACHE_DIR) + os.sep
+        return {
+            "inputs": {
+                kind: {path: fingerprint(kind, path) for path in sorted(paths) if not path.startswith(cache_dir)}
+                for kind, paths in self.inputs.items()
+            },
+            "volatile": self.volatile,
+        }
+
+
+class ResultCache:
+    """Suite results keyed by the fingerprints of everything the suite read"""
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.recorded = {}  # suite name -> (files, listings) it read last time, as real paths
+
+    def _remember(self, suite, inputs):
+        self.recorded[suite.name] = (
+            {os.path.realpath(path) for path in inputs["file"]} | {os.path.realpath(path) for path in inputs["tool"]},
+            {os.path.realpath(path) for path in inputs["listing"]},
+        )
+
+    def lookup(self, suite):
+        """The stored result of `suite` if none of its inputs changed since, else None"""
+        entry = cache.get(suite.name)
+        if entry is None or entry.get("python") != sys.version or entry.get("path") != str(suite.path):
+            self.misses += 1
+            return None
+        for kind, inputs in entry["inputs"].items():
+            for path, expected in inputs.items():
+                if fingerprint(kind, path) != expected:
+                    self.misses += 1
+                    return None
+        self.hits += 1
+        self._remember(suite, entry["inputs"])
+        return {**entry["result"], "cached": True, "cached_at": entry["stored_at"]}
+
+    def store(self, suite, result, record):
+        """Keep `result` for reuse unless the run was volatile; returns whether it was stored"""
+        if record is not None:
+            self._remember(suite, record["inputs"])
+        if record is None or record["volatile"] or result["status"] not in ("passed", "failed"):
+            return False
+        cache.put(suite.name, {
+            "path": str(suite.path),
+            "python": sys.version,
+            "stored_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "inputs": record["inputs"],
+            "result": result,
+        })
+        self.stores += 1
+        return True
+
+    def dependents(self, suites, paths):
+        """The suites that read any of `paths` (or listed their directories) in their last run
+
+        Suites never recorded in this process are included, since what they read is unknown.
+        """
+        changed = {os.path.realpath(path) for path in paths}
+        directories = {os.path.dirname(path) for path in changed}
+        affected = []
+        for suite in suites:
+            recorded = self.recorded.get(suite.name)
+            if recorded is None or recorded[0] & changed or recorded[1] & directories:
+                affected.append(suite)
+        return affected
+
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses, "stores": self.stores}
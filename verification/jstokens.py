@@ -0,0 +1,141 @@
+"""
+JavaScript Tokenizer
+A small pure-Python tokenizer for the telegram-bot sources, enough to index symbols and calls
+
+Tokens are ``Token(kind, value, line)`` with kind one of:
+
+- ``name``: identifiers and keywords
+- ``number``
+- ``string``: quoted literals, value without the quotes
+- ``template``: the literal text of a template string; each ``${...}`` expression
+  in it is tokenized as ordinary tokens between its text parts
+- ``regex``
+- ``punct``
+
+Comments and whitespace are dropped. A ``/`` starts a regex literal when the
+previous token cannot end an expression, the usual heuristic that needs no
+parser. It is right for the ``bot.onText(/\\/start/, ...)`` style used here.
+"""
+
+import re
+from collections import namedtuple
+
+Token = namedtuple("Token", "kind value line")
+
+_TOKEN = re.compile(r"""
+    (?P<space>\s+)
+  | (?P<comment>//[^\n]*|/\*.*?(?:\*/|\Z))
+  | (?P<string>'(?:\\.|[^'\\\n])*'?|"(?:\\.|[^"\\\n])*"?)
+  | (?P<number>(?:0[xXbBoO][\da-fA-F_]+|(?:\d[\d_]*\.?[\d_]*|\.\d[\d_]*)(?:[eE][+-]?\d+)?)n?)
+  | (?P<name>[A-Za-z_$\u0080-\U0010ffff][\w$\u0080-\U0010ffff]*)
+  | (?P<backtick>`)
+  | (?P<slash>/)
+  | (?P<punct>>>>=?|\.\.\.|===|!==|\*\*=?|<<=?|>>=?|&&=?|\|\|=?|\?\?=?|\?\.|=>|[=!<>+\-*%&|^]=|\+\+|--|[{}()\[\];,.<>+\-*%&|^!~?:=@\#])
+""", re.VERBOSE | re.DOTALL)
+
+_REGEX = re.compile(r"/(?:\\.|\[(?:\\.|[^\]\\\n])*\]|[^/\\\n\[])+/[a-z]*")
+_TEMPLATE_TEXT = re.compile(r"(?:\\.|[^`\\$]|\$(?!\{))*", re.DOTALL)
+
+# After these a `/` divides; after anything else it starts a regex literal
+_EXPRESSION_END_PUNCT = {")", "]", "}", "++", "--"}
+_REGEX_AFTER_KEYWORDS = {
+    "return", "typeof", "instanceof", "in", "of", "new", "delete", "void", "throw", "case", "do", "else", "yield", "await",
+}
+
+
+def _regex_allowed(previous):
+    if previous is None:
+        return True
+    if previous.kind == "name":
+        return previous.value in _REGEX_AFTER_KEYWORDS
+    if previous.kind == "punct":
+        return previous.value not in _EXPRESSION_END_PUNCT
+    return False
+
+
+def tokenize(source):
+    """List of Tokens for `source`; malformed input degrades to punct tokens instead of raising"""
+    tokens = []
+    append = tokens.append
+    match_token = _TOKEN.match
+    position, line, end = 0, 1, len(source)
+    # Brace depth at each open `${`: the `}` that returns to it resumes the template text
+    templates = []
+    depth = 0
+    previous = None
+
+    def template_text(position, line):
+        """Template text from `position` up to the closing backtick or the next `${`"""
+        text = _TEMPLATE_TEXT.match(source, position).group()
+        append(Token("template", text, line))
+        position += len(text)
+        line += text.count("\n")
+        if source.startswith("${", position):
+            templates.append(depth)
+            return position + 2, line
+        return position + 1, line
+
+    while position < end:
+        match = match_token(source, position)
+        if match is None:
+            previous = Token("punct", source[position], line)
+            append(previous)
+            position += 1
+            continue
+
+        kind, value = match.lastgroup, match.group()
+        position = match.end()
+        if kind == "space" or kind == "comment":
+            line += value.count("\n")
+            continue
+
+        if kind == "backtick":
+            position, line = template_text(position, line)
+            previous = Token("template", "", line)
+            continue
+
+        if kind == "slash":
+            regex = _REGEX.match(source, match.start()) if _regex_allowed(previous) else None
+            if regex is not None:
+                previous = Token("regex", regex.group(), line)
+                append(previous)
+                position = regex.end()
+                continue
+            kind = "punct"
+            if source.startswith("=", position):
+                value, position = "/=", position + 1
+
+        if kind == "punct":
+            if value == "{":
+                depth += 1
+            elif value == "}":
+                if templates and templates[-1] == depth:
+                    templates.pop()
+                    position, line = template_text(position, line)
+                    previous = Token("template", "", line)
+                    continue
+                depth -= 1
+        elif kind == "string":
+            newlines = value.count("\n")
+            value = value[1:-1] if len(value) > 1 and value[-1] == value[0] else value[1:]
+            previous = Token(kind, value, line)
+            append(previous)
+            line += newlines
+            continue
+
+        previous = Token(kind, value, line)
+        append(previous)
+    return tokens
+
+
+def bracket_pairs(tokens):
+    """Index of each opening ``(``/``[``/``{`` token -> index of the token closing it"""
+    pairs, stack = {}, []
+    for i, (kind, value, _) in enumerate(tokens):
+        if kind != "punct":
+            continue
+        if value in ("(", "[", "{"):
+            stack.append(i)
+        elif value in (")", "]", "}") and stack:
+            pairs[stack.pop()] = i
+    return pairs
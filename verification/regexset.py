@@ -0,0 +1,103 @@
+"""
+Regex Sets
+Answers "which of these patterns occur in this file" for a whole pattern list, once per file content
+
+A RegexSet compiles its patterns once. ``search(text)`` gives the presence of each
+pattern, and RegexIndex caches that per (file content, flags, pattern). A check
+that runs again on an unchanged file therefore costs a dictionary lookup. When a
+later check brings new patterns, only those are searched.
+
+Each pattern keeps its own search instead of being merged into one
+``(?P<_0>...)|(?P<_1>...)`` alternation. In CPython's re an alternation loses sre's
+fast literal-prefix search and retries every alternative at every position.
+Unseen alternatives also still need their own search, because an earlier
+alternative's match can hide them. On bot.js that measured 25-30x slower than the
+separate searches (see verification_benchmark.py regexset).
+
+    matches = search_patterns(bot_content, session_patterns)
+    matches.any(session_patterns), matches.all(session_patterns), pattern in matches
+"""
+
+import re
+import threading
+
+
+class RegexSet:
+    """A fixed set of patterns, compiled once"""
+
+    def __init__(self, patterns, flags=0):
+        self.flags = flags
+        self.compiled = {pattern: re.compile(pattern, flags) for pattern in dict.fromkeys(patterns)}
+
+    def search(self, text):
+        """pattern -> whether it occurs anywhere in `text`"""
+        return {pattern: compiled.search(text) is not None for pattern, compiled in self.compiled.items()}
+
+
+class RegexMatches:
+    """Presence of each pattern of a set in one text"""
+
+    def __init__(self, found, flags):
+        self._found = found
+        self.flags = flags
+
+    def __contains__(self, pattern):
+        try:
+            return self._found[pattern]
+        except KeyError:
+            raise KeyError(f"pattern was not searched for: {pattern!r}") from None
+
+    def found(self, patterns):
+        return [pattern for pattern in patterns if pattern in self]
+
+    def missing(self, patterns):
+        return [pattern for pattern in patterns if pattern not in self]
+
+    def all(self, patterns):
+        return not self.missing(patterns)
+
+    def any(self, patterns):
+        return any(pattern in self for pattern in patterns)
+
+
+class RegexIndex:
+    def __init__(self):
+        self._sets = {}
+        self._results = {}
+        self._lock = threading.Lock()
+        self.scans = 0
+        self.hits = 0
+
+    def regex_set(self, patterns, flags=0):
+        key = (frozenset(patterns), flags)
+        regex_set = self._sets.get(key)
+        if regex_set is None:
+            regex_set = self._sets[key] = RegexSet(sorted(key[0]), flags)
+        return regex_set
+
+    def search(self, text, patterns, flags=0):
+        """Presence of `patterns` in `text`, searching only for patterns this content has not been searched for"""
+        with self._lock:
+            # str caches its own hash, so keying on the text itself costs one pass per distinct string
+            found = self._results.setdefault((text, flags), {})
+            new = [pattern for pattern in patterns if pattern not in found]
+            if new:
+                found.update(self.regex_set(new, flags).search(text))
+                self.scans += 1
+            else:
+                self.hits += 1
+        return RegexMatches(found, flags)
+
+    def clear(self):
+        with self._lock:
+            self._results.clear()
+
+    def stats(self):
+        return {"sets": len(self._sets), "texts": len(self._results), "scans": self.scans, "hits": self.hits}
+
+
+index = RegexIndex()
+
+
+def search_patterns(text, patterns, flags=0):
+    return index.search(text, patterns, flags)
@@ -0,0 +1,363 @@
+#!/usr/bin/env python3
+"""
+Verification Runner
+Discovers every verification suite at the repository root and runs them in parallel
+
+A suite is a ``*_test.py`` / ``*_retest.py`` script with a ``__main__`` block and a
+tester class: a ``*Tester`` class, or any class with ``test_*`` methods. Its
+``run_*`` method, if any, is recorded as the entry point. Scripts that do not
+qualify are listed with the reason they were skipped. Each suite runs in
+its own interpreter and process group, so a hung suite can be killed without
+touching the others. The runner keeps ``--jobs`` of them going at once, enforces
+``--timeout`` per suite and merges exit codes, timings, output and each suite's
+own results file into one report. A full pass then takes about as long as the
+slowest suite.
+
+Suites run under verification.worker, which records every file they read. A
+suite whose inputs are all unchanged since its last run is not run again: its
+stored result is reused (see verification.incremental). ``--force`` re-runs
+everything. Before the suites start, every telegram-bot/*.js file is
+syntax-checked once, here, so their node checks are cache hits (see
+verification.syntax).
+
+``--watch`` keeps running after the first pass. When files under telegram-bot/
+or backend/ change, it re-runs only the suites that read them, printing each
+result as it arrives (see verification.watch).
+
+Usage:
+    python -m verification
+    python -m verification --jobs 8 --timeout 120
+    python -m verification --suite backend_test --suite airdrop_test --verbose
+    python -m verification --force
+    python -m verification --watch
+    python -m verification --list
+"""
+
+import os
+import ast
+import sys
+import json
+import time
+import signal
+import argparse
+import tempfile
+import subprocess
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from verification.incremental import ResultCache
+from verification.syntax import checker, prewarm
+from verification.watch import changes
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+PROJECT_ROOT = Path("/app")
+SUITE_PATTERNS = ("*_test.py", "*_retest.py")
+TEST_PREFIXES = ("test_", "verify_")
+WATCH_DIRS = (REPO_ROOT / "telegram-bot", REPO_ROOT / "backend")
+OUTPUT_TAIL_LINES = 40
+
+
+class Suite:
+    def __init__(self, name, path, tester, entry, tests, results_files):
+        self.name = name
+        self.path = path
+        self.tester = tester
+        self.entry = entry
+        self.tests = tests
+        self.results_files = results_files
+
+    def describe(self):
+        return {
+            "path": str(self.path),
+            "tester": self.tester,
+            "entry": self.entry,
+            "tests": self.tests,
+        }
+
+
+def _has_main_block(tree):
+    for node in tree.body:
+        if isinstance(node, ast.If) and isinstance(node.test, ast.Compare):
+            left = node.test.left
+            if isinstance(left, ast.Name) and left.id == "__name__":
+                return True
+    return False
+
+
+def parse_suite(path):
+    """(Suite, None) for a runnable verification suite, else (None, why it was skipped)"""
+    try:
+        tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
+    except (SyntaxError, UnicodeDecodeError) as e:
+        return None, f"cannot be parsed: {e}"
+    if not _has_main_block(tree):
+        return None, "no __main__ block"
+
+    for node in tree.body:
+        if not isinstance(node, ast.ClassDef):
+            continue
+        methods = [item.name for item in node.body if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef))]
+        tests = [name for name in methods if name.startswith(TEST_PREFIXES)]
+        entries = [name for name in methods if name.startswith("run_")]
+        if node.name.endswith("Tester") or any(name.startswith("test_") for name in methods):
+            # Results files are written under /app by convention, either as a full path or a bare name
+            results_files = sorted({
+                str(PROJECT_ROOT / Path(constant.value).name)
+                for constant in ast.walk(tree)
+                if isinstance(constant, ast.Constant) and isinstance(constant.value, str)
+                and constant.value.endswith("results.json")
+            })
+            return Suite(path.stem, path, node.name, entries[0] if entries else None, tests, results_files), None
+    return None, "no tester class (a *Tester class or a class with test_* methods)"
+
+
+def discover(root=REPO_ROOT, names=None):
+    """(suites, skipped) under `root`: every verification suite, optionally restricted to the given
+    names, and (path, reason) for each matching script that is not one"""
+    paths = sorted({path for pattern in SUITE_PATTERNS for path in root.glob(pattern)})
+    suites, skipped = [], []
+    for path in paths:
+        suite, reason = parse_suite(path)
+        if suite is None:
+            skipped.append((path, reason))
+        else:
+            suites.append(suite)
+    if names:
+        wanted = set(names)
+        unknown = wanted - {suite.name for suite in suites}
+        if unknown:
+            raise SystemExit(f"Unknown suite(s): {', '.join(sorted(unknown))}")
+        suites = [suite for suite in suites if suite.name in wanted]
+    return suites, skipped
+
+
+def suite_command(suite, record=None):
+    if record is None:
+        return [sys.executable, str(suite.path)]
+    return [sys.executable, "-m", "verification.worker", "--record", record, str(suite.path)]
+
+
+def _read_record(record):
+    try:
+        with open(record) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+    finally:
+        try:
+            os.unlink(record)
+        except OSError:
+            pass
+
+
+def run_suite(suite, timeout, env=None, cache=None):
+    """Run one suite to completion (or until `timeout`) and describe the outcome
+
+    With a ResultCache, the suite runs under verification.worker and its result
+    is stored with the inputs it read.
+    """
+    started_wall = time.time()
+    started = time.perf_counter()
+    env = {**os.environ, "PYTHONUNBUFFERED": "1", "VERIFICATION_RUNNER": "1", **(env or {})}
+    record = None
+    if cache is not None:
+        fd, record = tempfile.mkstemp(prefix=f"{suite.name}.", suffix=".record.json")
+        os.close(fd)
+    try:
+        process = subprocess.Popen(
+            suite_command(suite, record),
+            cwd=REPO_ROOT,
+            env=env,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            errors="replace",
+            start_new_session=True,  # own process group: a timeout also kills node/subprocess children
+        )
+    except OSError as e:
+        if record is not None:
+            _read_record(record)
+        return {"status": "error", "exit_code": None, "duration_s": 0.0, "output": str(e)}
+
+    try:
+        output, _ = process.communicate(timeout=timeout)
+        status = "passed" if process.returncode == 0 else "failed"
+    except subprocess.TimeoutExpired:
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+        output, _ = process.communicate()
+        status = "timeout"
+
+    result = {
+        "status": status,
+        "exit_code": process.returncode,
+        "duration_s": round(time.perf_counter() - started, 3),
+        "output": output,
+    }
+    # Attach the suite's own results file when this run (re)wrote it
+    for results_file in suite.results_files:
+        path = Path(results_file)
+        try:
+            if path.stat().st_mtime >= started_wall:
+                result["results_file"] = results_file
+                result["results"] = json.loads(path.read_text())
+                break
+        except (OSError, ValueError):
+            continue
+
+    if record is not None:
+        recorded = _read_record(record)
+        if not cache.store(suite, result, recorded) and recorded is not None and recorded["volatile"]:
+            result["volatile"] = recorded["volatile"]
+    return result
+
+
+STATUS_EMOJI = {"passed": "✅", "failed": "❌", "timeout": "⏰", "error": "💥"}
+
+
+class VerificationRunner:
+    def __init__(self, suites, jobs, timeout, verbose=False, cache=None, force=False):
+        self.suites = suites
+        self.jobs = jobs
+        self.timeout = timeout
+        self.verbose = verbose
+        self.cache = cache
+        self.force = force
+        self.results = {}
+
+    def report_suite(self, suite, result):
+        cached = f"  ♻️ cached {result['cached_at']}" if result.get("cached") else ""
+        print(f"{STATUS_EMOJI[result['status']]} {suite.name:<40} {result['status']:<8} "
+              f"exit {str(result['exit_code']):>4}  {result['duration_s']:>7.2f}s{cached}", flush=True)
+        if self.verbose or result["status"] != "passed":
+            lines = result["output"].rstrip().splitlines()
+            shown = lines if self.verbose else lines[-OUTPUT_TAIL_LINES:]
+            if len(shown) < len(lines):
+                print(f"   ... {len(lines) - len(shown)} earlier lines omitted")
+            for line in shown:
+                print(f"   │ {line}")
+
+    def prewarm_syntax(self):
+        """Syntax-check the telegram-bot sources once here, so suites only read cached results"""
+        try:
+            checks = checker.checks
+            results = prewarm()
+            print(f"🧪 Syntax-checked {len(results)} telegram-bot files ({checker.checks - checks} changed)", flush=True)
+        except (OSError, subprocess.TimeoutExpired) as e:
+            print(f"⚠️ Could not pre-check JS syntax, suites will check it themselves: {e}", flush=True)
+
+    def run(self):
+        print(f"🚀 RUNNING {len(self.suites)} VERIFICATION SUITES ({self.jobs} at a time, {self.timeout:g}s timeout each)")
+        print("=" * 60)
+        started = time.perf_counter()
+        pending = []
+        for suite in self.suites:
+            cached = None if self.cache is None or self.force else self.cache.lookup(suite)
+            if cached is None:
+                pending.append(suite)
+            else:
+                self.results[suite.name] = cached
+                self.report_suite(suite, cached)
+        if pending:
+            self.prewarm_syntax()
+        with ThreadPoolExecutor(max_workers=self.jobs) as pool:
+            futures = {pool.submit(run_suite, suite, self.timeout, None, self.cache): suite for suite in pending}
+            for future in as_completed(futures):
+                suite = futures[future]
+                self.results[suite.name] = future.result()
+                self.report_suite(suite, self.results[suite.name])
+        wall_s = time.perf_counter() - started
+
+        summary = {status: 0 for status in STATUS_EMOJI}
+        for result in self.results.values():
+            summary[result["status"]] += 1
+        summary["total"] = len(self.results)
+        ran = {name: result for name, result in self.results.items() if not result.get("cached")}
+        suite_s = sum(result["duration_s"] for result in ran.values())
+        slowest = max(ran.items(), key=lambda item: item[1]["duration_s"], default=(None, None))[0]
+
+        print("\n" + "=" * 60)
+        print("📊 VERIFICATION SUMMARY")
+        print("=" * 60)
+        print(f"✅ Passed: {summary['passed']}  ❌ Failed: {summary['failed']}  "
+              f"⏰ Timed out: {summary['timeout']}  💥 Errors: {summary['error']}  (of {summary['total']})")
+        print(f"⏱️ Wall time {wall_s:.2f}s for {suite_s:.2f}s of suite time (slowest: {slowest})")
+        if len(ran) < len(self.results):
+            print(f"♻️ Reused {len(self.results) - len(ran)} cached results whose inputs are unchanged (--force re-runs them)")
+
+        return {
+            "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "jobs": self.jobs,
+            "timeout_s": self.timeout,
+            "wall_s": round(wall_s, 3),
+            "suite_s": round(suite_s, 3),
+            "summary": summary,
+            "cached": len(self.results) - len(ran),
+            "suites": {
+                suite.name: {
+                    **suite.describe(),
+                    **{key: value for key, value in self.results[suite.name].items() if key != "output"},
+                    "output_tail": self.results[suite.name]["output"].rstrip().splitlines()[-OUTPUT_TAIL_LINES:],
+                }
+                for suite in self.suites
+            },
+        }
+
+
+def watch(suites, jobs, timeout, verbose, cache):
+    """Re-run the suites that depend on each batch of changed files until interrupted"""
+    print(f"\n👀 Watching {', '.join(str(directory.relative_to(REPO_ROOT)) for directory in WATCH_DIRS)}/ (Ctrl+C to stop)")
+    try:
+        for changed in changes(WATCH_DIRS):
+            started = time.perf_counter()
+            affected = cache.dependents(suites, changed)
+            names = ", ".join(sorted(os.path.relpath(path, REPO_ROOT) for path in changed))
+            print(f"\n🔄 Changed: {names} — {len(affected)} of {len(suites)} suites affected")
+            if affected:
+                VerificationRunner(affected, jobs, timeout, verbose, cache).run()
+            print(f"⚡ Re-verified in {time.perf_counter() - started:.2f}s")
+    except KeyboardInterrupt:
+        print("\n👋 Stopped watching")
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m verification", description="Run the verification suites in parallel")
+    parser.add_argument("--suite", action="append", dest="suites", metavar="NAME", help="run only this suite (repeatable)")
+    parser.add_argument("--jobs", "-j", type=int, default=max(2, os.cpu_count() or 1), help="suites to run at once")
+    parser.add_argument("--timeout", type=float, default=120, help="seconds before a suite is killed")
+    parser.add_argument("--output", default=str(PROJECT_ROOT / "verification_results.json"), help="merged report path")
+    parser.add_argument("--list", action="store_true", help="list the discovered suites and exit")
+    parser.add_argument("--verbose", "-v", action="store_true", help="print every suite's output, not just failures")
+    parser.add_argument("--force", action="store_true", help="re-run every suite, even those whose inputs are unchanged")
+    parser.add_argument("--watch", action="store_true", help="after the first pass, re-run affected suites whenever telegram-bot/ or backend/ change")
+    args = parser.parse_args(argv)
+
+    suites, skipped = discover(names=args.suites)
+    for path, reason in skipped:
+        print(f"⏭️ Skipped {path.name}: {reason}")
+    if args.list:
+        for suite in suites:
+            entry = f"{suite.tester}.{suite.entry}()" if suite.entry else f"{suite.tester} via __main__"
+            print(f"{suite.name:<40} {entry} — {len(suite.tests)} tests")
+        return 0
+
+    cache = ResultCache()
+    runner = VerificationRunner(suites, max(1, args.jobs), args.timeout, args.verbose, cache, args.force)
+    report = runner.run()
+    try:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"\n💾 Merged report saved to: {args.output}")
+    except OSError as e:
+        print(f"\n⚠️ Could not save merged report to {args.output}: {e}")
+
+    if args.watch:
+        return watch(suites, max(1, args.jobs), args.timeout, args.verbose, cache)
+    return 0 if report["summary"]["passed"] == report["summary"]["total"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,236 @@
+"""
+JS Symbol Index
+What each telegram-bot source defines and uses, so checks can look symbols up instead of rescanning text
+
+Per file, built from verification.jstokens:
+
+- ``functions``: ``function name``, plus ``const/let/var name = [async] function`` and arrow functions
+- ``classes``: ``class Name``
+- ``methods``: ``Class.method`` for methods defined directly in a class body
+- ``requires``: modules passed to ``require('...')``
+- ``bindings``: local name -> required module, for ``const X = require(...)`` and ``const { X } = require(...)``
+- ``news``: classes instantiated with ``new``
+- ``instances``: ``x`` / ``this.x`` -> class, for ``x = new Class(...)``
+- ``strings``: quoted string literals and template text
+
+The line kinds map a name to the lines it occurs on. Bindings and instances map
+a name to its module or class. Indexes persist in
+``.verification-cache/symbols`` keyed by file content, so only changed files are
+re-tokenized. Lookups are dictionary lookups:
+
+    symbols = symbol_index()
+    symbols.has_class("GenuineBlockchainManager", "genuine-blockchain-manager.js")
+    symbols.has_function("executeAITokenCreation"), symbols.has_new("RealTradingManager", "bot.js")
+"""
+
+from pathlib import Path
+
+from verification.cache import ContentCache
+from verification.corpus import corpus
+from verification.jstokens import tokenize
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+TELEGRAM_BOT_DIR = REPO_ROOT / "telegram-bot"
+# name -> [lines]
+LINE_KINDS = ("functions", "classes", "methods", "requires", "news", "strings")
+# name -> value (the module or class it stands for)
+MAP_KINDS = ("bindings", "instances")
+KINDS = LINE_KINDS + MAP_KINDS
+VERSION = 1
+
+_DECLARATIONS = {"const", "let", "var"}
+_NOT_METHODS = {"if", "for", "while", "switch", "catch", "function", "return", "super"}
+
+cache = ContentCache("symbols", VERSION)
+
+
+def _closing(tokens, index, opening, closing):
+    """Index of the token closing the bracket at `index`"""
+    depth = 0
+    for position in range(index, len(tokens)):
+        kind, value, _ = tokens[position]
+        if kind == "punct":
+            if value == opening:
+                depth += 1
+            elif value == closing:
+                depth -= 1
+                if not depth:
+                    return position
+    return len(tokens) - 1
+
+
+def _is(token, kind, value=None):
+    return token is not None and token.kind == kind and (value is None or token.value == value)
+
+
+def _function_value(tokens, index):
+    """Whether the expression starting at `index` is a function or arrow function"""
+    at = lambda position: tokens[position] if position < len(tokens) else None
+    if _is(at(index), "name", "async"):
+        index += 1
+    if _is(at(index), "name", "function"):
+        return True
+    if _is(at(index), "name") and _is(at(index + 1), "punct", "=>"):
+        return True
+    if _is(at(index), "punct", "("):
+        return _is(at(_closing(tokens, index, "(", ")") + 1), "punct", "=>")
+    return False
+
+
+def index_source(text):
+    """Symbol index of one JS source, as plain JSON-serializable dicts"""
+    tokens = tokenize(text)
+    symbols = {kind: {} for kind in KINDS}
+    add = lambda kind, name, line: symbols[kind].setdefault(name, []).append(line)
+    at = lambda position: tokens[position] if 0 <= position < len(tokens) else None
+
+    depth = 0
+    classes = []  # (name, depth of its body)
+    for i, (kind, value, line) in enumerate(tokens):
+        if kind in ("string", "template"):
+            if value:
+                add("strings", value, line)
+            continue
+        if kind == "punct":
+            if value == "{":
+                depth += 1
+            elif value == "}":
+                depth -= 1
+                if classes and classes[-1][1] > depth:
+                    classes.pop()
+            continue
+        if kind != "name":
+            continue
+
+        following = at(i + 1)
+        if value == "function":
+            name = at(i + 2) if _is(following, "punct", "*") else following
+            if _is(name, "name"):
+                add("functions", name.value, line)
+        elif value == "class" and _is(following, "name"):
+            add("classes", following.value, line)
+            classes.append((following.value, depth + 1))  # its body opens at the next `{`
+        elif value in _DECLARATIONS and _is(following, "name") and _is(at(i + 2), "punct", "="):
+            if _function_value(tokens, i + 3):
+                add("functions", following.value, line)
+        elif value == "require" and _is(following, "punct", "(") and _is(at(i + 2), "string") and _is(at(i + 3), "punct", ")"):
+            module = at(i + 2).value
+            add("requires", module, line)
+            if _is(at(i - 1), "punct", "="):
+                target = at(i - 2)
+                if _is(target, "name"):
+                    symbols["bindings"][target.value] = module
+                elif _is(target, "punct", "}"):
+                    position = i - 3
+                    while position >= 0 and not _is(tokens[position], "punct", "{"):
+                        if _is(tokens[position], "name") and not _is(at(position + 1), "punct", ":"):
+                            symbols["bindings"][tokens[position].value] = module
+                        position -= 1
+        elif value == "new" and _is(following, "name"):
+            parts, position = [following.value], i + 2
+            while _is(at(position), "punct", ".") and _is(at(position + 1), "name"):
+                parts.append(at(position + 1).value)
+                position += 2
+            cls = ".".join(parts)
+            add("news", cls, line)
+            if _is(at(i - 1), "punct", "=") and _is(at(i - 2), "name"):
+                target = at(i - 2).value
+                if _is(at(i - 3), "punct", ".") and _is(at(i - 4), "name", "this"):
+                    target = f"this.{target}"
+                symbols["instances"][target] = cls
+        elif classes and classes[-1][1] == depth and _is(following, "punct", "(") and value not in _NOT_METHODS \
+                and not _is(at(i - 1), "punct", ".") and not _is(at(i - 1), "punct", "="):
+            closing = _closing(tokens, i + 1, "(", ")")
+            if _is(at(closing + 1), "punct", "{"):
+                add("methods", f"{classes[-1][0]}.{value}", line)
+    return symbols
+
+
+class SymbolIndex:
+    def __init__(self, root=TELEGRAM_BOT_DIR, pattern="*.js"):
+        self.root = Path(root)
+        self.pattern = pattern
+        self.files = {}
+        self._digests = {}
+        self._merged = None
+
+    def refresh(self):
+        """Re-index files whose content changed since the last refresh (and drop deleted ones)"""
+        current = {}
+        for path in sorted(self.root.glob(self.pattern)):
+            name = path.name
+            digest, data = self._digests.get(name), self.files.get(name)
+            if corpus.digest(path) != digest:
+                digest, data = cache.load(path, index_source)
+                self._merged = None
+            current[name] = (digest, data)
+        if set(current) != set(self.files):
+            self._merged = None
+        self._digests = {name: digest for name, (digest, _) in current.items()}
+        self.files = {name: data for name, (_, data) in current.items()}
+        return self
+
+    def merged(self):
+        """kind -> name -> [(file, line)] (or [(file, value)] for MAP_KINDS) across every indexed file"""
+        if self._merged is None:
+            merged = {kind: {} for kind in KINDS}
+            for file, symbols in self.files.items():
+                for kind in LINE_KINDS:
+                    for name, lines in symbols[kind].items():
+                        merged[kind].setdefault(name, []).extend((file, line) for line in lines)
+                for kind in MAP_KINDS:
+                    for name, value in symbols[kind].items():
+                        merged[kind].setdefault(name, []).append((file, value))
+            self._merged = merged
+        return self._merged
+
+    def file(self, file):
+        """Symbols of one file: a name under the root (``"bot.js"``) or any path to a JS file"""
+        path = Path(file)
+        if len(path.parts) == 1 or path.resolve().parent == self.root.resolve():
+            return self.files.get(path.name, {})
+        return cache.load(path, index_source)[1] if path.exists() else {}
+
+    def where(self, kind, name, file=None):
+        """[(file, line)] (or [(file, value)] for MAP_KINDS) for `name` as `kind`, optionally in one file"""
+        if file is None:
+            return self.merged()[kind].get(name, [])
+        entry = self.file(file).get(kind, {}).get(name)
+        if entry is None:
+            return []
+        file = Path(file).name
+        return [(file, line) for line in entry] if kind in LINE_KINDS else [(file, entry)]
+
+    def has(self, kind, name, file=None):
+        if file is not None:
+            return name in self.file(file).get(kind, {})
+        return name in self.merged()[kind]
+
+    def has_function(self, name, file=None):
+        return self.has("functions", name, file)
+
+    def has_class(self, name, file=None):
+        return self.has("classes", name, file)
+
+    def has_method(self, cls, method, file=None):
+        return self.has("methods", f"{cls}.{method}", file)
+
+    def has_require(self, module, file=None):
+        return self.has("requires", module, file)
+
+    def has_new(self, cls, file=None):
+        return self.has("news", cls, file)
+
+    def has_string(self, value, file=None):
+        return self.has("strings", value, file)
+
+
+_indexes = {}
+
+
+def symbol_index(root=TELEGRAM_BOT_DIR, pattern="*.js"):
+    """The shared, up-to-date SymbolIndex of `root`"""
+    key = (str(Path(root).resolve()), pattern)
+    if key not in _indexes:
+        _indexes[key] = SymbolIndex(root, pattern)
+    return _indexes[key].refresh()
@@ -0,0 +1,216 @@
+"""
+JS Syntax Checks
+``node --check`` for the telegram-bot sources through one long-lived node process, cached per file content
+
+The first check in a process starts ``node syntax_server.js``. That server
+compiles each source with ``vm.compileFunction`` inside the CommonJS module
+wrapper, as ``node --check`` does, and reports the same error text. Later checks
+reuse the process. ES modules are the exception. These are ``.mjs`` files, and
+sources with a line that starts with ``import``/``export``. The CommonJS wrapper
+would reject them, so each one gets its own ``node --check`` run. Results persist in ``.verification-cache/syntax``, keyed by the
+file's SHA-256 and by the node binary. A file that has not changed is never
+handed to node again, in this run or the next.
+
+The runner calls ``prewarm()`` before starting the suites, so one node process
+checks every changed file once per run. The suites then only read cached results:
+
+    result = check_syntax(bot_js_path)
+    result.ok, result.error
+
+Like ``subprocess.run(["node", "-c", ...])``, a missing node raises
+FileNotFoundError and a stuck one raises subprocess.TimeoutExpired.
+"""
+
+import os
+import re
+import sys
+import json
+import atexit
+import select
+import shutil
+import hashlib
+import threading
+import subprocess
+from collections import namedtuple
+from pathlib import Path
+
+from verification.cache import ContentCache
+from verification.corpus import corpus
+from verification.symbols import TELEGRAM_BOT_DIR
+
+VERSION = 2
+SERVER_SCRIPT = Path(__file__).resolve().parent / "syntax_server.js"
+CHECK_TIMEOUT_S = 10
+
+SyntaxResult = namedtuple("SyntaxResult", "ok error")
+
+# Static import/export statements; a false positive only costs a node --check run
+_MODULE_SYNTAX = re.compile(r"^\s*(?:import\s*[\w{*'\"]|export\s)", re.MULTILINE)
+
+
+def _node():
+    """(path, fingerprint) of the node binary; FileNotFoundError if there is none"""
+    executable = shutil.which("node")
+    if executable is None:
+        raise FileNotFoundError("node: command not found")
+    executable = os.path.realpath(executable)
+    stat = os.stat(executable)
+    identity = f"{executable}:{stat.st_mtime_ns}:{stat.st_size}".encode()
+    return executable, hashlib.sha256(identity).hexdigest()[:12]
+
+
+def _is_module(path, text):
+    """Whether node would check `path` as an ES module rather than CommonJS"""
+    return Path(path).suffix == ".mjs" or (Path(path).suffix != ".cjs" and _MODULE_SYNTAX.search(text) is not None)
+
+
+def _error_text(output):
+    """node's syntax error report: location, source line, caret, message; no stack or version trailer"""
+    lines = output.splitlines()
+    end = next((index for index, line in enumerate(lines) if line.startswith("    at ")), len(lines))
+    return "\n".join(lines[:end]).strip()
+
+
+def _node_check(executable, path, timeout):
+    """SyntaxResult of ``node --check path``, for sources the CommonJS server cannot judge"""
+    completed = subprocess.run([executable, "--check", str(path)], capture_output=True, text=True, timeout=timeout)
+    if completed.returncode == 0:
+        return SyntaxResult(True, None)
+    return SyntaxResult(False, _error_text(completed.stderr))
+
+
+class SyntaxServer:
+    def __init__(self, executable):
+        self.command = [executable, str(SERVER_SCRIPT)]
+        self.process = subprocess.Popen(
+            self.command,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+        )
+        self.requests = 0
+        self._buffer = b""
+
+    def _readline(self, timeout):
+        # Read the pipe directly: a buffered reader could hold replies that select() cannot see
+        fd = self.process.stdout.fileno()
+        while b"\n" not in self._buffer:
+            ready, _, _ = select.select([fd], [], [], timeout)
+            chunk = os.read(fd, 64 * 1024) if ready else b""
+            if not chunk:
+                self.close()
+                raise subprocess.TimeoutExpired(self.command, timeout)
+            self._buffer += chunk
+        line, self._buffer = self._buffer.split(b"\n", 1)
+        return line
+
+    def _write(self, requests):
+        try:
+            for request in requests:
+                self.process.stdin.write(json.dumps(request).encode() + b"\n")
+            self.process.stdin.flush()
+        except (OSError, ValueError):
+            pass  # the server died or was closed; the reader reports it
+
+    def check(self, sources, timeout):
+        """{filename: SyntaxResult} for {filename: source}, answered in one round trip"""
+        ids, requests = {}, []
+        for filename, source in sources.items():
+            self.requests += 1
+            ids[self.requests] = filename
+            requests.append({"id": self.requests, "filename": filename, "source": source})
+
+        # Write from a thread while reading here: with both pipes full, writing every request first would deadlock
+        writer = threading.Thread(target=self._write, args=(requests,), daemon=True)
+        writer.start()
+        try:
+            results = {}
+            while len(results) < len(ids):
+                response = json.loads(self._readline(timeout))
+                results[ids[response["id"]]] = SyntaxResult(response["ok"], response["error"])
+        finally:
+            writer.join(timeout)
+        return results
+
+    def alive(self):
+        return self.process.poll() is None
+
+    def close(self):
+        if self.process.poll() is None:
+            try:
+                self.process.stdin.close()
+                self.process.wait(timeout=1)
+            except (OSError, subprocess.TimeoutExpired):
+                self.process.kill()
+                self.process.wait()
+
+
+class SyntaxChecker:
+    def __init__(self):
+        self._server = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.checks = 0
+        atexit.register(self.close)
+
+    def check(self, paths, timeout=CHECK_TIMEOUT_S):
+        """{path: SyntaxResult} for `paths`; only files whose content is not cached go to node"""
+        executable, node = _node()
+        cache = ContentCache("syntax", f"{VERSION}-{node}")
+        results, pending = {}, {}
+        for path in paths:
+            source = corpus.get(path)
+            cached = cache.get(source.digest)
+            if cached is not None:
+                results[path] = SyntaxResult(cached["ok"], cached["error"])
+                self.hits += 1
+            else:
+                pending[path] = source
+
+        modules = {path for path, source in pending.items() if _is_module(source.path, source.text)}
+        scripts = {source.path: source.text for path, source in pending.items() if path not in modules}
+        checked = {}
+        if scripts:
+            with self._lock:
+                if self._server is None or not self._server.alive():
+                    self._server = SyntaxServer(executable)
+                checked = self._server.check(scripts, timeout)
+        for path in modules:
+            checked[pending[path].path] = _node_check(executable, pending[path].path, timeout)
+        for path, source in pending.items():
+            results[path] = checked[source.path]
+            cache.put(source.digest, results[path]._asdict())
+        self.checks += len(pending)
+        return results
+
+    def close(self):
+        if self._server is not None:
+            self._server.close()
+            self._server = None
+
+    def stats(self):
+        return {"hits": self.hits, "checks": self.checks}
+
+
+checker = SyntaxChecker()
+
+
+def check_syntax(path, timeout=CHECK_TIMEOUT_S):
+    """SyntaxResult of one JS file, as ``node --check`` would judge it"""
+    return checker.check([path], timeout)[path]
+
+
+def prewarm(root=TELEGRAM_BOT_DIR, pattern="*.js", timeout=CHECK_TIMEOUT_S):
+    """Check every `pattern` file under `root` so later checks are cache hits; {path: SyntaxResult}"""
+    return checker.check(sorted(Path(root).glob(pattern)), timeout)
+
+
+def main():
+    failed = {path: result for path, result in prewarm().items() if not result.ok}
+    for path, result in failed.items():
+        print(f"❌ {path}\n{result.error}\n")
+    print(f"{'❌' if failed else '✅'} Syntax-checked telegram-bot/*.js: {checker.stats()}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,34 @@
+// Syntax-checks CommonJS sources for verification/syntax.py, the way `node --check` does.
+// ES modules are checked with `node --check` itself; the module wrapper here is CommonJS only.
+// Reads one JSON request per line on stdin: {"id", "filename", "source"}
+// Writes one JSON response per line on stdout: {"id", "ok", "error"}
+'use strict';
+
+const vm = require('vm');
+const readline = require('readline');
+
+const WRAPPER_PARAMS = ['exports', 'require', 'module', '__filename', '__dirname'];
+
+function check(filename, source) {
+    // A hashbang is only valid at the very start of a script, not inside the module wrapper
+    if (source.startsWith('#!')) {
+        source = '//' + source.slice(2);
+    }
+    try {
+        vm.compileFunction(source, WRAPPER_PARAMS, { filename });
+        return { ok: true, error: null };
+    } catch (error) {
+        if (!(error instanceof SyntaxError)) {
+            throw error;
+        }
+        // Same text `node --check` prints: location, source line, caret, message
+        const lines = String(error.stack).split('\n');
+        const end = lines.findIndex((line) => line.startsWith('    at '));
+        return { ok: false, error: (end === -1 ? lines : lines.slice(0, end)).join('\n').trim() };
+    }
+}
+
+readline.createInterface({ input: process.stdin }).on('line', (line) => {
+    const request = JSON.parse(line);
+    process.stdout.write(JSON.stringify({ id: request.id, ...check(request.filename, request.source) }) + '\n');
+});
@@ -0,0 +1,179 @@
+"""
+Verification Watch
+Filesystem change notifications for ``python -m verification --watch``
+
+On Linux, directories are watched with inotify through ctypes, so a save is seen
+as soon as the editor closes the file. Anywhere else, or if inotify is
+unavailable, the trees are polled every POLL_INTERVAL_S seconds. Either way,
+``changes()`` yields one set of changed paths per burst of events. A burst ends
+after DEBOUNCE_S seconds without a new event, or MAX_BURST_S after it began. An
+editor's write-rename-chmod sequence is therefore one change, not three.
+
+Subdirectories are watched too, except dependency, cache and VCS directories.
+Editor swap and backup files are ignored.
+"""
+
+import os
+import time
+import errno
+import select
+import struct
+import ctypes
+import ctypes.util
+
+DEBOUNCE_S = 0.05
+MAX_BURST_S = 0.5
+POLL_INTERVAL_S = 0.25
+IGNORED_DIRS = {"node_modules", "__pycache__", ".git", ".verification-cache", ".pytest_cache"}
+IGNORED_SUFFIXES = (".swp", ".swx", ".swo", "~", ".tmp", ".pyc")
+
+# <sys/inotify.h>
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+IN_CLOEXEC = 0o2000000
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_DELETE_SELF
+_EVENT = struct.Struct("iIII")
+
+
+def _ignored(name):
+    return name.endswith(IGNORED_SUFFIXES) or name.startswith(".#") or name == "4913"  # vim's write probe
+
+
+def _directories(root):
+    """`root` and every directory under it that is watched"""
+    for directory, subdirectories, _ in os.walk(root):
+        subdirectories[:] = [name for name in subdirectories if name not in IGNORED_DIRS]
+        yield directory
+
+
+class InotifyWatcher:
+    def __init__(self, roots):
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self._add_watch = libc.inotify_add_watch
+        self._add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        self.fd = libc.inotify_init1(IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), os.strerror(ctypes.get_errno()))
+        self.directories = {}  # watch descriptor -> directory
+        try:
+            for root in roots:
+                for directory in _directories(root):
+                    self.watch(directory)
+        except OSError:
+            self.close()
+            raise
+
+    def watch(self, directory):
+        descriptor = self._add_watch(self.fd, os.fsencode(directory), WATCH_MASK)
+        if descriptor < 0:
+            error = ctypes.get_errno()
+            if error == errno.ENOSPC:
+                raise OSError(error, "inotify watch limit reached (fs.inotify.max_user_watches)")
+            return  # removed before we got to it
+        self.directories[descriptor] = directory
+
+    def read(self, timeout=None):
+        """Paths changed within `timeout` seconds (None waits for the first change), empty if none"""
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return set()
+        data = os.read(self.fd, 64 * 1024)
+        changed, offset = set(), 0
+        while offset < len(data):
+            descriptor, mask, _, length = _EVENT.unpack_from(data, offset)
+            offset += _EVENT.size
+            name = os.fsdecode(data[offset:offset + length].rstrip(b"\0"))
+            offset += length
+            directory = self.directories.get(descriptor)
+            if mask & IN_IGNORED:
+                self.directories.pop(descriptor, None)
+                continue
+            if directory is None or (name and _ignored(name)):
+                continue
+            path = os.path.join(directory, name) if name else directory
+            if mask & IN_ISDIR:
+                if name in IGNORED_DIRS:
+                    continue
+                if mask & (IN_CREATE | IN_MOVED_TO):
+                    for subdirectory in _directories(path):
+                        self.watch(subdirectory)
+            changed.add(path)
+        return changed
+
+    def close(self):
+        os.close(self.fd)
+
+
+class PollingWatcher:
+    def __init__(self, roots):
+        self.roots = list(roots)
+        self.snapshot = self.scan()
+
+    def scan(self):
+        snapshot = {}
+        for root in self.roots:
+            for directory in _directories(root):
+                try:
+                    entries = list(os.scandir(directory))
+                except OSError:
+                    continue
+                for entry in entries:
+                    if entry.is_file(follow_symlinks=False) and not _ignored(entry.name):
+                        try:
+                            stat = entry.stat(follow_symlinks=False)
+                        except OSError:
+                            continue
+                        snapshot[entry.path] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+    def read(self, timeout=None):
+        """Paths changed within `timeout` seconds (None waits for the first change), empty if none"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            current = self.scan()
+            changed = {path for path in current.keys() | self.snapshot.keys() if current.get(path) != self.snapshot.get(path)}
+            self.snapshot = current
+            if changed:
+                return changed
+            if deadline is not None and time.monotonic() >= deadline:
+                return set()
+            time.sleep(POLL_INTERVAL_S if deadline is None else max(0.0, min(POLL_INTERVAL_S, deadline - time.monotonic())))
+
+    def close(self):
+        pass
+
+
+def watcher(roots):
+    """An InotifyWatcher for `roots` where inotify works, a PollingWatcher otherwise"""
+    roots = [str(root) for root in roots if os.path.isdir(root)]
+    try:
+        return InotifyWatcher(roots)
+    except (OSError, AttributeError):
+        return PollingWatcher(roots)
+
+
+def changes(roots, debounce=DEBOUNCE_S, max_burst=MAX_BURST_S):
+    """Yield the set of paths changed in each debounced burst of events under `roots`, forever"""
+    source = watcher(roots)
+    try:
+        while True:
+            changed = source.read()
+            started = time.monotonic()
+            while True:
+                remaining = max_burst - (time.monotonic() - started)
+                if remaining <= 0:
+                    break
+                more = source.read(min(debounce, remaining))
+                if not more:
+                    break
+                changed |= more
+            if changed:
+                yield changed
+    finally:
+        source.close()
@@ -0,0 +1,40 @@
+"""
+Verification Worker
+Runs one suite script as ``__main__`` while recording its inputs for verification.incremental
+
+The suite sees the same ``__file__``, ``sys.argv[0]`` and exit code as when it is
+run directly. Its record is written to ``--record`` when it exits, whether it
+passes, fails or raises.
+
+Usage:
+    python -m verification.worker --record /tmp/backend_test.record.json backend_test.py
+"""
+
+import sys
+import json
+import runpy
+import argparse
+
+from verification.incremental import InputRecorder
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m verification.worker", description="Run a verification suite and record its inputs")
+    parser.add_argument("--record", required=True, help="where to write the suite's inputs as JSON")
+    parser.add_argument("script", help="suite script to run")
+    args = parser.parse_args(argv)
+
+    sys.argv = [args.script]
+    recorder = InputRecorder().install()
+    try:
+        runpy.run_path(args.script, run_name="__main__")
+    finally:
+        recorder.uninstall()
+        sys.stdout.flush()
+        with open(args.record, "w") as f:
+            json.dump(recorder.record(args.script), f)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
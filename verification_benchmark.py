@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Verification Benchmarks
+Measuring the shared matching engines of the verification suites against the per-check scans they replace
+"""
+
+import re
+import ast
+import sys
+import json
+import time
+import random
+import argparse
+from pathlib import Path
+
+from verification.corpus import read_source
+from verification.callgraph import call_graph, index_calls
+from verification.regexset import RegexIndex, RegexSet
+
+REPO_ROOT = Path(__file__).parent
+TELEGRAM_BOT_DIR = REPO_ROOT / "telegram-bot"
+
+
+def suite_pattern_sets(suites):
+    """(suite, patterns, flags) for every search_patterns(content, <list>, [flags]) check in the given suites"""
+    sets = []
+    for suite in suites:
+        tree = ast.parse((REPO_ROOT / f"{suite}.py").read_text())
+        for function in (node for node in ast.walk(tree) if isinstance(node, ast.FunctionDef)):
+            lists = {
+                node.targets[0].id: [element.value for element in node.value.elts]
+                for node in ast.walk(function)
+                if isinstance(node, ast.Assign) and isinstance(node.targets[0], ast.Name) and isinstance(node.value, ast.List)
+                and all(isinstance(element, ast.Constant) and isinstance(element.value, str) for element in node.value.elts)
+            }
+            for call in ast.walk(function):
+                if isinstance(call, ast.Call) and getattr(call.func, "id", None) == "search_patterns" \
+                        and isinstance(call.args[1], ast.Name) and call.args[1].id in lists:
+                    flags = getattr(re, call.args[2].attr) if len(call.args) > 2 else 0
+                    sets.append((suite, lists[call.args[1].id], flags))
+    return sets
+
+
+def best_ms(fn, repeat):
+    """Best-of-`repeat` wall time of fn() in ms, with its last result"""
+    times = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn()
+        times.append((time.perf_counter() - started) * 1000)
+    return min(times), result
+
+
+class VerificationBenchmark:
+    def __init__(self, results_file):
+        self.results_file = Path(results_file)
+        self.results = {}
+
+    def record(self, name, result):
+        self.results[name] = result
+
+    def bench_regexset(self, suites, file, repeat):
+        """One re.search per pattern (the old checks) vs one named-group alternation per list vs a RegexSet, cold and cached"""
+        print("\n🧩 BENCHMARKING REGEX SETS...")
+        text = read_source(TELEGRAM_BOT_DIR / file)
+        sets = suite_pattern_sets(suites)
+        print(f"   {len(sets)} pattern lists ({sum(len(patterns) for _, patterns, _ in sets)} patterns)"
+              f" from {', '.join(suites)} on {file}, best of {repeat}")
+
+        def per_pattern():
+            return [[re.search(pattern, text, flags) is not None for pattern in patterns] for _, patterns, flags in sets]
+
+        def alternation():
+            found = []
+            for _, patterns, flags in sets:
+                combined = re.compile("|".join(f"(?P<_{i}>{pattern})" for i, pattern in enumerate(patterns)), flags)
+                seen = {int(match.lastgroup[1:]) for match in combined.finditer(text)}
+                # Unseen patterns may be hidden behind another alternative's match and need their own search
+                found.append([i in seen or re.search(pattern, text, flags) is not None for i, pattern in enumerate(patterns)])
+            return found
+
+        def regex_sets():
+            return [[result[pattern] for pattern in patterns] for result, (_, patterns, _) in
+                    ((regex_set.search(text), entry) for regex_set, entry in zip(compiled, sets))]
+
+        per_pattern_ms, expected = best_ms(per_pattern, repeat)
+        alternation_ms, alternated = best_ms(alternation, repeat)
+        compile_ms, compiled = best_ms(lambda: [RegexSet(patterns, flags) for _, patterns, flags in sets], repeat)
+        scan_ms, scanned = best_ms(regex_sets, repeat)
+
+        index = RegexIndex()
+        for _, patterns, flags in sets:
+            index.search(text, patterns, flags)
+        cached_ms, cached = best_ms(lambda: [[pattern in index.search(text, patterns, flags) for pattern in patterns]
+                                             for _, patterns, flags in sets], repeat)
+        if not expected == alternated == scanned == cached:
+            raise AssertionError("regex set disagrees with per-pattern re.search")
+
+        report = {
+            "file": file,
+            "chars": len(text),
+            "pattern_lists": len(sets),
+            "patterns": sum(len(patterns) for _, patterns, _ in sets),
+            "per_pattern_search_ms": round(per_pattern_ms, 3),
+            "alternation_ms": round(alternation_ms, 3),
+            "regex_set_compile_ms": round(compile_ms, 3),
+            "regex_set_search_ms": round(scan_ms, 3),
+            "cached_lookup_ms": round(cached_ms, 3),
+        }
+        print(f"   per-pattern re.search {per_pattern_ms:>8.2f} ms | alternation {alternation_ms:>8.2f} ms"
+              f" | regex set compile {compile_ms:>6.2f} ms  search {scan_ms:>6.2f} ms  cached {cached_ms:>6.3f} ms")
+        self.record("regexset", report)
+        return report
+
+    def bench_callgraph(self, entry, targets, repeat, seed):
+        """DOTALL `anchor.*?callee(` regexes (the old relationship checks) vs call-graph reachability queries"""
+        print("\n🕸️ BENCHMARKING CALL GRAPH...")
+        text = read_source(TELEGRAM_BOT_DIR / entry)
+        graph = call_graph(entry)
+        anchors = {}
+        for node in graph.nodes:
+            kind, _, name = node.partition(":")
+            if kind == "onText":
+                anchors[node] = r"\.onText\(/" + re.escape(name.replace("/", "\\/")) + "/"
+            elif kind == "on":
+                anchors[node] = r"\.on\(['\"]" + re.escape(name) + "['\"]"
+            elif kind == "callback":
+                literal = re.escape(name.rstrip("*"))
+                anchors[node] = rf"data\.startsWith\(['\"]{literal}['\"]\)" if name.endswith("*") else rf"data === ['\"]{literal}['\"]"
+        functions = sorted(node for node in graph.nodes if node.split(":")[0] not in ("onText", "on", "callback") and not node.startswith("<"))
+        functions = random.Random(seed).sample(functions, min(targets, len(functions)))
+        queries = [(source, target) for source in anchors for target in functions]
+        print(f"   {len(anchors)} handlers x {len(functions)} functions = {len(queries)} queries on {entry}, best of {repeat}")
+
+        def callee(target):
+            return re.escape(target.rpartition(".")[2]) + r"\("
+
+        def dotall():
+            return [re.search(anchors[source] + ".*?" + callee(target), text, re.DOTALL) is not None for source, target in queries]
+
+        def cold_graph():
+            data = index_calls(text)
+            return data, call_graph(entry)
+
+        def reachability():
+            return [graph.reaches(source, target) for source, target in queries]
+
+        dotall_ms, matched = best_ms(dotall, 1)
+        build_ms, _ = best_ms(cold_graph, repeat)
+        graph._reachable.clear()
+        first_ms, reached = best_ms(reachability, 1)
+        cached_ms, _ = best_ms(reachability, repeat)
+
+        report = {
+            "entry": entry,
+            "chars": len(text),
+            "nodes": len(graph.nodes),
+            "edges": sum(len(callees) for callees in graph.edges.values()),
+            "queries": len(queries),
+            "dotall_regex_ms": round(dotall_ms, 3),
+            "index_calls_ms": round(build_ms, 3),
+            "first_query_pass_ms": round(first_ms, 3),
+            "cached_query_pass_ms": round(cached_ms, 3),
+            "regex_true": sum(matched),
+            "graph_true": sum(reached),
+            # The regex runs from the anchor to anywhere later in the file, so it also "finds" calls in later handlers
+            "regex_only": sum(1 for regex, edge in zip(matched, reached) if regex and not edge),
+            "graph_only": sum(1 for regex, edge in zip(matched, reached) if edge and not regex),
+        }
+        print(f"   DOTALL regex {dotall_ms:>9.2f} ms | index {build_ms:>6.2f} ms"
+              f"  first pass {first_ms:>6.2f} ms  cached {cached_ms:>6.3f} ms")
+        print(f"   reachable: regex {report['regex_true']}, graph {report['graph_true']}"
+              f" (regex only {report['regex_only']}, graph only {report['graph_only']})")
+        self.record("callgraph", report)
+        return report
+
+    def save(self):
+        self.results["timestamp"] = time.strftime("%Y-%m-%d %H:%M:%S")
+        with open(self.results_file, "w") as f:
+            json.dump(self.results, f, indent=2)
+        print(f"\n💾 Results saved to: {self.results_file}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the verification matching engines")
+    parser.add_argument("--output", default="/app/verification_benchmark_results.json")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    subparsers = parser.add_subparsers(dest="benchmark", required=True)
+
+    regexset = subparsers.add_parser("regexset", help="combined regex-set scan vs one re.search per pattern")
+    regexset.add_argument("--suites", nargs="+", default=["review_request_test", "review_request_backend_test"])
+    regexset.add_argument("--file", default="bot.js")
+
+    callgraph = subparsers.add_parser("callgraph", help="call-graph reachability vs DOTALL handler-to-callee regexes")
+    callgraph.add_argument("--entry", default="bot.js")
+    callgraph.add_argument("--targets", type=int, default=40)
+
+    args = parser.parse_args()
+    benchmark = VerificationBenchmark(args.output)
+
+    print("🚀 BENCHMARKING VERIFICATION ENGINES...")
+    print("=" * 40)
+    if args.benchmark == "regexset":
+        benchmark.bench_regexset(args.suites, args.file, args.repeat)
+    elif args.benchmark == "callgraph":
+        benchmark.bench_callgraph(args.entry, args.targets, args.repeat, args.seed)
+
+    benchmark.save()
+    return True
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)